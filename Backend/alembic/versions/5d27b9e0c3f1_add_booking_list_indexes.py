@@ -0,0 +1,30 @@
+"""add booking list indexes
+
+Revision ID: 5d27b9e0c3f1
+Revises: c4e81f2d7a90
+Create Date: 2026-10-17 15:02:44.118093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d27b9e0c3f1'
+down_revision: Union[str, Sequence[str], None] = 'c4e81f2d7a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_bookings_customer_date_start', 'bookings', ['customer_id', 'booking_date', 'start_time', 'id'], unique=False)
+    op.create_index('ix_bookings_court_date_start', 'bookings', ['court_id', 'booking_date', 'start_time', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_bookings_court_date_start', table_name='bookings')
+    op.drop_index('ix_bookings_customer_date_start', table_name='bookings')
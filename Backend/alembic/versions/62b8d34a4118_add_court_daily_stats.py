@@ -0,0 +1,55 @@
+"""add court daily stats rollup
+
+Revision ID: 62b8d34a4118
+Revises: 11804d708e18
+Create Date: 2026-10-17 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '62b8d34a4118'
+down_revision: Union[str, Sequence[str], None] = '11804d708e18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Existing bookings are not copied here; run scripts/backfill_daily_stats.py
+    once after upgrading.
+    """
+    op.create_table('court_daily_stats',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('court_id', sa.Integer(), nullable=False),
+    sa.Column('stat_date', sa.Date(), nullable=False),
+    sa.Column('pending_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('confirmed_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('completed_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('cancelled_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('pending_revenue', sa.Float(), server_default='0', nullable=False),
+    sa.Column('confirmed_revenue', sa.Float(), server_default='0', nullable=False),
+    sa.Column('completed_revenue', sa.Float(), server_default='0', nullable=False),
+    sa.Column('paid_revenue', sa.Float(), server_default='0', nullable=False),
+    sa.Column('booked_hours', sa.Float(), server_default='0', nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['court_id'], ['courts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('court_id', 'stat_date', name='uq_court_daily_stats_court_date')
+    )
+    op.create_index(op.f('ix_court_daily_stats_court_id'), 'court_daily_stats', ['court_id'], unique=False)
+    op.create_index(op.f('ix_court_daily_stats_id'), 'court_daily_stats', ['id'], unique=False)
+    op.create_index(op.f('ix_court_daily_stats_stat_date'), 'court_daily_stats', ['stat_date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_court_daily_stats_stat_date'), table_name='court_daily_stats')
+    op.drop_index(op.f('ix_court_daily_stats_id'), table_name='court_daily_stats')
+    op.drop_index(op.f('ix_court_daily_stats_court_id'), table_name='court_daily_stats')
+    op.drop_table('court_daily_stats')
@@ -0,0 +1,43 @@
+"""exclude overlapping active bookings
+
+Revision ID: a13d71975b42
+Revises: 62b8d34a4118
+Create Date: 2026-10-17 11:03:27.554190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a13d71975b42'
+down_revision: Union[str, Sequence[str], None] = '62b8d34a4118'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Fails if overlapping pending/confirmed bookings already exist for a
+    court; cancel the duplicates before upgrading.
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute(
+        """
+        ALTER TABLE bookings
+        ADD CONSTRAINT ex_bookings_court_time_overlap
+        EXCLUDE USING gist (
+            court_id WITH =,
+            tsrange(booking_date + start_time, booking_date + end_time, '[)') WITH &&
+        )
+        WHERE (status IN ('pending', 'confirmed'))
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE bookings DROP CONSTRAINT IF EXISTS ex_bookings_court_time_overlap")
@@ -0,0 +1,28 @@
+"""add user token version
+
+Revision ID: c4e81f2d7a90
+Revises: a13d71975b42
+Create Date: 2026-10-17 14:20:08.731562
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e81f2d7a90'
+down_revision: Union[str, Sequence[str], None] = 'a13d71975b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'token_version')
@@ -0,0 +1,111 @@
+"""add trigram search indexes and court sport key
+
+Revision ID: e8f3a6c1b254
+Revises: 5d27b9e0c3f1
+Create Date: 2026-10-17 15:48:19.402771
+
+"""
+import re
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8f3a6c1b254'
+down_revision: Union[str, Sequence[str], None] = '5d27b9e0c3f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Frozen copy of shared.utils.sport_taxonomy as of this revision (compacted
+# spelling -> sport key), so later taxonomy edits do not change this backfill
+SPORT_ALIASES = {
+    'futsal': 'futsal',
+    'indoorfootball': 'futsal',
+    'indoorsoccer': 'futsal',
+    '5aside': 'futsal',
+    'fiveaside': 'futsal',
+    '6aside': 'futsal',
+    'sixaside': 'futsal',
+    'football': 'football',
+    'soccer': 'football',
+    'cricket': 'cricket',
+    'indoorcricket': 'cricket',
+    'boxcricket': 'cricket',
+    'netcricket': 'cricket',
+    'padel': 'padel',
+    'paddle': 'padel',
+    'padeltennis': 'padel',
+    'tennis': 'tennis',
+    'lawntennis': 'tennis',
+    'tabletennis': 'table_tennis',
+    'pingpong': 'table_tennis',
+    'tt': 'table_tennis',
+    'badminton': 'badminton',
+    'squash': 'squash',
+    'basketball': 'basketball',
+    'volleyball': 'volleyball',
+    'pickleball': 'pickleball',
+}
+
+
+# Words dropped from sport types that do not name a known sport
+FILLER_WORDS = frozenset({
+    'arena', 'court', 'courts', 'field', 'fields', 'ground', 'grounds', 'hall',
+    'indoor', 'net', 'nets', 'outdoor', 'pitch', 'pitches',
+})
+MAX_ALIAS_WORDS = 3
+
+
+def normalize_sport(value: Optional[str]) -> Optional[str]:
+    """Sport key for a sport type, as normalize_sport computed it at this revision"""
+    if not value:
+        return None
+    compact = re.sub(r"[^a-z0-9]", "", value.lower())
+    if compact in SPORT_ALIASES:
+        return SPORT_ALIASES[compact]
+
+    # A known alias among the words, preferring more words, then more letters
+    words = re.findall(r"[a-z0-9]+", value.lower())
+    best = None
+    for size in range(1, MAX_ALIAS_WORDS + 1):
+        for start in range(len(words) - size + 1):
+            run = "".join(words[start:start + size])
+            if run in SPORT_ALIASES and (best is None or (size, len(run)) > best[0]):
+                best = ((size, len(run)), SPORT_ALIASES[run])
+    if best:
+        return best[1]
+    return "".join(word for word in words if word not in FILLER_WORDS) or compact or None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Existing courts get their sport_key from the taxonomy frozen above.
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column('courts', sa.Column('sport_key', sa.String(length=50), nullable=True))
+    conn = op.get_bind()
+    sport_types = conn.execute(sa.text("SELECT DISTINCT sport_type FROM courts")).scalars().all()
+    for sport_type in sport_types:
+        conn.execute(
+            sa.text("UPDATE courts SET sport_key = :sport_key WHERE sport_type = :sport_type"),
+            {"sport_key": normalize_sport(sport_type), "sport_type": sport_type}
+        )
+    op.create_index(op.f('ix_courts_sport_key'), 'courts', ['sport_key'], unique=False)
+
+    op.create_index('ix_properties_name_trgm', 'properties', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_properties_city_trgm', 'properties', ['city'], unique=False, postgresql_using='gin', postgresql_ops={'city': 'gin_trgm_ops'})
+    op.create_index('ix_courts_sport_type_trgm', 'courts', ['sport_type'], unique=False, postgresql_using='gin', postgresql_ops={'sport_type': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_courts_sport_type_trgm', table_name='courts')
+    op.drop_index('ix_properties_city_trgm', table_name='properties')
+    op.drop_index('ix_properties_name_trgm', table_name='properties')
+    op.drop_index(op.f('ix_courts_sport_key'), table_name='courts')
+    op.drop_column('courts', 'sport_key')
@@ -0,0 +1,23 @@
+"""Index chats by user and last message for the chat list
+
+Revision ID: 002_chat_list_index
+Revises: 001_initial_schema
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '002_chat_list_index'
+down_revision = '001_initial_schema'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Serves GET /api/chat/list: newest chats of a user, paged by (last_message_at, id)
+    op.create_index('idx_user_last_message', 'chats', ['user_id', 'last_message_at', 'id'], unique=False, postgresql_using='btree')
+
+
+def downgrade():
+    op.drop_index('idx_user_last_message', table_name='chats', postgresql_using='btree')
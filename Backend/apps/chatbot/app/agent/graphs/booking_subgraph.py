@@ -12,7 +12,7 @@ routing logic to support:
 Requirements: 6.3, 6.8, 22.1-22.6
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import logging
 
 from langgraph.graph import StateGraph, END
@@ -30,7 +30,10 @@ from app.agent.nodes.booking import (
 logger = logging.getLogger(__name__)
 
 
-def create_booking_subgraph(tools: Dict[str, Any]) -> StateGraph:
+def create_booking_subgraph(
+    tools: Dict[str, Any],
+    llm_provider: Optional[Any] = None
+) -> StateGraph:
     """
     Create the booking flow subgraph.
     
@@ -62,6 +65,7 @@ def create_booking_subgraph(tools: Dict[str, Any]) -> StateGraph:
     
     Args:
         tools: Tool registry containing all agent tools
+        llm_provider: LLMProvider used by nodes that parse selections with the LLM
         
     Returns:
         Compiled StateGraph ready for execution
@@ -86,22 +90,22 @@ def create_booking_subgraph(tools: Dict[str, Any]) -> StateGraph:
     
     # Add all booking nodes with proper async wrappers
     async def select_property_node(state):
-        return await select_property(state, tools)
+        return _track_booking_turn(await select_property(state, tools))
     
     async def select_service_node(state):
-        return await select_service(state, tools)
+        return _track_booking_turn(await select_service(state, llm_provider, tools))
     
     async def select_date_node(state):
-        return await select_date(state, tools)
+        return _track_booking_turn(await select_date(state, llm_provider, tools))
     
     async def select_time_node(state):
-        return await select_time(state, tools)
+        return _track_booking_turn(await select_time(state, llm_provider, tools))
     
     async def confirm_booking_node(state):
-        return await confirm_booking(state, tools)
+        return _track_booking_turn(await confirm_booking(state, llm_provider, tools))
     
     async def create_booking_node(state):
-        return await create_booking(state, tools)
+        return _track_booking_turn(await create_booking(state, tools))
     
     graph.add_node("select_property", select_property_node)
     graph.add_node("select_service", select_service_node)
@@ -178,6 +182,20 @@ def create_booking_subgraph(tools: Dict[str, Any]) -> StateGraph:
     return graph.compile()
 
 
+def _track_booking_turn(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Record the booking flow as the last node that handled the turn.
+    
+    The intent fast path only sends short replies ("2", "yes", "7pm") to a
+    waiting booking step when the booking flow asked last, so this clears
+    the "information" marker left by a question asked mid-booking.
+    """
+    flow_state = result.get("flow_state")
+    if flow_state is not None:
+        flow_state["last_node"] = "booking"
+    return result
+
+
 def route_property_selection(state: ConversationState) -> str:
     """
     Route based on property selection.
@@ -5,11 +5,17 @@ Flow:
 START → load_chat → intent_detection → [handler] → END
 
 Handlers: greeting, information, booking
+
+The graph is compiled once per process. Request-scoped dependencies
+(ChatService, MessageService) are not captured at compile time; they are
+passed per invocation through config["configurable"] and read by the
+nodes that need them.
 """
 
 from typing import Dict, Any
 import logging
 
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
 
 from app.agent.state.conversation_state import ConversationState
@@ -25,9 +31,7 @@ logger = logging.getLogger(__name__)
 
 def create_main_graph(
     llm_provider: Any,
-    tools: Dict[str, Any],
-    chat_service: Any = None,
-    message_service: Any = None
+    tools: Dict[str, Any]
 ) -> StateGraph:
     """
     Create the conversation flow graph.
@@ -43,15 +47,27 @@ def create_main_graph(
     LLM decides: "greeting" or "information" or "booking"
       ↓
     Route to that handler → END
+    
+    Per-request services are supplied at invoke time:
+    
+        await graph.ainvoke(state, config={"configurable": {
+            "chat_service": chat_service,
+            "message_service": message_service,
+        }})
     """
     logger.info("Creating main graph")
     
     # Create graph
     graph = StateGraph(ConversationState)
     
-    # Add basic nodes (load history) - use async lambda for async functions
-    async def load_chat_wrapper(s):
-        return await load_chat(s, chat_service, message_service)
+    # Add basic nodes (load history) - services come from the run config
+    async def load_chat_wrapper(s, config: RunnableConfig):
+        configurable = config.get("configurable", {})
+        return await load_chat(
+            s,
+            configurable.get("chat_service"),
+            configurable.get("message_service")
+        )
     graph.add_node("load_chat", load_chat_wrapper)
     
     # Add intent detection (asks LLM where to route)
@@ -69,7 +85,7 @@ def create_main_graph(
     graph.add_node("information", information_wrapper)
     
     # Add booking subgraph
-    booking_subgraph = create_booking_subgraph(tools)
+    booking_subgraph = create_booking_subgraph(tools, llm_provider)
     graph.add_node("booking", booking_subgraph)
     
     # Connect nodes in order (start at load_chat)
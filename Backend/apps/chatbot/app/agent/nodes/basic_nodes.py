@@ -5,28 +5,33 @@ One node that runs first:
 1. load_chat - Loads chat history from database
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, TYPE_CHECKING
 import logging
 from datetime import datetime
 
 from app.agent.state.conversation_state import ConversationState
-from app.services.chat_service import ChatService
-from app.services.message_service import MessageService
-from app.repositories.chat_repository import ChatRepository
-from app.repositories.message_repository import MessageRepository
+from app.core.config import settings
+from app.services.history_cache import history_cache, format_message
+
+if TYPE_CHECKING:
+    # Imported for annotations only: the services package imports the graph
+    # runtime, which imports this module.
+    from app.services.chat_service import ChatService
+    from app.services.message_service import MessageService
 
 logger = logging.getLogger(__name__)
 
 
 async def load_chat(
     state: ConversationState,
-    chat_service: ChatService = None,
-    message_service: MessageService = None
+    chat_service: "ChatService" = None,
+    message_service: "MessageService" = None
 ) -> ConversationState:
     """
     Load chat history from database.
     
-    Loads last 20 messages (including current one) and formats for LLM.
+    Loads the last CHAT_HISTORY_WINDOW messages (including the current one)
+    and formats them for the LLM, using the in-process history cache when warm.
     """
     chat_id = state["chat_id"]
     logger.info(f"Loading chat history for {chat_id}")
@@ -36,17 +41,19 @@ async def load_chat(
             from uuid import UUID
             chat_uuid = UUID(chat_id)
             
-            # Get last 20 messages (includes current message saved before graph)
-            messages = await message_service.get_chat_history(chat_id=chat_uuid, limit=20)
+            # Recent turns of an active chat are served from the ring buffer
+            formatted_messages = history_cache.get(chat_uuid, settings.CHAT_HISTORY_WINDOW)
             
-            # Format for LLM (role + content)
-            formatted_messages = []
-            for msg in messages:
-                role = "user" if msg.sender_type == "user" else "assistant"
-                if msg.sender_type == "system":
-                    role = "system"
-                
-                formatted_messages.append({"role": role, "content": msg.content})
+            if formatted_messages is None:
+                # Last N messages (includes current message saved before graph)
+                messages = await message_service.get_chat_history(
+                    chat_id=chat_uuid,
+                    limit=settings.CHAT_HISTORY_WINDOW
+                )
+                formatted_messages = [
+                    format_message(msg.sender_type, msg.content) for msg in messages
+                ]
+                history_cache.prime(chat_uuid, formatted_messages)
             
             state["messages"] = formatted_messages
             logger.info(f"Loaded {len(formatted_messages)} messages")
@@ -871,7 +871,8 @@ async def _find_nearest_available_date(
     Find the nearest date with available time slots.
     
     This function searches for the next available date starting from
-    start_date + 1 day, up to max_days in the future.
+    start_date + 1 day, up to max_days in the future. The whole window is
+    fetched with a single get_available_slots_range call.
     
     Args:
         tools: Tool registry
@@ -883,24 +884,34 @@ async def _find_nearest_available_date(
     Returns:
         Date object for nearest available date, or None if none found
     """
-    current_date = start_date + timedelta(days=1)
-    end_date = start_date + timedelta(days=max_days)
+    get_available_slots_range = tools.get("get_available_slots_range")
+    if not get_available_slots_range:
+        logger.error("get_available_slots_range tool not found in registry")
+        return None
     
-    while current_date <= end_date:
-        slots = await _get_available_time_slots(
-            tools=tools,
-            court_id=court_id,
-            date_obj=current_date,
-            chat_id=chat_id
-        )
+    try:
+        court_id_int = int(court_id) if isinstance(court_id, str) else court_id
         
-        if slots:
+        availability_data = await get_available_slots_range(
+            court_id=court_id_int,
+            start_date=start_date + timedelta(days=1),
+            end_date=start_date + timedelta(days=max_days)
+        )
+    except Exception as e:
+        logger.error(
+            f"Error searching nearest available date for court {court_id} "
+            f"in chat {chat_id}: {e}",
+            exc_info=True
+        )
+        return None
+    
+    for day in (availability_data or {}).get("days", []):
+        if day.get("available_slots"):
+            nearest_date = datetime.strptime(day["date"], "%Y-%m-%d").date()
             logger.info(
-                f"Found nearest available date for court {court_id}: {current_date}"
+                f"Found nearest available date for court {court_id}: {nearest_date}"
             )
-            return current_date
-        
-        current_date += timedelta(days=1)
+            return nearest_date
     
     logger.warning(
         f"No available dates found for court {court_id} "
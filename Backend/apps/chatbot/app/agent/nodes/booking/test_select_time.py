@@ -12,7 +12,7 @@ This module tests the time selection functionality including:
 
 import pytest
 from datetime import datetime, date, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 from app.agent.nodes.booking.select_time import (
     select_time,
@@ -249,24 +249,35 @@ def test_parse_time_selection():
 
 @pytest.mark.asyncio
 async def test_find_nearest_available_date(mock_tools):
-    """Test finding nearest available date."""
+    """Test finding nearest available date with one range lookup."""
     start_date = date(2024, 12, 25)
     
     # Mock slots available on third day
-    async def mock_get_slots(court_id, date_obj, chat_id):
-        if date_obj == date(2024, 12, 28):
-            return [{"start_time": "09:00:00", "end_time": "10:00:00"}]
-        return []
-    
-    with patch('app.agent.nodes.booking.select_time._get_available_time_slots', side_effect=mock_get_slots):
-        result = await _find_nearest_available_date(
-            tools=mock_tools,
-            court_id=10,
-            start_date=start_date,
-            chat_id="test-chat"
-        )
-        
-        assert result == date(2024, 12, 28)
+    mock_tools["get_available_slots_range"] = AsyncMock(return_value={
+        "court_id": 10,
+        "days": [
+            {"date": "2024-12-26", "available_slots": []},
+            {"date": "2024-12-27", "available_slots": []},
+            {"date": "2024-12-28", "available_slots": [
+                {"start_time": "09:00:00", "end_time": "10:00:00"}
+            ]},
+        ]
+    })
+    
+    result = await _find_nearest_available_date(
+        tools=mock_tools,
+        court_id=10,
+        start_date=start_date,
+        chat_id="test-chat"
+    )
+    
+    assert result == date(2024, 12, 28)
+    mock_tools["get_available_slots_range"].assert_awaited_once_with(
+        court_id=10,
+        start_date=date(2024, 12, 26),
+        end_date=date(2025, 1, 8)
+    )
+    mock_tools["get_available_slots"].assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -32,6 +32,8 @@ from app.agent.tools.langchain_converter import create_langchain_tools
 from app.agent.state.memory_manager import update_bot_memory
 from app.agent.state.llm_response_parser import parse_llm_response
 from app.agent.state.flow_state_manager import clear_booking_field, update_flow_state
+from app.services.response_cache import response_cache, normalize_query, UNCACHEABLE_TOOLS
+from app.services.catalogue_cache import catalogue_cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -190,6 +192,19 @@ async def information_handler(
         # 3. Apply fuzzy search logic for sports and court names
         fuzzy_message, fuzzy_context = _apply_fuzzy_search(user_message)
         
+        # Repeat FAQs are answered from the per-owner response cache, which
+        # relies on catalogue change signals to drop answers that went stale
+        cache_key = _response_cache_key(fuzzy_message, flow_state, bot_memory)
+        cache_generation = None
+        if cache_key and response_cache.enabled and catalogue_cache.listening:
+            cache_generation = response_cache.generation
+            cached = response_cache.get(int(owner_profile_id), cache_key)
+            if cached:
+                logger.info(f"Answered information query for chat {chat_id} from response cache")
+                _set_information_response(state, cached["output"], fuzzy_context, flow_state)
+                state["response_metadata"]["cached"] = True
+                return state
+        
         # 4. Fetch owner profile to get business_name for personalization
         logger.debug(f"Fetching owner profile for personalization - owner_profile_id={owner_profile_id}")
         owner_profile = await _fetch_owner_profile(owner_profile_id, chat_id)
@@ -271,20 +286,9 @@ async def information_handler(
         })
         
         # 12. Update state with response_content from agent result
-        response_content = result.get("output", "")
-        
-        # 12. Add fuzzy search confirmation if applicable
-        if fuzzy_context.get("fuzzy_match"):
-            confirmation = fuzzy_context["confirmation_message"]
-            response_content = f"{confirmation}\n\n{response_content}"
-        
-        state["response_content"] = response_content
-        state["response_type"] = "text"
-        state["response_metadata"] = {
-            "fuzzy_match": fuzzy_context.get("fuzzy_match", False),
-            "original_term": fuzzy_context.get("original_term"),
-            "corrected_term": fuzzy_context.get("corrected_term")
-        }
+        agent_output = result.get("output", "")
+        _set_information_response(state, agent_output, fuzzy_context, flow_state)
+        response_content = state["response_content"]
         
         logger.info(
             f"Agent execution completed for chat {chat_id} - "
@@ -301,18 +305,14 @@ async def information_handler(
         if tools_used:
             logger.info(f"Tools used in this interaction: {', '.join(tools_used)}")
         
-        # 14. Determine next_node based on conversation flow
-        # Information handler typically stays in information mode unless user switches intent
-        next_node = _determine_next_node(user_message, response_content, flow_state)
-        state["next_node"] = next_node
-        
-        # Track last node for better routing context
-        flow_state["last_node"] = "information"
-        state["flow_state"] = flow_state
+        # 14. Cache the answer unless it depended on live availability
+        step_tools = {action.tool for action, _ in result.get("intermediate_steps", [])}
+        if cache_generation is not None and agent_output and not UNCACHEABLE_TOOLS.intersection(step_tools):
+            response_cache.set(int(owner_profile_id), cache_key, {"output": agent_output}, cache_generation)
         
         logger.info(
             f"Information node completed successfully for chat {chat_id} - "
-            f"next_node={next_node}"
+            f"next_node={state['next_node']}"
         )
         
     except Exception as e:
@@ -337,6 +337,54 @@ async def information_handler(
     return state
 
 
+def _set_information_response(state: ConversationState, agent_output: str, fuzzy_context: dict, flow_state: dict) -> None:
+    """Set the response, next_node and last_node for an information answer."""
+    response_content = agent_output
+    
+    # Add fuzzy search confirmation if applicable
+    if fuzzy_context.get("fuzzy_match"):
+        confirmation = fuzzy_context["confirmation_message"]
+        response_content = f"{confirmation}\n\n{response_content}"
+    
+    state["response_content"] = response_content
+    state["response_type"] = "text"
+    state["response_metadata"] = {
+        "fuzzy_match": fuzzy_context.get("fuzzy_match", False),
+        "original_term": fuzzy_context.get("original_term"),
+        "corrected_term": fuzzy_context.get("corrected_term")
+    }
+    
+    # Information handler typically stays in information mode unless user switches intent
+    state["next_node"] = _determine_next_node(state["user_message"], response_content, flow_state)
+    
+    # Track last node for better routing context
+    flow_state["last_node"] = "information"
+    state["flow_state"] = flow_state
+
+
+def _response_cache_key(message: str, flow_state: dict, bot_memory: dict) -> Optional[tuple]:
+    """
+    Response cache key: everything the agent's answer depends on.
+    
+    The normalized question, the selected property/court and the chat context
+    _build_system_message puts in the prompt (last search results, preferred
+    sport), so an answer shaped by earlier turns is only reused for chats with
+    the same context.
+    """
+    query = normalize_query(message)
+    if not query:
+        return None
+    context = bot_memory.get("context") or {}
+    preferences = bot_memory.get("user_preferences") or {}
+    return (
+        query,
+        flow_state.get("property_id"),
+        flow_state.get("court_id"),
+        tuple(context.get("last_search_results") or ()),
+        preferences.get("preferred_sport"),
+    )
+
+
 def _apply_fuzzy_search(user_message: str) -> tuple[str, dict]:
     """
     Apply fuzzy search logic for sports and court names.
@@ -554,7 +602,7 @@ async def _fetch_owner_profile(owner_profile_id: str, chat_id: str) -> dict:
         
     Returns:
         Dictionary with owner profile data including business_name
-        Returns empty dict if profile not found or error occurs
+        Returns empty dict if an error occurs
         
     Example:
         >>> profile = await _fetch_owner_profile("1", "chat_123")
@@ -562,29 +610,10 @@ async def _fetch_owner_profile(owner_profile_id: str, chat_id: str) -> dict:
         "ABC Sports Center"
     """
     try:
-        from sqlalchemy.orm import Session
-        from shared.models import OwnerProfile
-        from app.agent.tools.sync_bridge import call_sync_service
-        
-        def get_owner_profile_sync(db: Session, profile_id: int) -> dict:
-            """Sync function to fetch owner profile"""
-            profile = db.query(OwnerProfile).filter(OwnerProfile.id == profile_id).first()
-            if profile:
-                return {
-                    "id": profile.id,
-                    "business_name": profile.business_name,
-                    "phone": profile.phone,
-                    "address": profile.address,
-                    "verified": profile.verified
-                }
-            return {}
-        
-        # Call sync service using the bridge
-        profile_data = await call_sync_service(
-            get_owner_profile_sync,
-            db=None,  # Auto-managed by sync bridge
-            profile_id=int(owner_profile_id)
-        )
+        from app.agent.tools.owner_profile_tool import get_owner_profile_tool
+        
+        # Same tool as the greeting node, so the read is memoized per turn
+        profile_data = await get_owner_profile_tool(owner_profile_id=int(owner_profile_id))
         
         logger.info(
             f"Fetched owner profile for personalization - "
@@ -5,6 +5,9 @@ Simple routing only:
 - "greeting" for greetings
 - "information" for questions
 - "booking" for reservations
+
+Unambiguous messages are routed by the rule-based fast path
+(intent_fast_path) without an LLM call.
 """
 
 from typing import Optional
@@ -17,6 +20,7 @@ from app.agent.state.conversation_state import ConversationState
 from app.services.llm.base import LLMProvider, LLMProviderError
 from app.services.llm.langchain_wrapper import create_langchain_llm
 from app.agent.prompts.intent_prompts import get_routing_prompt
+from app.agent.nodes.intent_fast_path import route_fast_path, fast_path_stats
 
 logger = logging.getLogger(__name__)
 
@@ -28,8 +32,8 @@ async def intent_detection(
     """
     Use LLM to decide routing (greeting/information/booking).
     
-    Uses conversation context for better routing of ambiguous messages.
-    Falls back to "greeting" if LLM fails.
+    Unambiguous messages are routed by rules; the LLM uses conversation
+    context for the rest. Falls back to "greeting" if LLM fails.
     
     New users (owner_properties not initialized) are forced to greeting.
     """
@@ -55,8 +59,17 @@ async def intent_detection(
         state["is_first_message"] = True
         return state
     
-    # Returning user - use LLM for routing decision
-    if llm_provider:
+    # Returning user - try the rule-based fast path first
+    fast_path = route_fast_path(user_message, flow_state)
+    fast_path_stats.record(fast_path[1] if fast_path else None)
+    
+    if fast_path:
+        next_node, rule = fast_path
+        logger.info(
+            f"Fast-path routing for chat {state['chat_id']}: next_node={next_node}, "
+            f"rule={rule}, hit_rate={fast_path_stats.hit_rate:.2f}"
+        )
+    elif llm_provider:
         next_node = await _llm_routing_decision(
             user_message=user_message,
             recent_messages=recent_messages,
@@ -65,6 +78,10 @@ async def intent_detection(
             llm_provider=llm_provider,
             chat_id=state['chat_id']
         )
+        logger.info(
+            f"Fast path missed for chat {state['chat_id']}, used LLM "
+            f"(hit_rate={fast_path_stats.hit_rate:.2f})"
+        )
     else:
         logger.warning(
             f"No LLM provider, defaulting to greeting for chat {state['chat_id']}"
@@ -0,0 +1,136 @@
+"""
+Rule-based fast path for intent routing.
+
+Decides greeting/information/booking without the LLM when a message is
+unambiguous: a bare greeting, an explicit booking request without questions,
+a facility question without booking words, or a short reply (number, yes/no,
+date, time) while a booking step is waiting for input. Anything else returns
+None and intent_detection falls back to the LLM.
+
+Rules only fire when the LLM would make the same call; the labelled fixtures
+in test_intent_fast_path.py cover both the hits and the cases that must be
+left to the LLM.
+"""
+
+import re
+from typing import Any, Dict, Optional, Tuple
+
+_WEEKDAYS = r"(?:mon|tues|wednes|thurs|fri|satur|sun)day"
+_TIME = r"\d{1,2}(?::\d{2})?\s*(?:am|pm)?"
+
+# Whole-message greetings: "hi", "hello there", "good morning", "salam"
+GREETING_PATTERN = re.compile(
+    r"^(?:hi+|hello+|hey+|hiya|yo|howdy|greetings|salam|salaam|aoa"
+    r"|assalam(?:\s*[ou])?\s*alaikum|good\s+(?:morning|afternoon|evening))"
+    r"(?:\s+(?:there|everyone|all))?$"
+)
+
+# Explicit booking requests
+BOOKING_PATTERN = re.compile(
+    r"\b(?:book|reserve)\b"
+    r"|\b(?:make|new|another)\s+(?:a\s+)?(?:booking|reservation)\b"
+)
+
+# Questions about facilities, prices, availability and opening hours
+INFORMATION_PATTERN = re.compile(
+    r"^(?:what|which|where|when|how|do\s+you|does|is\s+there|are\s+there|show\s+me|list|tell\s+me)\b"
+    r"|\b(?:price|prices|pricing|cost|costs|rates?|how\s+much|fees?|charges"
+    r"|available|availability|timings?|opening|hours|location|address"
+    r"|facilities|amenities|parking)\b"
+)
+
+# Short replies to a booking step that is waiting for input
+BOOKING_REPLY_PATTERNS = {
+    "selection": re.compile(
+        r"^(?:\d{1,2}|(?:option|number|court|no\.?)\s*\d{1,2}"
+        r"|(?:the\s+)?(?:first|second|third|fourth|last)(?:\s+one)?|(?:that|this)\s+one)$"
+    ),
+    "confirmation": re.compile(
+        r"^(?:yes|yeah|yep|yup|y|sure|ok|okay|confirm|confirmed|go\s+ahead|proceed"
+        r"|no|nope|n|cancel)$"
+    ),
+    "date": re.compile(
+        rf"^(?:today|tonight|tomorrow|day\s+after\s+tomorrow|(?:this\s+|next\s+)?{_WEEKDAYS}"
+        r"|\d{4}-\d{2}-\d{2}|\d{1,2}[/-]\d{1,2}(?:[/-]\d{2,4})?)$"
+    ),
+    "time": re.compile(rf"^(?:at\s+)?{_TIME}(?:\s*(?:-|to)\s*{_TIME})?$"),
+}
+
+_TRAILING_PUNCTUATION = re.compile(r"[\s.!?,]+$")
+
+
+def normalize_message(message: str) -> str:
+    """Lowercase, trim and drop trailing punctuation."""
+    return _TRAILING_PUNCTUATION.sub("", message.strip().lower())
+
+
+def route_fast_path(user_message: str, flow_state: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """
+    Route a message without the LLM when the decision is unambiguous.
+
+    Args:
+        user_message: Raw user message
+        flow_state: Current flow state (booking_step and last_node are used)
+
+    Returns:
+        (next_node, rule) when a rule matched, None when the LLM should decide
+    """
+    text = normalize_message(user_message)
+    if not text:
+        return None
+
+    booking_step = flow_state.get("booking_step")
+    last_node = flow_state.get("last_node")
+
+    # Short answers belong to the waiting booking step, unless the user
+    # stepped out to the information handler and may be answering it instead.
+    # The booking subgraph sets last_node back to "booking" when it prompts.
+    if booking_step and last_node != "information":
+        for rule, pattern in BOOKING_REPLY_PATTERNS.items():
+            if pattern.match(text):
+                return "booking", f"booking_{rule}"
+
+    if GREETING_PATTERN.match(text):
+        return "greeting", "greeting"
+
+    wants_booking = bool(BOOKING_PATTERN.search(text))
+    asks_information = bool(INFORMATION_PATTERN.search(text))
+
+    if wants_booking and not asks_information:
+        return "booking", "booking_request"
+    if asks_information and not wants_booking and not booking_step:
+        return "information", "information_question"
+
+    return None
+
+
+class FastPathStats:
+    """Counts fast-path hits versus LLM fallbacks."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.rules: Dict[str, int] = {}
+
+    def record(self, rule: Optional[str]) -> None:
+        if rule is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.rules[rule] = self.rules.get(rule, 0) + 1
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "rules": dict(self.rules),
+        }
+
+
+fast_path_stats = FastPathStats()
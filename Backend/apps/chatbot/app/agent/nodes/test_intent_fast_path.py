@@ -0,0 +1,146 @@
+"""
+Unit tests for the rule-based intent fast path.
+
+The fixtures pair messages and flow states with the route the LLM router
+chose for them. The fast path must agree with the LLM whenever it answers
+and must leave ambiguous messages (expected None) to the LLM.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.agent.graphs.booking_subgraph import create_booking_subgraph
+from app.agent.nodes.intent_detection import intent_detection
+from app.agent.nodes.intent_fast_path import route_fast_path, FastPathStats
+
+
+IDLE = {"owner_properties_initialized": True, "booking_step": None, "last_node": "greeting"}
+AWAITING_DATE = {**IDLE, "booking_step": "awaiting_date_selection", "last_node": None}
+AWAITING_TIME = {**IDLE, "booking_step": "awaiting_time_selection", "last_node": None}
+CONFIRMING = {**IDLE, "booking_step": "awaiting_confirmation", "last_node": None}
+ASKED_DURING_BOOKING = {**AWAITING_DATE, "last_node": "information"}
+BACK_TO_BOOKING = {**AWAITING_TIME, "last_node": "booking"}
+
+# (message, flow_state, LLM route, fast-path route or None if it must defer)
+LABELLED_FIXTURES = [
+    ("hi", IDLE, "greeting", "greeting"),
+    ("Hello there!", IDLE, "greeting", "greeting"),
+    ("good morning", IDLE, "greeting", "greeting"),
+    ("Assalam o alaikum", IDLE, "greeting", "greeting"),
+    ("I want to book a court", IDLE, "booking", "booking"),
+    ("Book a tennis court for tomorrow", IDLE, "booking", "booking"),
+    ("can I reserve court 2?", IDLE, "booking", "booking"),
+    ("make a reservation please", IDLE, "booking", "booking"),
+    ("how much does it cost?", IDLE, "information", "information"),
+    ("What sports do you have", IDLE, "information", "information"),
+    ("show me tennis courts", IDLE, "information", "information"),
+    ("where is the arena located", IDLE, "information", "information"),
+    ("what are your opening hours?", IDLE, "information", "information"),
+    ("tomorrow", AWAITING_DATE, "booking", "booking"),
+    ("next friday", AWAITING_DATE, "booking", "booking"),
+    ("2024-06-01", AWAITING_DATE, "booking", "booking"),
+    ("2", AWAITING_TIME, "booking", "booking"),
+    ("7pm", AWAITING_TIME, "booking", "booking"),
+    ("6:00 pm to 7:00 pm", AWAITING_TIME, "booking", "booking"),
+    ("the first one", AWAITING_TIME, "booking", "booking"),
+    ("yes", CONFIRMING, "booking", "booking"),
+    ("Cancel.", CONFIRMING, "booking", "booking"),
+    ("7pm", BACK_TO_BOOKING, "booking", "booking"),
+    ("2", BACK_TO_BOOKING, "booking", "booking"),
+    # Ambiguous without conversation context: left to the LLM
+    ("yes", IDLE, "booking", None),
+    ("2", IDLE, "booking", None),
+    ("how much to book a court for 2 hours?", IDLE, "information", None),
+    ("is it available tomorrow?", AWAITING_DATE, "booking", None),
+    ("tomorrow", ASKED_DURING_BOOKING, "booking", None),
+    ("hi, do you have badminton courts?", IDLE, "information", None),
+    ("thanks", IDLE, "greeting", None),
+]
+
+
+class TestRouteFastPath:
+    """Test route_fast_path against the labelled fixtures."""
+
+    @pytest.mark.parametrize("message,flow_state,llm_route,expected", LABELLED_FIXTURES)
+    def test_matches_fixture(self, message, flow_state, llm_route, expected):
+        """Test that the fast path answers as labelled."""
+        decision = route_fast_path(message, flow_state)
+        assert (decision[0] if decision else None) == expected
+
+    def test_never_disagrees_with_llm(self):
+        """Test that every fast-path decision matches the LLM route."""
+        for message, flow_state, llm_route, _ in LABELLED_FIXTURES:
+            decision = route_fast_path(message, flow_state)
+            if decision:
+                assert decision[0] == llm_route, message
+
+    def test_empty_message_defers(self):
+        """Test that an empty message is left to the LLM."""
+        assert route_fast_path("  ", IDLE) is None
+
+
+class TestFastPathStats:
+    """Test FastPathStats counters."""
+
+    def test_hit_rate(self):
+        """Test hit rate and per-rule counts."""
+        stats = FastPathStats()
+        stats.record("greeting")
+        stats.record("greeting")
+        stats.record(None)
+        stats.record("booking_request")
+
+        assert stats.hit_rate == 0.75
+        assert stats.snapshot()["rules"] == {"greeting": 2, "booking_request": 1}
+
+
+class TestIntentDetectionFastPath:
+    """Test that intent_detection skips the LLM on fast-path hits."""
+
+    @pytest.mark.asyncio
+    async def test_fast_path_skips_llm(self):
+        """Test that a bare greeting is routed without calling the LLM."""
+        state = {"chat_id": "chat-1", "user_message": "hi", "messages": [], "flow_state": dict(IDLE)}
+
+        with patch("app.agent.nodes.intent_detection._llm_routing_decision", new=AsyncMock()) as llm:
+            result = await intent_detection(state, llm_provider=MagicMock())
+
+        assert result["next_node"] == "greeting"
+        llm.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ambiguous_message_uses_llm(self):
+        """Test that an ambiguous message falls back to the LLM."""
+        state = {"chat_id": "chat-1", "user_message": "yes", "messages": [], "flow_state": dict(IDLE)}
+
+        with patch(
+            "app.agent.nodes.intent_detection._llm_routing_decision",
+            new=AsyncMock(return_value="booking")
+        ) as llm:
+            result = await intent_detection(state, llm_provider=MagicMock())
+
+        assert result["next_node"] == "booking"
+        llm.assert_awaited_once()
+
+
+class TestReturnToBooking:
+    """Test that the fast path resumes after an information detour."""
+
+    @pytest.mark.asyncio
+    async def test_booking_turn_after_information_detour_restores_fast_path(self):
+        """Test that a booking turn replaces the information marker."""
+        state = {
+            "chat_id": "chat-1",
+            "user_message": "anything else there?",
+            "flow_state": dict(ASKED_DURING_BOOKING),
+        }
+        assert route_fast_path("tomorrow", state["flow_state"]) is None
+
+        async def prompt_again(state, tools):
+            return state
+
+        with patch("app.agent.graphs.booking_subgraph.select_property", new=prompt_again):
+            result = await create_booking_subgraph(tools={}).ainvoke(state)
+
+        assert result["flow_state"]["last_node"] == "booking"
+        assert route_fast_path("tomorrow", result["flow_state"]) == ("booking", "booking_date")
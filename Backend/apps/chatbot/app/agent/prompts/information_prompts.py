@@ -44,7 +44,7 @@ ReAct Pattern Guidelines:
 You should use the following format:
 
 Thought: Think about what information you need to answer the user's question
-Action: The action to take, should be one of [search_properties, get_property_details, get_court_details, get_court_availability, get_court_pricing, get_property_media, get_court_media]
+Action: The action to take, should be one of [search_properties, get_property_details, get_court_details, get_court_availability, get_property_availability, get_court_pricing, get_property_media, get_court_media]
 Action Input: The input to the action
 Observation: The result of the action
 ... (this Thought/Action/Action Input/Observation can repeat N times)
@@ -94,6 +94,7 @@ Important:
 - Dates should be in ISO format (YYYY-MM-DD)
 - Be specific about which property or court you're referring to
 - If user asks about availability or pricing, make sure to get the court_id first if not provided
+- If user asks whether any court of a property is free, call get_property_availability once instead of get_court_availability for each court
 - Always extract and store preferences even when just providing information
 """
 
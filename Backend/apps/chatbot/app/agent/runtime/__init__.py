@@ -9,12 +9,13 @@ executing the conversation graph with proper error handling, logging, and
 state management.
 
 Usage:
-    from app.agent.runtime import create_graph_runtime, GraphRuntime
-    from app.services.llm.openai_provider import OpenAIProvider
+    from app.agent.runtime import init_graph_runtime, get_graph_runtime
     
-    # Create runtime
-    llm = OpenAIProvider(api_key="...")
-    runtime = create_graph_runtime(llm_provider=llm)
+    # Once, at application startup
+    init_graph_runtime()
+    
+    # Per request
+    runtime = get_graph_runtime()
     
     # Execute graph
     state = {
@@ -26,17 +27,23 @@ Usage:
         "bot_memory": {},
         "messages": []
     }
-    result = await runtime.execute(state)
+    result = await runtime.execute(
+        state,
+        chat_service=chat_service,
+        message_service=message_service
+    )
 """
 
 from app.agent.runtime.graph_runtime import (
     GraphRuntime,
     GraphExecutionError,
-
+    init_graph_runtime,
+    get_graph_runtime,
 )
 
 __all__ = [
     "GraphRuntime",
     "GraphExecutionError",
-
+    "init_graph_runtime",
+    "get_graph_runtime",
 ]
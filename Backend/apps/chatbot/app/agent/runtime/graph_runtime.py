@@ -5,9 +5,14 @@ Manages:
 - Graph initialization with LLM and tools
 - Graph execution with error handling
 - State validation
+- A process-wide runtime shared by all requests
+
+The compiled graph has no per-request state. Request-scoped services
+(ChatService, MessageService) are passed to execute() and forwarded to
+the nodes through config["configurable"].
 """
 
-from typing import Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, Optional
 import logging
 import time
 from datetime import datetime
@@ -15,6 +20,7 @@ from datetime import datetime
 from app.agent.graphs.main_graph import create_main_graph
 from app.agent.state.conversation_state import ConversationState
 from app.agent.tools import initialize_tools
+from app.agent.tools.tool_memo import ToolMemo, tool_memo_scope
 from app.services.llm.base import LLMProvider, LLMProviderError
 
 logger = logging.getLogger(__name__)
@@ -25,6 +31,11 @@ class GraphExecutionError(Exception):
     pass
 
 
+# Nodes whose LLM output is the user-facing reply; other nodes (intent
+# detection, booking selection parsing) produce JSON that must not be streamed.
+STREAMED_NODES = frozenset({"information"})
+
+
 class GraphRuntime:
     """
     Wrapper for LangGraph execution.
@@ -35,14 +46,10 @@ class GraphRuntime:
     def __init__(
         self,
         llm_provider: LLMProvider,
-        chat_service: Optional[Any] = None,
-        message_service: Optional[Any] = None,
         tool_dependencies: Optional[Dict[str, Any]] = None
     ):
         """Initialize graph with LLM and tools."""
         self.llm_provider = llm_provider
-        self.chat_service = chat_service
-        self.message_service = message_service
         
         # Initialize tools
         logger.info("Initializing tools")
@@ -53,32 +60,40 @@ class GraphRuntime:
         try:
             self.graph = create_main_graph(
                 llm_provider=self.llm_provider,
-                tools=self.tools,
-                chat_service=self.chat_service,
-                message_service=self.message_service
+                tools=self.tools
             )
             logger.info("Graph compiled")
         except Exception as e:
             logger.error(f"Failed to compile graph: {e}")
             raise GraphExecutionError(f"Failed to initialize graph: {e}") from e
     
-    async def execute(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def execute(
+        self,
+        state: Dict[str, Any],
+        chat_service: Optional[Any] = None,
+        message_service: Optional[Any] = None
+    ) -> Dict[str, Any]:
         """
         Execute the graph for a message.
         
         Runs all graph nodes and returns final state with bot response.
+        chat_service and message_service belong to the current request and
+        are handed to the nodes through the run config.
         """
         chat_id = state.get("chat_id")
         logger.info(f"Starting graph execution for chat {chat_id}")
         
         start_time = time.time()
+        config = self._build_config(chat_service, message_service)
+        memo = config["configurable"]["tool_memo"]
         
         try:
             # Run the graph (executes all nodes)
-            result = await self.graph.ainvoke(state)
+            with tool_memo_scope(memo):
+                result = await self.graph.ainvoke(state, config=config)
             
             execution_time = time.time() - start_time
-            logger.info(f"Graph completed in {round(execution_time * 1000)}ms")
+            logger.info(f"Graph completed in {round(execution_time * 1000)}ms, tool memo {memo.stats()}")
             
             return result
             
@@ -96,6 +111,97 @@ class GraphRuntime:
                 "I encountered an error. Your conversation is saved. Please try again."
             )
     
+    async def stream(
+        self,
+        state: Dict[str, Any],
+        chat_service: Optional[Any] = None,
+        message_service: Optional[Any] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute the graph for a message, yielding progress as it happens.
+        
+        Yields:
+            {"type": "node", "node": name} when a top-level node starts
+            {"type": "token", "node": name, "content": text} for reply tokens
+            {"type": "final", "state": result} exactly once, last
+        
+        Errors are handled like execute(): the final event then carries the
+        fallback response.
+        """
+        chat_id = state.get("chat_id")
+        logger.info(f"Starting streamed graph execution for chat {chat_id}")
+        
+        start_time = time.time()
+        config = self._build_config(chat_service, message_service)
+        memo = config["configurable"]["tool_memo"]
+        result = None
+        
+        try:
+            with tool_memo_scope(memo):
+                async for event in self.graph.astream_events(state, config=config, version="v2"):
+                    kind = event["event"]
+                    metadata = event.get("metadata", {})
+                    node = metadata.get("langgraph_node")
+                    
+                    # Direct children of the root run are the main graph's nodes
+                    if (
+                        kind == "on_chain_start"
+                        and len(event.get("parent_ids", [])) == 1
+                        and event.get("name") == node
+                        and node != "__start__"
+                    ):
+                        yield {"type": "node", "node": node}
+                    
+                    elif kind == "on_chat_model_stream" and node in STREAMED_NODES:
+                        content = event["data"]["chunk"].content
+                        if isinstance(content, str) and content:
+                            yield {"type": "token", "node": node, "content": content}
+                    
+                    elif kind == "on_chain_end" and not event.get("parent_ids"):
+                        result = event["data"].get("output")
+            
+            logger.info(
+                f"Streamed graph completed in {round((time.time() - start_time) * 1000)}ms, "
+                f"tool memo {memo.stats()}"
+            )
+            
+        except LLMProviderError as e:
+            logger.error(f"LLM error: {e}")
+            result = self._create_fallback_response(
+                state,
+                "I'm having trouble processing your request. Please try again."
+            )
+            
+        except Exception as e:
+            logger.error(f"Streamed graph execution failed: {e}", exc_info=True)
+            result = self._create_fallback_response(
+                state,
+                "I encountered an error. Your conversation is saved. Please try again."
+            )
+        
+        if not isinstance(result, dict):
+            logger.error(f"Streamed graph produced no final state for chat {chat_id}")
+            result = self._create_fallback_response(
+                state,
+                "I encountered an error. Your conversation is saved. Please try again."
+            )
+        
+        yield {"type": "final", "state": result}
+    
+    @staticmethod
+    def _build_config(
+        chat_service: Optional[Any],
+        message_service: Optional[Any]
+    ) -> Dict[str, Any]:
+        """Build the per-invocation config carrying request-scoped services and the tool memo."""
+        return {
+            "configurable": {
+                "chat_service": chat_service,
+                "message_service": message_service,
+                "tool_memo": ToolMemo(),
+            }
+        }
+    
     async def _execute_with_logging(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """Execute graph and log."""
         logger.debug(f"Invoking graph for chat {state.get('chat_id')}")
@@ -124,7 +230,47 @@ class GraphRuntime:
         }
 
 
+_graph_runtime: Optional[GraphRuntime] = None
+
+
+def init_graph_runtime(llm_provider: Optional[LLMProvider] = None) -> GraphRuntime:
+    """
+    Build the process-wide GraphRuntime.
+    
+    Called once from application startup so tool initialization, LLM provider
+    creation and graph compilation stay off the message latency path.
+    Calling it again replaces the runtime (useful in tests).
+    """
+    global _graph_runtime
+    
+    if llm_provider is None:
+        from app.services.llm import get_llm_provider
+        llm_provider = get_llm_provider()
+    
+    start_time = time.time()
+    _graph_runtime = GraphRuntime(llm_provider=llm_provider)
+    logger.info(
+        f"Graph runtime initialized in {round((time.time() - start_time) * 1000)}ms"
+    )
+    return _graph_runtime
+
+
+def get_graph_runtime() -> GraphRuntime:
+    """
+    Return the shared GraphRuntime, building it on first use.
+    
+    The event loop is single-threaded and initialization has no await
+    points, so lazy initialization here cannot race.
+    """
+    if _graph_runtime is None:
+        return init_graph_runtime()
+    return _graph_runtime
+
+
 __all__ = [
     "GraphRuntime",
+    "STREAMED_NODES",
     "GraphExecutionError",
+    "init_graph_runtime",
+    "get_graph_runtime",
 ]
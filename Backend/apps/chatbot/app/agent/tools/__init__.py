@@ -30,10 +30,15 @@ from app.agent.tools.sync_bridge import (
     run_sync_in_executor,
     sync_to_async,
     call_sync_service,
+    call_cached_service,
     get_sync_db,
     shutdown_executor,
+    get_executor_stats,
+    SyncBridgeBusyError,
     SyncDBContext,
 )
+from app.agent.tools.async_reads import call_async_service
+from app.agent.tools.tool_memo import ToolMemo, get_tool_memo, tool_memo_scope, invalidate_tool_memo
 
 # Import tool functions from individual modules
 from app.agent.tools.property_tool import (
@@ -52,6 +57,7 @@ from app.agent.tools.court_tool import (
 from app.agent.tools.availability_tool import (
     check_availability_tool,
     get_available_slots_tool,
+    get_available_slots_range_tool,
 )
 
 from app.agent.tools.pricing_tool import (
@@ -74,6 +80,7 @@ from app.agent.tools.information_tools import (
     get_property_details_tool as info_get_property_details_tool,
     get_court_details_tool as info_get_court_details_tool,
     get_court_availability_tool as info_get_court_availability_tool,
+    get_property_availability_tool as info_get_property_availability_tool,
     get_court_pricing_tool as info_get_court_pricing_tool,
     get_property_media_tool as info_get_property_media_tool,
     get_court_media_tool as info_get_court_media_tool,
@@ -102,6 +109,7 @@ TOOL_REGISTRY: Dict[str, Callable] = {
     # Availability tools (legacy/direct use)
     "check_availability": check_availability_tool,
     "get_available_slots": get_available_slots_tool,
+    "get_available_slots_range": get_available_slots_range_tool,
     
     # Pricing tools (legacy/direct use)
     "get_pricing": get_pricing_tool,
@@ -236,10 +244,20 @@ __all__ = [
     "run_sync_in_executor",
     "sync_to_async",
     "call_sync_service",
+    "call_cached_service",
+    "call_async_service",
     "get_sync_db",
     "shutdown_executor",
+    "get_executor_stats",
+    "SyncBridgeBusyError",
     "SyncDBContext",
     
+    # Per-execution tool memo
+    "ToolMemo",
+    "get_tool_memo",
+    "tool_memo_scope",
+    "invalidate_tool_memo",
+    
     # Tool registry
     "TOOL_REGISTRY",
     "INFORMATION_TOOLS",
@@ -258,6 +276,7 @@ __all__ = [
     "get_property_courts_tool",
     "check_availability_tool",
     "get_available_slots_tool",
+    "get_available_slots_range_tool",
     "get_pricing_tool",
     "calculate_total_price",
     "create_booking_tool",
@@ -269,6 +288,7 @@ __all__ = [
     "info_get_property_details_tool",
     "info_get_court_details_tool",
     "info_get_court_availability_tool",
+    "info_get_property_availability_tool",
     "info_get_court_pricing_tool",
     "info_get_property_media_tool",
     "info_get_court_media_tool",
@@ -0,0 +1,56 @@
+"""
+Async read path for agent tools.
+
+Catalogue, pricing and availability reads run the async variants in
+shared.services.async_public_service on the main database's async engine,
+directly on the event loop. The sync bridge's thread pool is left to writes
+(bookings) and to services that have no async variant yet.
+"""
+
+import logging
+from typing import Any, Awaitable, Callable, TypeVar
+
+from app.core.database import MainAsyncSessionLocal
+from app.agent.tools.tool_memo import get_tool_memo, is_missing
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+async def call_async_service(
+    service_func: Callable[..., Awaitable[T]],
+    *args: Any,
+    **kwargs: Any
+) -> T:
+    """
+    Call a read-only async service with its own main-database session.
+    
+    The session is opened and closed around the call and passed as the
+    first argument. Like call_cached_service, repeat calls with the same
+    arguments during one graph execution are answered from its ToolMemo.
+    
+    Example:
+        result = await call_async_service(
+            async_public_service.get_court_details,
+            court_id=court_id
+        )
+    """
+    memo = get_tool_memo()
+    key = None
+    if memo is not None:
+        key = memo.key(service_func, args, kwargs)
+        cached = memo.lookup(key)
+        if not is_missing(cached):
+            return cached
+    
+    async with MainAsyncSessionLocal() as db:
+        try:
+            result = await service_func(db, *args, **kwargs)
+        except Exception as e:
+            logger.error(f"Error executing async service {service_func.__name__}: {e}")
+            raise
+    
+    if memo is not None:
+        memo.store(key, result)
+    return result
@@ -2,72 +2,21 @@
 Availability checking tools for the chatbot agent.
 
 This module provides tools for checking court availability and retrieving
-available time slots by integrating with the sync availability_service and
-public_service through the sync bridge.
+available time slots. Blocked slots come from the sync availability_service
+through the sync bridge; slot reads use the async public service variants.
 """
 
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import date
 
-from app.agent.tools.sync_bridge import call_sync_service
-from shared.services import availability_service
+from app.agent.tools.async_reads import call_async_service
+from app.agent.tools.sync_bridge import call_cached_service
+from shared.services import async_public_service, availability_service
 
 logger = logging.getLogger(__name__)
 
 
-def _get_management_services():
-    """
-    Dynamically import management services to avoid import conflicts.
-    
-    This function imports the management app services at runtime to prevent
-    conflicts with the chatbot's app.services module.
-    """
-    import sys
-    from pathlib import Path
-    
-    # Add Backend path for shared modules
-    backend_path = Path(__file__).parent.parent.parent.parent.parent.parent
-    if str(backend_path) not in sys.path:
-        sys.path.insert(0, str(backend_path))
-    
-    # Add management app path at the beginning to prioritize it
-    management_path = backend_path / "apps" / "management"
-    if str(management_path) not in sys.path:
-        sys.path.insert(0, str(management_path))
-    
-    # Import services from management app
-    # We need to temporarily remove chatbot path to avoid conflicts
-    chatbot_path = str(Path(__file__).parent.parent.parent.parent.parent)
-    original_path = sys.path.copy()
-    
-    try:
-        # Remove chatbot path temporarily
-        if chatbot_path in sys.path:
-            sys.path.remove(chatbot_path)
-        
-        # Import directly from service modules
-        import importlib.util
-        
-        availability_service_path = management_path / "app" / "services" / "availability_service.py"
-        public_service_path = management_path / "app" / "services" / "public_service.py"
-        
-        # Load availability_service
-        spec = importlib.util.spec_from_file_location("availability_service", availability_service_path)
-        availability_service = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(availability_service)
-        
-        # Load public_service
-        spec = importlib.util.spec_from_file_location("public_service", public_service_path)
-        public_service = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(public_service)
-        
-        return availability_service, public_service
-    finally:
-        # Restore original path
-        sys.path = original_path
-
-
 async def check_availability_tool(
     court_id: int,
     owner_profile_id: int,
@@ -101,11 +50,8 @@ async def check_availability_tool(
             f"from_date={from_date}"
         )
         
-        # Get management services
-        availability_service, public_service = _get_management_services()
-        
         # Call sync service using the bridge
-        result = await call_sync_service(
+        result = await call_cached_service(
             availability_service.get_blocked_slots,
             db=None,  # Auto-managed by sync bridge
             court_id=court_id,
@@ -114,13 +60,13 @@ async def check_availability_tool(
         )
         
         # Extract data from response
-        if result.get('success'):
-            blocked_slots = result.get('data', [])
+        if result.success:
+            blocked_slots = (result.data or [])
             logger.info(f"Found {len(blocked_slots)} blocked slots for court_id={court_id}")
             return blocked_slots
         else:
             logger.warning(
-                f"Failed to get blocked slots: {result.get('message')} "
+                f"Failed to get blocked slots: {result.message} "
                 f"(court_id={court_id})"
             )
             return []
@@ -182,20 +128,16 @@ async def get_available_slots_tool(
             f"Getting available slots: court_id={court_id}, date={date_val}"
         )
         
-        # Get management services
-        availability_service, public_service = _get_management_services()
-        
-        # Call sync service using the bridge
-        result = await call_sync_service(
-            public_service.get_available_slots,
-            db=None,  # Auto-managed by sync bridge
+        # Async read on the main database
+        result = await call_async_service(
+            async_public_service.get_available_slots,
             court_id=court_id,
             date_val=date_val
         )
         
         # Extract data from response
-        if result.get('success'):
-            availability_data = result.get('data')
+        if result.success:
+            availability_data = result.data
             num_slots = len(availability_data.get('available_slots', []))
             logger.info(
                 f"Found {num_slots} available slots for court_id={court_id} "
@@ -204,7 +146,7 @@ async def get_available_slots_tool(
             return availability_data
         else:
             logger.warning(
-                f"Failed to get available slots: {result.get('message')} "
+                f"Failed to get available slots: {result.message} "
                 f"(court_id={court_id}, date={date_val})"
             )
             return None
@@ -214,8 +156,73 @@ async def get_available_slots_tool(
         return None
 
 
+async def get_available_slots_range_tool(
+    court_id: int,
+    start_date: date,
+    end_date: date
+) -> Optional[Dict[str, Any]]:
+    """
+    Get available time slots for a court for every day in a date range.
+    
+    This tool uses public_service.get_available_slots_range, which loads
+    pricing, blocked slots and bookings for the whole window in a few
+    set-based queries instead of one round trip per day.
+    
+    Args:
+        court_id: ID of the court
+        start_date: First date to check
+        end_date: Last date to check (inclusive)
+        
+    Returns:
+        Dictionary containing court_id, court_name, start_date, end_date and
+        days, a list of {"date", "available_slots"} entries in date order.
+        Days the court is not priced for are omitted.
+        
+        Returns None if the court is not found or the range is invalid
+        
+    Example:
+        availability = await get_available_slots_range_tool(
+            court_id=123,
+            start_date=date(2024, 1, 15),
+            end_date=date(2024, 1, 28)
+        )
+    """
+    try:
+        logger.info(
+            f"Getting available slots range: court_id={court_id}, "
+            f"start_date={start_date}, end_date={end_date}"
+        )
+        
+        # Async read on the main database
+        result = await call_async_service(
+            async_public_service.get_available_slots_range,
+            court_id=court_id,
+            start_date=start_date,
+            end_date=end_date
+        )
+        
+        if result.success:
+            availability_data = result.data
+            logger.info(
+                f"Retrieved availability for {len(availability_data.get('days', []))} days "
+                f"for court_id={court_id}"
+            )
+            return availability_data
+        else:
+            logger.warning(
+                f"Failed to get available slots range: {result.message} "
+                f"(court_id={court_id}, start_date={start_date}, end_date={end_date})"
+            )
+            return None
+            
+    except Exception as e:
+        logger.error(f"Error getting available slots range: {e}", exc_info=True)
+        return None
+
+
 # Tool registry for easy access
 AVAILABILITY_TOOLS = {
     "check_availability": check_availability_tool,
     "get_available_slots": get_available_slots_tool,
+    "get_available_slots_range": get_available_slots_range_tool,
 }
@@ -11,69 +11,13 @@ from typing import Dict, Any, Optional
 from datetime import date, time
 
 from app.agent.tools.sync_bridge import call_sync_service
+from app.agent.tools.tool_memo import invalidate_tool_memo
 from shared.services import booking_service
+from shared.schemas.booking import BookingCreate
 
 logger = logging.getLogger(__name__)
 
 
-def _get_management_services():
-    """
-    Dynamically import management services to avoid import conflicts.
-    
-    This function imports the management app services at runtime to prevent
-    conflicts with the chatbot's app.services module.
-    """
-    import sys
-    from pathlib import Path
-    
-    # Add Backend path for shared modules
-    backend_path = Path(__file__).parent.parent.parent.parent.parent.parent
-    if str(backend_path) not in sys.path:
-        sys.path.insert(0, str(backend_path))
-    
-    # Add management app path at the beginning to prioritize it
-    management_path = backend_path / "apps" / "management"
-    if str(management_path) not in sys.path:
-        sys.path.insert(0, str(management_path))
-    
-    # Import services from management app
-    # We need to temporarily remove chatbot path to avoid conflicts
-    chatbot_path = str(Path(__file__).parent.parent.parent.parent.parent)
-    original_path = sys.path.copy()
-    
-    try:
-        # Remove chatbot path temporarily
-        if chatbot_path in sys.path:
-            sys.path.remove(chatbot_path)
-        
-        # Import from management app
-        from app.services import booking_service
-        return booking_service
-    finally:
-        # Restore original path
-        sys.path = original_path
-
-
-def _get_booking_schema():
-    """
-    Dynamically import BookingCreate schema from shared schemas.
-    
-    Returns:
-        BookingCreate: The Pydantic schema class for creating bookings
-    """
-    import sys
-    from pathlib import Path
-    
-    # Add Backend path for shared modules
-    backend_path = Path(__file__).parent.parent.parent.parent.parent.parent
-    if str(backend_path) not in sys.path:
-        sys.path.insert(0, str(backend_path))
-    
-    # Import shared schema
-    from shared.schemas.booking import BookingCreate
-    return BookingCreate
-
-
 async def create_booking_tool(
     customer_id: int,
     court_id: int,
@@ -149,10 +93,6 @@ async def create_booking_tool(
             f"date={booking_date}, time={start_time}-{end_time}"
         )
         
-        # Get management services and schema
-        booking_service = _get_management_services()
-        BookingCreate = _get_booking_schema()
-        
         # Create booking data object
         booking_data = BookingCreate(
             court_id=court_id,
@@ -169,22 +109,24 @@ async def create_booking_tool(
             customer_id=customer_id,
             data=booking_data
         )
+        # Slots and booking reads memoized earlier in this turn are now stale
+        invalidate_tool_memo()
         
         # Log result
-        if result.get('success'):
-            booking_id = result.get('data', {}).get('id')
-            total_price = result.get('data', {}).get('total_price')
+        if result.success:
+            booking_id = (result.data or {}).get('id')
+            total_price = (result.data or {}).get('total_price')
             logger.info(
                 f"Booking created successfully: booking_id={booking_id}, "
                 f"total_price=${total_price}"
             )
         else:
             logger.warning(
-                f"Failed to create booking: {result.get('message')} "
+                f"Failed to create booking: {result.message} "
                 f"(customer_id={customer_id}, court_id={court_id})"
             )
         
-        return result
+        return result.to_payload()
             
     except ValueError as e:
         # Validation errors from Pydantic schema
@@ -264,9 +206,6 @@ async def get_booking_details_tool(
             f"Getting booking details: booking_id={booking_id}, user_id={user_id}"
         )
         
-        # Get management services
-        booking_service = _get_management_services()
-        
         # Call sync service using the bridge
         result = await call_sync_service(
             booking_service.get_booking_details,
@@ -276,15 +215,15 @@ async def get_booking_details_tool(
         )
         
         # Log result
-        if result.get('success'):
+        if result.success:
             logger.info(f"Booking details retrieved: booking_id={booking_id}")
         else:
             logger.warning(
-                f"Failed to get booking details: {result.get('message')} "
+                f"Failed to get booking details: {result.message} "
                 f"(booking_id={booking_id}, user_id={user_id})"
             )
         
-        return result
+        return result.to_payload()
             
     except Exception as e:
         logger.error(f"Error getting booking details: {e}", exc_info=True)
@@ -332,9 +271,6 @@ async def cancel_booking_tool(
             f"Cancelling booking: booking_id={booking_id}, user_id={user_id}"
         )
         
-        # Get management services
-        booking_service = _get_management_services()
-        
         # Call sync service using the bridge
         result = await call_sync_service(
             booking_service.cancel_booking,
@@ -342,17 +278,18 @@ async def cancel_booking_tool(
             booking_id=booking_id,
             user_id=user_id
         )
+        invalidate_tool_memo()
         
         # Log result
-        if result.get('success'):
+        if result.success:
             logger.info(f"Booking cancelled: booking_id={booking_id}")
         else:
             logger.warning(
-                f"Failed to cancel booking: {result.get('message')} "
+                f"Failed to cancel booking: {result.message} "
                 f"(booking_id={booking_id}, user_id={user_id})"
             )
         
-        return result
+        return result.to_payload()
             
     except Exception as e:
         logger.error(f"Error cancelling booking: {e}", exc_info=True)
@@ -2,38 +2,33 @@
 Court search and details tools for the chatbot agent.
 
 This module provides tools for searching courts by sport type and retrieving
-court details by integrating with the sync court_service and public_service
-through the sync bridge.
+court details. Public reads use the async public service variants; owner
+court lists still go through court_service and the sync bridge.
 """
 
 import logging
 from typing import List, Dict, Any, Optional
 
-from app.agent.tools.sync_bridge import call_sync_service
-from shared.services import court_service
+from app.agent.tools.async_reads import call_async_service
+from app.agent.tools.sync_bridge import call_cached_service
+from app.services.catalogue_cache import get_cached_property_details
+from shared.services import async_public_service, court_service
+from shared.utils.response_utils import make_result
+from shared.utils.sport_taxonomy import normalize_sport
 
 logger = logging.getLogger(__name__)
 
 
-def _get_court_service():
-    """
-    Import court_service from shared.
-    """
-    import sys
-    from pathlib import Path
-    
-    # Add Backend path for shared modules
-    backend_path = Path(__file__).parent.parent.parent.parent.parent.parent
-    if str(backend_path) not in sys.path:
-        sys.path.insert(0, str(backend_path))
-    
-    # Import court_service from shared
-    try:
-        from shared.services import court_service
-        return court_service
-    except ImportError as e:
-        logger.error(f"Failed to import court_service from shared: {e}")
-        raise
+async def _get_property_details(property_id: int):
+    """Public property details, served from the catalogue cache when possible"""
+    cached = await get_cached_property_details(property_id)
+    if cached is not None:
+        return make_result(True, "Property details retrieved successfully", data=cached)
+
+    return await call_async_service(
+        async_public_service.get_property_details,
+        property_id=property_id
+    )
 
 
 async def search_courts_tool(
@@ -71,50 +66,42 @@ async def search_courts_tool(
             f"property_id={property_id}, limit={limit}"
         )
         
-        # Get court service from shared
-        court_service = _get_court_service()
-        
         # If property_id is specified, get courts for that property
         if property_id:
-            result = await call_sync_service(
-                public_service.get_property_details,
-                db=None,
-                property_id=property_id
-            )
+            result = await _get_property_details(property_id)
             
-            if result.get('success'):
-                property_data = result.get('data', {})
+            if result.success:
+                property_data = (result.data or {})
                 courts = property_data.get('courts', [])
                 
                 # Filter by sport_type if specified
                 if sport_type:
                     courts = [
                         c for c in courts 
-                        if c.get('sport_type', '').lower() == sport_type.lower()
+                        if normalize_sport(c.get('sport_type')) == normalize_sport(sport_type)
                     ]
                 
                 logger.info(f"Found {len(courts)} courts for property_id={property_id}")
                 return courts[:limit]
             else:
-                logger.warning(f"Failed to get property details: {result.get('message')}")
+                logger.warning(f"Failed to get property details: {result.message}")
                 return []
         
         # Otherwise, search properties by sport_type and extract courts
-        result = await call_sync_service(
-            public_service.search_properties,
-            db=None,
+        result = await call_async_service(
+            async_public_service.search_properties,
             city=city,
             sport_type=sport_type,
             page=1,
             limit=limit
         )
         
-        if not result.get('success'):
-            logger.warning(f"Property search failed: {result.get('message')}")
+        if not result.success:
+            logger.warning(f"Property search failed: {result.message}")
             return []
         
         # Get property IDs from search results
-        properties = result.get('data', {}).get('items', [])
+        properties = (result.data or {}).get('items', [])
         
         if not properties:
             logger.info("No properties found matching search criteria")
@@ -123,21 +110,17 @@ async def search_courts_tool(
         # Get detailed information for each property to extract courts
         courts = []
         for prop in properties:
-            prop_result = await call_sync_service(
-                public_service.get_property_details,
-                db=None,
-                property_id=prop['id']
-            )
+            prop_result = await _get_property_details(prop['id'])
             
-            if prop_result.get('success'):
-                prop_data = prop_result.get('data', {})
+            if prop_result.success:
+                prop_data = (prop_result.data or {})
                 prop_courts = prop_data.get('courts', [])
                 
                 # Filter by sport_type if specified
                 if sport_type:
                     prop_courts = [
                         c for c in prop_courts 
-                        if c.get('sport_type', '').lower() == sport_type.lower()
+                        if normalize_sport(c.get('sport_type')) == normalize_sport(sport_type)
                     ]
                 
                 # Add property context to each court
@@ -180,24 +163,20 @@ async def get_court_details_tool(court_id: int) -> Optional[Dict[str, Any]]:
     try:
         logger.info(f"Getting court details: court_id={court_id}")
         
-        # Get court service from shared
-        court_service = _get_court_service()
-        
-        # Call sync service using the bridge
-        result = await call_sync_service(
-            public_service.get_court_details,
-            db=None,
+        # Async read on the main database
+        result = await call_async_service(
+            async_public_service.get_court_details,
             court_id=court_id
         )
         
         # Extract data from response
-        if result.get('success'):
-            court_data = result.get('data')
+        if result.success:
+            court_data = result.data
             logger.info(f"Retrieved court details for court_id={court_id}")
             return court_data
         else:
             logger.warning(
-                f"Failed to get court details: {result.get('message')} "
+                f"Failed to get court details: {result.message} "
                 f"(court_id={court_id})"
             )
             return None
@@ -237,12 +216,9 @@ async def get_property_courts_tool(
             f"owner_id={owner_id}"
         )
         
-        # Get court service from shared
-        court_service = _get_court_service()
-        
         if owner_id:
             # Use owner-specific service
-            result = await call_sync_service(
+            result = await call_cached_service(
                 court_service.get_property_courts,
                 db=None,
                 property_id=property_id,
@@ -250,25 +226,21 @@ async def get_property_courts_tool(
             )
         else:
             # Use public service to get property details with courts
-            result = await call_sync_service(
-                public_service.get_property_details,
-                db=None,
-                property_id=property_id
-            )
+            result = await _get_property_details(property_id)
             
-            if result.get('success'):
-                property_data = result.get('data', {})
+            if result.success:
+                property_data = (result.data or {})
                 courts = property_data.get('courts', [])
                 return courts
         
         # Extract data from response
-        if result.get('success'):
-            courts = result.get('data', [])
+        if result.success:
+            courts = (result.data or [])
             logger.info(f"Found {len(courts)} courts for property_id={property_id}")
             return courts
         else:
             logger.warning(
-                f"Failed to get property courts: {result.get('message')} "
+                f"Failed to get property courts: {result.message} "
                 f"(property_id={property_id})"
             )
             return []
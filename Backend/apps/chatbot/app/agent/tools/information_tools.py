@@ -3,7 +3,8 @@ Information tools for the chatbot agent.
 
 This module provides tools for the Information Node to handle all information-related
 queries including property search, property details, court details, availability,
-pricing, and media. All tools integrate with public_service through the sync bridge.
+pricing, and media. Reads use the async public service variants directly on the
+event loop.
 
 These tools are designed to be used by LangChain agents with automatic tool calling.
 
@@ -11,36 +12,31 @@ Requirements: 1.1, 2.1, 3.1, 4.1, 5.1, 6.1, 9.6
 """
 
 import logging
-import json
 from typing import List, Dict, Any, Optional
 from datetime import date
 
-from app.agent.tools.sync_bridge import call_sync_service
+from app.agent.tools.async_reads import call_async_service
+from app.services.catalogue_cache import get_cached_property_details
+from shared.services import async_public_service
+from shared.utils.response_utils import ServiceResult
 
 logger = logging.getLogger(__name__)
 
 
 def _extract_response_data(result):
     """
-    Extract data from a JSONResponse or dict result.
+    Extract data from a ServiceResult or dict result.
     
     Args:
-        result: Either a JSONResponse object or a dict
+        result: Either a ServiceResult returned by a shared service or a dict
         
     Returns:
         Tuple of (success, data, message)
     """
     try:
-        # If it's a JSONResponse, extract the body
-        if hasattr(result, 'body'):
-            body_bytes = result.body
-            body_str = body_bytes.decode('utf-8') if isinstance(body_bytes, bytes) else body_bytes
-            response_data = json.loads(body_str)
-            return (
-                response_data.get('success', False),
-                response_data.get('data'),
-                response_data.get('message', '')
-            )
+        # Shared services return a ServiceResult - read it directly
+        if isinstance(result, ServiceResult):
+            return (result.success, result.data, result.message)
         # If it's already a dict, use it directly
         elif isinstance(result, dict):
             return (
@@ -56,51 +52,6 @@ def _extract_response_data(result):
         return (False, None, str(e))
 
 
-def _get_public_service():
-    """
-    Dynamically import public_service to avoid import conflicts.
-    
-    This function imports the public_service at runtime to prevent
-    conflicts with the chatbot's app.services module.
-    """
-    import sys
-    from pathlib import Path
-    
-    # Add Backend path for shared modules
-    backend_path = Path(__file__).parent.parent.parent.parent.parent.parent
-    if str(backend_path) not in sys.path:
-        sys.path.insert(0, str(backend_path))
-    
-    # Add management app path at the beginning to prioritize it
-    management_path = backend_path / "apps" / "management"
-    if str(management_path) not in sys.path:
-        sys.path.insert(0, str(management_path))
-    
-    # Import services from management app
-    chatbot_path = str(Path(__file__).parent.parent.parent.parent.parent)
-    original_path = sys.path.copy()
-    
-    try:
-        # Remove chatbot path temporarily
-        if chatbot_path in sys.path:
-            sys.path.remove(chatbot_path)
-        
-        # Import directly from service module
-        import importlib.util
-        
-        public_service_path = management_path / "app" / "services" / "public_service.py"
-        
-        # Load public_service
-        spec = importlib.util.spec_from_file_location("public_service", public_service_path)
-        public_service = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(public_service)
-        
-        return public_service
-    finally:
-        # Restore original path
-        sys.path = original_path
-
-
 async def search_properties_tool(
     city: Optional[str] = None,
     sport_type: Optional[str] = None,
@@ -143,13 +94,9 @@ async def search_properties_tool(
             f"min_price={min_price}, max_price={max_price}, limit={limit}"
         )
         
-        # Get public service
-        public_service = _get_public_service()
-        
-        # Call sync service using the bridge
-        result = await call_sync_service(
-            public_service.search_properties,
-            db=None,  # Auto-managed by sync bridge
+        # Async read on the main database
+        result = await call_async_service(
+            async_public_service.search_properties,
             city=city,
             sport_type=sport_type,
             min_price=min_price,
@@ -218,13 +165,13 @@ async def get_property_details_tool(
     try:
         logger.info(f"Getting property details: property_id={property_id}")
         
-        # Get public service
-        public_service = _get_public_service()
+        cached = await get_cached_property_details(property_id)
+        if cached is not None:
+            return cached
         
-        # Call sync service using the bridge
-        result = await call_sync_service(
-            public_service.get_property_details,
-            db=None,  # Auto-managed by sync bridge
+        # Async read on the main database
+        result = await call_async_service(
+            async_public_service.get_property_details,
             property_id=property_id
         )
         
@@ -284,13 +231,9 @@ async def get_court_details_tool(
     try:
         logger.info(f"Getting court details: court_id={court_id}")
         
-        # Get public service
-        public_service = _get_public_service()
-        
-        # Call sync service using the bridge
-        result = await call_sync_service(
-            public_service.get_court_details,
-            db=None,  # Auto-managed by sync bridge
+        # Async read on the main database
+        result = await call_async_service(
+            async_public_service.get_court_details,
             court_id=court_id
         )
         
@@ -362,13 +305,9 @@ async def get_court_availability_tool(
         else:
             date_obj = date_val
         
-        # Get public service
-        public_service = _get_public_service()
-        
-        # Call sync service using the bridge
-        result = await call_sync_service(
-            public_service.get_available_slots,
-            db=None,  # Auto-managed by sync bridge
+        # Async read on the main database
+        result = await call_async_service(
+            async_public_service.get_available_slots,
             court_id=court_id,
             date_val=date_obj
         )
@@ -400,6 +339,88 @@ async def get_court_availability_tool(
         return None
 
 
+async def get_property_availability_tool(
+    property_id: int,
+    date_val: str,  # ISO format YYYY-MM-DD
+    sport_type: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Get a free-slot summary for all courts of a property on a specific date.
+    
+    Answers "any futsal court free Saturday evening?" in one step instead of
+    one get_court_availability call per court. It uses
+    public_service.get_property_availability(), which reads pricing, blocked
+    slots and bookings of all the property's courts with one query each.
+    
+    Args:
+        property_id: ID of the property
+        date_val: Date to check availability for (ISO format YYYY-MM-DD)
+        sport_type: Only include courts of this sport (optional)
+        
+    Returns:
+        Dictionary containing:
+        - property_id, property_name, date, sport_type, slot_minutes
+        - courts: One entry per active court with court_id, court_name,
+          sport_type, open (False if closed that day), free_slots (count) and
+          free_windows (consecutive free time as start_time/end_time HH:MM with
+          min/max price_per_hour)
+        
+        Returns None if property not found or on error
+        
+    Example:
+        availability = await get_property_availability_tool(
+            property_id=5,
+            date_val="2026-03-14",
+            sport_type="futsal"
+        )
+    """
+    try:
+        logger.info(
+            f"Getting property availability: property_id={property_id}, "
+            f"date={date_val}, sport_type={sport_type}"
+        )
+        
+        # Parse date string to date object
+        if isinstance(date_val, str):
+            from datetime import datetime
+            date_obj = datetime.fromisoformat(date_val).date()
+        else:
+            date_obj = date_val
+        
+        # Async read on the main database
+        result = await call_async_service(
+            async_public_service.get_property_availability,
+            property_id=property_id,
+            date_val=date_obj,
+            sport_type=sport_type
+        )
+        
+        # Extract data from response
+        success, data, message = _extract_response_data(result)
+        
+        if success and data:
+            logger.info(
+                f"Found {sum(c['free_slots'] for c in data['courts'])} free slots across "
+                f"{len(data['courts'])} courts for property_id={property_id} on {date_val}"
+            )
+            return data
+        else:
+            logger.warning(
+                f"Failed to get property availability: {message} "
+                f"(property_id={property_id}, date={date_val})"
+            )
+            return None
+            
+    except Exception as e:
+        logger.error(
+            f"Error getting property availability: {e}",
+            extra={"property_id": property_id, "date": date_val},
+            exc_info=True
+        )
+        # Return None to allow conversation to continue
+        return None
+
+
 async def get_court_pricing_tool(
     court_id: int,
     date_val: str  # ISO format YYYY-MM-DD
@@ -440,13 +461,9 @@ async def get_court_pricing_tool(
         else:
             date_obj = date_val
         
-        # Get public service
-        public_service = _get_public_service()
-        
-        # Call sync service using the bridge
-        result = await call_sync_service(
-            public_service.get_court_pricing_for_date,
-            db=None,  # Auto-managed by sync bridge
+        # Async read on the main database
+        result = await call_async_service(
+            async_public_service.get_court_pricing_for_date,
             court_id=court_id,
             date_val=date_obj
         )
@@ -581,6 +598,7 @@ INFORMATION_TOOLS = {
     "get_property_details": get_property_details_tool,
     "get_court_details": get_court_details_tool,
     "get_court_availability": get_court_availability_tool,
+    "get_property_availability": get_property_availability_tool,
     "get_court_pricing": get_court_pricing_tool,
     "get_property_media": get_property_media_tool,
     "get_court_media": get_court_media_tool,
@@ -74,6 +74,21 @@ class GetCourtAvailabilityInput(BaseModel):
     )
 
 
+class GetPropertyAvailabilityInput(BaseModel):
+    """Input schema for get_property_availability tool."""
+    property_id: int = Field(
+        description="Unique identifier of the property whose courts to check",
+        gt=0
+    )
+    date_val: str = Field(
+        description="Date to check availability for in ISO format (YYYY-MM-DD), e.g., '2026-03-10'"
+    )
+    sport_type: Optional[str] = Field(
+        None,
+        description="Only include courts of this sport, e.g., 'futsal' (optional)"
+    )
+
+
 class GetCourtPricingInput(BaseModel):
     """Input schema for get_court_pricing tool."""
     court_id: int = Field(
@@ -198,6 +213,24 @@ def create_langchain_tools(tool_registry: Dict[str, Callable]) -> List[Structure
             ))
             logger.debug("Added get_court_availability tool")
         
+        # Get property availability tool
+        if "get_property_availability" in tool_registry:
+            tools.append(StructuredTool.from_function(
+                func=tool_registry["get_property_availability"],
+                name="get_property_availability",
+                description=(
+                    "Check free time on a date for all courts of a property at once, optionally "
+                    "only courts of one sport. Use this tool instead of calling "
+                    "get_court_availability for each court when the user asks whether any court "
+                    "is free (e.g. 'any futsal court free Saturday evening?'). Returns free time "
+                    "windows with price ranges per court. Requires property_id and date in ISO "
+                    "format (YYYY-MM-DD)."
+                ),
+                args_schema=GetPropertyAvailabilityInput,
+                coroutine=tool_registry["get_property_availability"]
+            ))
+            logger.debug("Added get_property_availability tool")
+        
         # Get court pricing tool
         if "get_court_pricing" in tool_registry:
             tools.append(StructuredTool.from_function(
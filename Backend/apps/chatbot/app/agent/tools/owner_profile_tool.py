@@ -8,7 +8,8 @@ by integrating with the shared owner_service through the sync bridge.
 import logging
 from typing import Dict, Any, Optional
 
-from app.agent.tools.sync_bridge import call_sync_service
+from app.agent.tools.sync_bridge import call_cached_service
+from app.services.catalogue_cache import get_owner_catalogue
 from shared.utils import OwnerContext
 
 logger = logging.getLogger(__name__)
@@ -35,6 +36,13 @@ async def get_owner_profile_tool(owner_profile_id: int) -> Optional[Dict[str, An
     try:
         logger.info(f"Getting owner profile for owner_profile_id={owner_profile_id}")
         
+        # Served from the owner's cached catalogue when available
+        catalogue = await get_owner_catalogue(owner_profile_id)
+        if catalogue is not None:
+            profile = catalogue["profile"]
+            profile["business_name"] = profile["business_name"] or "our facility"
+            return profile
+        
         # Import shared repository
         from shared.repositories import owner_repo
         from sqlalchemy.orm import Session
@@ -54,7 +62,7 @@ async def get_owner_profile_tool(owner_profile_id: int) -> Optional[Dict[str, An
             return {"business_name": "our facility"}  # Default if not found
         
         # Call sync service using the bridge
-        profile_data = await call_sync_service(
+        profile_data = await call_cached_service(
             get_profile_sync,
             db=None,  # Auto-managed by sync bridge
             profile_id=owner_profile_id
@@ -2,56 +2,19 @@
 Pricing tools for the chatbot agent.
 
 This module provides tools for retrieving pricing information for courts
-by integrating with the sync public_service through the sync bridge.
+using the async public service variants.
 """
 
 import logging
 from typing import Dict, Any, Optional
 from datetime import date, time
 
-from app.agent.tools.sync_bridge import call_sync_service
+from app.agent.tools.async_reads import call_async_service
+from shared.services import async_public_service
 
 logger = logging.getLogger(__name__)
 
 
-def _get_management_services():
-    """
-    Dynamically import management services to avoid import conflicts.
-    
-    This function imports the management app services at runtime to prevent
-    conflicts with the chatbot's app.services module.
-    """
-    import sys
-    from pathlib import Path
-    
-    # Add Backend path for shared modules
-    backend_path = Path(__file__).parent.parent.parent.parent.parent.parent
-    if str(backend_path) not in sys.path:
-        sys.path.insert(0, str(backend_path))
-    
-    # Add management app path at the beginning to prioritize it
-    management_path = backend_path / "apps" / "management"
-    if str(management_path) not in sys.path:
-        sys.path.insert(0, str(management_path))
-    
-    # Import services from management app
-    # We need to temporarily remove chatbot path to avoid conflicts
-    chatbot_path = str(Path(__file__).parent.parent.parent.parent.parent)
-    original_path = sys.path.copy()
-    
-    try:
-        # Remove chatbot path temporarily
-        if chatbot_path in sys.path:
-            sys.path.remove(chatbot_path)
-        
-        # Import from management app
-        from app.services import public_service
-        return public_service
-    finally:
-        # Restore original path
-        sys.path = original_path
-
-
 async def get_pricing_tool(
     court_id: int,
     date_val: date
@@ -106,20 +69,16 @@ async def get_pricing_tool(
             f"Getting pricing: court_id={court_id}, date={date_val}"
         )
         
-        # Get management services
-        public_service = _get_management_services()
-        
-        # Call sync service using the bridge
-        result = await call_sync_service(
-            public_service.get_court_pricing_for_date,
-            db=None,  # Auto-managed by sync bridge
+        # Async read on the main database
+        result = await call_async_service(
+            async_public_service.get_court_pricing_for_date,
             court_id=court_id,
             date_val=date_val
         )
         
         # Extract data from response
-        if result.get('success'):
-            pricing_data = result.get('data')
+        if result.success:
+            pricing_data = result.data
             num_rules = len(pricing_data.get('pricing', []))
             logger.info(
                 f"Found {num_rules} pricing rules for court_id={court_id} "
@@ -128,7 +87,7 @@ async def get_pricing_tool(
             return pricing_data
         else:
             logger.warning(
-                f"Failed to get pricing: {result.get('message')} "
+                f"Failed to get pricing: {result.message} "
                 f"(court_id={court_id}, date={date_val})"
             )
             return None
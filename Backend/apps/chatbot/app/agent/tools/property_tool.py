@@ -12,8 +12,12 @@ import logging
 from typing import List, Dict, Any, Optional
 from uuid import UUID
 
-from app.agent.tools.sync_bridge import call_sync_service
+from app.agent.tools.async_reads import call_async_service
+from app.agent.tools.sync_bridge import call_cached_service
+from app.services.catalogue_cache import get_owner_catalogue, get_cached_property_details
+from shared.services import async_public_service
 from shared.utils import OwnerContext
+from shared.utils.response_utils import ServiceResult
 
 logger = logging.getLogger(__name__)
 
@@ -70,23 +74,20 @@ async def search_properties_tool(
         )
         
         # Call sync service using the bridge
-        result = await call_sync_service(
+        result = await call_cached_service(
             property_service.get_owner_properties,
             db=None,  # Auto-managed by sync bridge
             current_owner=owner_context
         )
         
-        # Extract data from JSONResponse
-        # The service returns a JSONResponse, we need to get the body content
-        if hasattr(result, 'body'):
-            import json
-            response_data = json.loads(result.body.decode('utf-8'))
-            if response_data.get('success'):
-                properties = response_data.get('data', [])
+        # Extract data from ServiceResult
+        if isinstance(result, ServiceResult):
+            if result.success:
+                properties = (result.data or [])
                 logger.info(f"Found {len(properties)} properties for owner_profile_id={owner_profile_id}")
                 return properties
             else:
-                logger.warning(f"Property search failed: {response_data.get('message')}")
+                logger.warning(f"Property search failed: {result.message}")
                 return []
         else:
             logger.error(f"Unexpected response type from property service: {type(result)}")
@@ -133,24 +134,22 @@ async def get_property_details_tool(
         )
         
         # Call sync service using the bridge
-        result = await call_sync_service(
+        result = await call_cached_service(
             property_service.get_property_details,
             db=None,
             property_id=property_id,
             current_owner=owner_context
         )
         
-        # Extract data from JSONResponse
-        if hasattr(result, 'body'):
-            import json
-            response_data = json.loads(result.body.decode('utf-8'))
-            if response_data.get('success'):
-                property_data = response_data.get('data')
+        # Extract data from ServiceResult
+        if isinstance(result, ServiceResult):
+            if result.success:
+                property_data = result.data
                 logger.info(f"Retrieved property details for property_id={property_id}")
                 return property_data
             else:
                 logger.warning(
-                    f"Failed to get property details: {response_data.get('message')} "
+                    f"Failed to get property details: {result.message} "
                     f"(property_id={property_id})"
                 )
                 return None
@@ -181,6 +180,11 @@ async def get_owner_properties_tool(owner_profile_id: int) -> List[Dict[str, Any
     try:
         logger.info(f"Getting properties for owner_profile_id={owner_profile_id}")
         
+        # Served from the owner's cached catalogue when available
+        catalogue = await get_owner_catalogue(owner_profile_id)
+        if catalogue is not None:
+            return catalogue["properties"]
+        
         # Import services
         from shared.services import property_service
         
@@ -191,22 +195,20 @@ async def get_owner_properties_tool(owner_profile_id: int) -> List[Dict[str, Any
         )
         
         # Call sync service using the bridge
-        result = await call_sync_service(
+        result = await call_cached_service(
             property_service.get_owner_properties,
             db=None,
             current_owner=owner_context
         )
         
-        # Extract data from JSONResponse
-        if hasattr(result, 'body'):
-            import json
-            response_data = json.loads(result.body.decode('utf-8'))
-            if response_data.get('success'):
-                properties = response_data.get('data', [])
+        # Extract data from ServiceResult
+        if isinstance(result, ServiceResult):
+            if result.success:
+                properties = (result.data or [])
                 logger.info(f"Found {len(properties)} properties for owner_profile_id={owner_profile_id}")
                 return properties
             else:
-                logger.warning(f"Failed to get owner properties: {response_data.get('message')}")
+                logger.warning(f"Failed to get owner properties: {result.message}")
                 return []
         else:
             logger.error(f"Unexpected response type from property service: {type(result)}")
@@ -237,27 +239,25 @@ async def get_property_details_public_tool(property_id: int) -> Optional[Dict[st
     try:
         logger.info(f"Getting public property details: property_id={property_id}")
         
-        # Import public service
-        from shared.services import public_service
+        cached = await get_cached_property_details(property_id)
+        if cached is not None:
+            return cached
         
-        # Call sync service using the bridge
-        result = await call_sync_service(
-            public_service.get_property_details,
-            db=None,  # Auto-managed by sync bridge
+        # Async read on the main database
+        result = await call_async_service(
+            async_public_service.get_property_details,
             property_id=property_id
         )
         
-        # Extract data from JSONResponse
-        if hasattr(result, 'body'):
-            import json
-            response_data = json.loads(result.body.decode('utf-8'))
-            if response_data.get('success'):
-                property_details = response_data.get('data')
+        # Extract data from ServiceResult
+        if isinstance(result, ServiceResult):
+            if result.success:
+                property_details = result.data
                 logger.info(f"Retrieved public property details for property_id={property_id}")
                 return property_details
             else:
                 logger.warning(
-                    f"Failed to get public property details: {response_data.get('message')} "
+                    f"Failed to get public property details: {result.message} "
                     f"(property_id={property_id})"
                 )
                 return None
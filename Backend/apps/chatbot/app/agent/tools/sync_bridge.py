@@ -7,19 +7,23 @@ chatbot uses an async database but needs to integrate with existing sync
 services (property, court, booking, etc.).
 
 The bridge ensures proper session management and thread safety when calling
-sync services from the async agent code.
+sync services from the async agent code. Its pool is sized from settings,
+waiting calls are bounded, and get_executor_stats() reports queue depth,
+wait/run times and per-function counts.
 """
 
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import wraps
-from typing import Callable, TypeVar, Any
+from typing import Callable, Dict, Optional, TypeVar, Any
 from sqlalchemy.orm import Session
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.agent.tools.tool_memo import get_tool_memo, is_missing
 from shared.services import property_service, court_service, booking_service, availability_service
 
 logger = logging.getLogger(__name__)
@@ -44,9 +48,143 @@ SyncSessionLocal = sessionmaker(
     autocommit=False,
 )
 
-# Thread pool executor for running sync operations
-# Using a limited pool size to prevent resource exhaustion
-_executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="sync_bridge")
+class SyncBridgeBusyError(RuntimeError):
+    """Raised when a call is rejected because the sync bridge is saturated."""
+
+
+class SyncBridgeExecutor:
+    """
+    Thread pool for sync calls with a bounded wait queue and metrics.
+    
+    At most `workers` calls run at once; further calls wait in FIFO order on
+    a semaphore rather than in the thread pool's unbounded queue. A call is
+    rejected immediately with SyncBridgeBusyError when `max_queue` calls are
+    already waiting, and after `queue_timeout` seconds without a free worker.
+    
+    Attributes:
+        workers: Worker threads (one sync DB connection each at most)
+        max_queue: Calls allowed to wait for a worker
+        queue_timeout: Seconds a call may wait for a worker
+    """
+    
+    def __init__(self, workers: int, max_queue: int, queue_timeout: float):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sync_bridge")
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.waiting = 0
+        self.running = 0
+        self.max_queue_depth = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.run_seconds_total = 0.0
+        self.run_seconds_max = 0.0
+        self.functions: Dict[str, Dict[str, float]] = {}
+    
+    @property
+    def queue_depth(self) -> int:
+        """Calls waiting because every worker is busy."""
+        return max(0, self.running + self.waiting - self.workers)
+    
+    def _get_slots(self) -> asyncio.Semaphore:
+        # Semaphores belong to one event loop; tests may run several in turn
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.workers)
+        return self._slots
+    
+    async def run(self, func: Callable[[], T], name: str) -> T:
+        """Run a no-argument callable on a worker thread once one is free."""
+        slots = self._get_slots()
+        if self.running + self.waiting >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise SyncBridgeBusyError(
+                f"Sync bridge saturated ({self.running} running, {self.queue_depth} queued); rejected {name}"
+            )
+        
+        queued_at = time.monotonic()
+        self.waiting += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            raise SyncBridgeBusyError(
+                f"No sync bridge worker free after {self.queue_timeout}s; gave up on {name}"
+            )
+        finally:
+            self.waiting -= 1
+        
+        waited = time.monotonic() - queued_at
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        self.running += 1
+        started_at = time.monotonic()
+        loop = asyncio.get_running_loop()
+        
+        def on_done(future: Future) -> None:
+            # Runs on the loop once the thread finished, even if the awaiting
+            # task was cancelled, so the slot is never freed early
+            self.running -= 1
+            slots.release()
+            self._record(name, time.monotonic() - started_at, future)
+        
+        future = self._pool.submit(func)
+        future.add_done_callback(lambda f: loop.call_soon_threadsafe(on_done, f))
+        return await asyncio.wrap_future(future)
+    
+    def _record(self, name: str, run_seconds: float, future: Future) -> None:
+        failed = future.cancelled() or future.exception() is not None
+        if failed:
+            self.failed += 1
+        else:
+            self.completed += 1
+        self.run_seconds_total += run_seconds
+        self.run_seconds_max = max(self.run_seconds_max, run_seconds)
+        
+        entry = self.functions.setdefault(name, {"calls": 0, "errors": 0, "run_seconds_total": 0.0})
+        entry["calls"] += 1
+        entry["errors"] += int(failed)
+        entry["run_seconds_total"] += run_seconds
+    
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of queue depth, timings and per-function counts."""
+        finished = self.completed + self.failed
+        admitted = finished + self.running
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "running": self.running,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "wait_ms_avg": 1000 * self.wait_seconds_total / admitted if admitted else 0.0,
+            "wait_ms_max": 1000 * self.wait_seconds_max,
+            "run_ms_avg": 1000 * self.run_seconds_total / finished if finished else 0.0,
+            "run_ms_max": 1000 * self.run_seconds_max,
+            "functions": {name: dict(entry) for name, entry in self.functions.items()},
+        }
+    
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+# One worker per connection the sync engine may open, unless configured
+_executor = SyncBridgeExecutor(
+    workers=settings.SYNC_BRIDGE_WORKERS or (settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW),
+    max_queue=settings.SYNC_BRIDGE_MAX_QUEUE,
+    queue_timeout=settings.SYNC_BRIDGE_QUEUE_TIMEOUT_SECONDS,
+)
 
 
 def get_sync_db() -> Session:
@@ -86,6 +224,7 @@ async def run_sync_in_executor(
         T: Return value from the sync function
         
     Raises:
+        SyncBridgeBusyError: If no worker became free (see SyncBridgeExecutor)
         Exception: Any exception raised by the sync function
         
     Example:
@@ -100,44 +239,33 @@ async def run_sync_in_executor(
         If the function requires a database session, pass it via kwargs
         using the 'db' parameter. The session will be properly managed.
     """
-    loop = asyncio.get_event_loop()
-    
-    # Check if a database session is needed
+    # A session is only created (and committed/closed) here when requested
+    # with db=None; all of that blocking work happens on the worker thread
     needs_db = 'db' in kwargs and kwargs['db'] is None
-    db_session = None
+    name = getattr(func, "__qualname__", repr(func))
     
-    try:
-        # Create a new sync session if needed
-        if needs_db:
-            db_session = get_sync_db()
-            kwargs['db'] = db_session
-            logger.debug(f"Created sync DB session for {func.__name__}")
-        
-        # Execute the sync function in thread pool
-        logger.debug(f"Executing sync function {func.__name__} in thread pool")
-        result = await loop.run_in_executor(_executor, lambda: func(*args, **kwargs))
+    def call() -> T:
+        if not needs_db:
+            return func(*args, **kwargs)
         
-        # Commit if we created the session
-        if db_session:
+        db_session = get_sync_db()
+        try:
+            result = func(*args, **{**kwargs, 'db': db_session})
             db_session.commit()
-            logger.debug(f"Committed sync DB session for {func.__name__}")
-        
-        return result
-        
-    except Exception as e:
-        # Rollback on error if we created the session
-        if db_session:
+            return result
+        except Exception as e:
             db_session.rollback()
-            logger.error(f"Rolled back sync DB session for {func.__name__}: {e}")
-        
-        logger.error(f"Error executing sync function {func.__name__}: {e}")
-        raise
-        
-    finally:
-        # Clean up session if we created it
-        if db_session:
+            logger.error(f"Rolled back sync DB session for {name}: {e}")
+            raise
+        finally:
             db_session.close()
-            logger.debug(f"Closed sync DB session for {func.__name__}")
+    
+    try:
+        logger.debug(f"Executing sync function {name} in thread pool")
+        return await _executor.run(call, name)
+    except Exception as e:
+        logger.error(f"Error executing sync function {name}: {e}")
+        raise
 
 
 def sync_to_async(func: Callable[..., T]) -> Callable[..., asyncio.Future[T]]:
@@ -204,6 +332,40 @@ async def call_sync_service(
     return await run_sync_in_executor(service_func, *args, **kwargs)
 
 
+async def call_cached_service(
+    service_func: Callable[..., T],
+    *args: Any,
+    **kwargs: Any
+) -> T:
+    """
+    Call a read-only sync service, reusing its result within one graph execution.
+    
+    Same as call_sync_service, but repeat calls with the same arguments during
+    the current graph execution are answered from the execution's ToolMemo
+    instead of the database. Outside a graph execution it simply calls through.
+    Only use for reads; writes must go through call_sync_service.
+    
+    Example:
+        result = await call_cached_service(
+            public_service.get_court_details,
+            db=None,
+            court_id=court_id
+        )
+    """
+    memo = get_tool_memo()
+    if memo is None:
+        return await call_sync_service(service_func, *args, **kwargs)
+    
+    key = memo.key(service_func, args, {k: v for k, v in kwargs.items() if k != 'db'})
+    cached = memo.lookup(key)
+    if not is_missing(cached):
+        return cached
+    
+    result = await call_sync_service(service_func, *args, **kwargs)
+    memo.store(key, result)
+    return result
+
+
 def shutdown_executor():
     """
     Shutdown the thread pool executor.
@@ -212,10 +374,15 @@ def shutdown_executor():
     clean up executor resources.
     """
     logger.info("Shutting down sync bridge executor")
-    _executor.shutdown(wait=True)
+    _executor.shutdown()
     logger.info("Sync bridge executor shut down successfully")
 
 
+def get_executor_stats() -> Dict[str, Any]:
+    """Sync bridge queue depth, wait/run times and per-function call counts."""
+    return _executor.stats()
+
+
 # Context manager for manual session management
 class SyncDBContext:
     """
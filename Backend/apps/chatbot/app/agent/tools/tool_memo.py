@@ -0,0 +1,99 @@
+"""
+Per-execution memo of tool reads.
+
+Within one message the graph often reads the same data more than once: the
+greeting and information nodes both load the owner profile, select_time
+re-fetches slots it just presented, and the information agent may ask for
+the same court's details or pricing twice. GraphRuntime opens a ToolMemo for
+every execution (also exposed as config["configurable"]["tool_memo"]) and
+call_cached_service serves repeat reads with the same arguments from it.
+
+The memo lives in a ContextVar so tools reach it without extra parameters;
+LangGraph runs nodes in tasks that inherit the caller's context. Tools that
+write (create/cancel booking) clear it so later reads in the same turn see
+the change.
+"""
+
+import copy
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class ToolMemo:
+    """Results of service reads made during one graph execution."""
+
+    def __init__(self):
+        self._results: Dict[Tuple[str, str], Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(func: Callable, args: tuple, kwargs: Dict[str, Any]) -> Tuple[str, str]:
+        """Memo key: function path plus a stable rendering of its arguments."""
+        name = f"{func.__module__}.{func.__qualname__}"
+        return name, repr((args, sorted(kwargs.items())))
+
+    def lookup(self, key: Tuple[str, str]) -> Any:
+        """Return a copy of the stored result, or _MISSING."""
+        if key not in self._results:
+            self.misses += 1
+            return _MISSING
+
+        self.hits += 1
+        logger.debug(f"Tool memo hit for {key[0]}")
+        return copy.deepcopy(self._results[key])
+
+    def store(self, key: Tuple[str, str], result: Any) -> None:
+        # Copied so callers mutating their result cannot change the memo
+        self._results[key] = copy.deepcopy(result)
+
+    def clear(self) -> None:
+        """Forget all results, e.g. after a write."""
+        self._results.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Per-execution counters; every hit is a DB round trip saved."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "saved_db_calls": self.hits,
+        }
+
+
+_current_memo: ContextVar[Optional[ToolMemo]] = ContextVar("tool_memo", default=None)
+
+
+def get_tool_memo() -> Optional[ToolMemo]:
+    """Memo of the current graph execution, or None outside one."""
+    return _current_memo.get()
+
+
+@contextmanager
+def tool_memo_scope(memo: ToolMemo) -> Iterator[ToolMemo]:
+    """Make a memo current for the duration of a graph execution."""
+    token = _current_memo.set(memo)
+    try:
+        yield memo
+    finally:
+        try:
+            _current_memo.reset(token)
+        except ValueError:
+            # Streamed runs may be closed from another context
+            _current_memo.set(None)
+
+
+def invalidate_tool_memo() -> None:
+    """Clear the current memo after a write."""
+    memo = get_tool_memo()
+    if memo is not None:
+        memo.clear()
+
+
+def is_missing(value: Any) -> bool:
+    return value is _MISSING
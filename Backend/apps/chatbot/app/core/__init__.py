@@ -9,6 +9,8 @@ from .database import (
     async_engine,
     AsyncSessionLocal,
     get_async_db,
+    main_async_engine,
+    MainAsyncSessionLocal,
     init_db,
     close_db,
 )
@@ -19,6 +21,8 @@ __all__ = [
     "async_engine",
     "AsyncSessionLocal",
     "get_async_db",
+    "main_async_engine",
+    "MainAsyncSessionLocal",
     "init_db",
     "close_db",
 ]
@@ -36,9 +36,29 @@ class Settings(BaseSettings):
     # LLM Provider Selection
     LLM_PROVIDER: str = "openai"  # openai, gemini
     
+    # Shared LLM HTTP client (connection pool reused by all LLM clients)
+    LLM_HTTP_MAX_CONNECTIONS: int = 50
+    LLM_HTTP_MAX_KEEPALIVE: int = 20
+    LLM_HTTP_KEEPALIVE_EXPIRY: float = 60.0
+    LLM_HTTP_TIMEOUT: float = 60.0
+    
     # Session Configuration
     SESSION_EXPIRY_HOURS: int = 24
     
+    # Chat History (messages loaded per turn; chats kept in the in-process cache, 0 disables).
+    # The cache is per process, so only enable it for a single worker or sticky sessions.
+    CHAT_HISTORY_WINDOW: int = 20
+    CHAT_HISTORY_CACHE_CHATS: int = 0
+    
+    # Information answer cache (per owner; 0 entries disables)
+    INFO_CACHE_TTL_SECONDS: int = 900
+    INFO_CACHE_MAX_ENTRIES: int = 2000
+    
+    # Owner catalogue cache (fallback TTL applies while change signals are not received; 0 owners disables)
+    CATALOGUE_CACHE_TTL_SECONDS: int = 300
+    CATALOGUE_CACHE_FALLBACK_TTL_SECONDS: int = 30
+    CATALOGUE_CACHE_MAX_OWNERS: int = 500
+    
     # Logging
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "json"
@@ -49,6 +69,12 @@ class Settings(BaseSettings):
     DB_POOL_TIMEOUT: int = 30
     DB_POOL_RECYCLE: int = 3600
     
+    # Sync bridge thread pool (0 workers = DB_POOL_SIZE + DB_MAX_OVERFLOW; calls beyond
+    # the queue limit or waiting longer than the timeout are rejected)
+    SYNC_BRIDGE_WORKERS: int = 0
+    SYNC_BRIDGE_MAX_QUEUE: int = 100
+    SYNC_BRIDGE_QUEUE_TIMEOUT_SECONDS: float = 10.0
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker
 )
+from sqlalchemy.engine import make_url
 from typing import AsyncGenerator
 import logging
 
@@ -40,6 +41,28 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# Async engine for reads from the main (management) database. Agent tools
+# use it for public catalogue/availability reads; writes still go through
+# the sync services via the sync bridge.
+main_async_engine = create_async_engine(
+    make_url(settings.MAIN_DATABASE_URL).set(drivername="postgresql+asyncpg"),
+    echo=settings.LOG_LEVEL == "DEBUG",
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+)
+
+MainAsyncSessionLocal = async_sessionmaker(
+    bind=main_async_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
+
 async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for getting async database sessions.
@@ -88,4 +111,5 @@ async def close_db():
     properly close all database connections.
     """
     await async_engine.dispose()
+    await main_async_engine.dispose()
     logger.info("Database connections closed")
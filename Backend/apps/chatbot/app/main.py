@@ -10,6 +10,11 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.routers import health, chat
 from app.deps.db import async_engine
+from app.core.database import main_async_engine
+from app.agent.runtime.graph_runtime import init_graph_runtime
+from app.services.llm import close_http_client, clear_langchain_llms
+from app.services.catalogue_cache import catalogue_listener
+from app.agent.tools.sync_bridge import shutdown_executor
 import logging
 
 # Configure logging
@@ -40,6 +45,10 @@ app.include_router(chat.router)
 async def startup_event():
     """Initialize services on startup."""
     logger.info("Starting Chatbot API service...")
+    # Compile the conversation graph once for the whole process
+    init_graph_runtime()
+    # Invalidate cached owner catalogues on change signals from management
+    catalogue_listener.start()
     logger.info("Chatbot API service started successfully")
 
 
@@ -47,5 +56,12 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown."""
     logger.info("Shutting down Chatbot API service...")
+    await catalogue_listener.stop()
     await async_engine.dispose()
+    await main_async_engine.dispose()
+    # Registered LangChain clients hold the shared HTTP client; drop both
+    clear_langchain_llms()
+    await close_http_client()
+    # Let in-flight sync service calls finish, then stop the worker threads
+    shutdown_executor()
     logger.info("Chatbot API service shut down successfully")
@@ -107,6 +107,13 @@ class Chat(Base):
             'last_message_at',
             postgresql_using='btree'
         ),
+        Index(
+            'idx_user_last_message',
+            'user_id',
+            'last_message_at',
+            'id',
+            postgresql_using='btree'
+        ),
         Index(
             'idx_status',
             'status',
@@ -7,13 +7,15 @@ async SQLAlchemy sessions.
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, desc
-from typing import Optional, List
+from sqlalchemy import select, and_, desc, func, true, tuple_
+from sqlalchemy.engine import Row
+from typing import Optional, List, Tuple
 from datetime import datetime, timedelta
 from uuid import UUID
 import logging
 
 from app.models.chat import Chat
+from app.models.message import Message
 
 logger = logging.getLogger(__name__)
 
@@ -163,6 +165,70 @@ class ChatRepository:
         
         return chats
     
+    async def get_user_chat_summaries(
+        self,
+        user_id: int,
+        limit: int = 50,
+        before: Optional[Tuple[datetime, UUID]] = None,
+        preview_chars: int = 100
+    ) -> List[Row]:
+        """
+        Get a page of a user's chats with their latest message, in one query.
+        
+        The latest message comes from a LATERAL subquery per chat (served by
+        idx_chat_created) and only its first characters are fetched. Pages
+        are keyed on (last_message_at, id) via idx_user_last_message, so
+        later pages cost the same as the first.
+        
+        Args:
+            user_id: ID of the user
+            limit: Maximum number of chats to return (default: 50)
+            before: (last_message_at, id) of the last chat of the previous
+                page; only older chats are returned
+            preview_chars: Characters of the latest message to fetch; one
+                more is read so callers can tell whether it was cut
+            
+        Returns:
+            Rows of (id, owner_profile_id, status, last_message_at,
+            last_message_content, last_message_sender) ordered by
+            last_message_at descending; the message columns are None for
+            chats without messages
+        """
+        last_message = (
+            select(
+                func.left(Message.content, preview_chars + 1).label("last_message_content"),
+                Message.sender_type.label("last_message_sender")
+            )
+            .where(Message.chat_id == Chat.id)
+            .order_by(Message.created_at.desc())
+            .limit(1)
+            .lateral("last_message")
+        )
+        
+        query = (
+            select(
+                Chat.id,
+                Chat.owner_profile_id,
+                Chat.status,
+                Chat.last_message_at,
+                last_message.c.last_message_content,
+                last_message.c.last_message_sender
+            )
+            .outerjoin(last_message, true())
+            .where(Chat.user_id == user_id)
+        )
+        if before is not None:
+            query = query.where(tuple_(Chat.last_message_at, Chat.id) < tuple_(*before))
+        
+        result = await self.session.execute(
+            query.order_by(desc(Chat.last_message_at), desc(Chat.id)).limit(limit)
+        )
+        rows = list(result.all())
+        
+        logger.debug(f"Retrieved {len(rows)} chat summaries for user {user_id}")
+        
+        return rows
+    
     async def update(self, chat: Chat, update_data: dict) -> Chat:
         """
         Update chat fields.
@@ -77,29 +77,38 @@ class MessageRepository:
         limit: Optional[int] = None
     ) -> List[Message]:
         """
-        Get all messages for a chat in chronological order.
+        Get messages for a chat in chronological order.
         
         Retrieves message history for display or context building.
-        Messages are ordered by creation time (oldest first).
+        Messages are ordered by creation time (oldest first). With a limit,
+        the most recent `limit` messages are returned: the query walks
+        idx_chat_created backwards and the rows are reversed in Python.
         
         Args:
             chat_id: UUID of the chat
-            limit: Optional maximum number of messages to return
+            limit: Optional maximum number of (most recent) messages to return
             
         Returns:
             List of Message instances in chronological order
         """
-        query = (
-            select(Message)
-            .where(Message.chat_id == chat_id)
-            .order_by(Message.created_at)
-        )
-        
         if limit:
-            query = query.limit(limit)
+            query = (
+                select(Message)
+                .where(Message.chat_id == chat_id)
+                .order_by(Message.created_at.desc())
+                .limit(limit)
+            )
+        else:
+            query = (
+                select(Message)
+                .where(Message.chat_id == chat_id)
+                .order_by(Message.created_at)
+            )
         
         result = await self.session.execute(query)
         messages = list(result.scalars().all())
+        if limit:
+            messages.reverse()
         
         logger.debug(
             f"Retrieved {len(messages)} messages for chat {chat_id}"
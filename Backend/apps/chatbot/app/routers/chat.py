@@ -3,26 +3,33 @@ Chat API router for message handling and chat management.
 
 Endpoints:
 - POST /api/chat/message - Process user messages
+- POST /api/chat/message/stream - Process user messages, streaming progress as SSE
 - GET /api/chat/history/{chat_id} - Get conversation history
 - POST /api/chat/new - Create new chat session
 - GET /api/chat/list - List user's chats
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import Optional
 from uuid import UUID
+import json
 import logging
 
+from app.core.database import AsyncSessionLocal
 from app.deps.db import get_async_db
 from app.repositories.chat_repository import ChatRepository
 from app.repositories.message_repository import MessageRepository
 from app.services.chat_service import ChatService
 from app.services.message_service import MessageService
 from app.services.agent_service import AgentService
-from app.agent.runtime.graph_runtime import GraphRuntime
+from app.services.history_cache import history_cache
+from app.agent.runtime.graph_runtime import get_graph_runtime
 from app.schemas.chat import ChatMessageRequest, ChatMessageResponse, ChatHistoryResponse, ChatCreate, ChatResponse, ChatListResponse, ChatSummary
 from app.core.config import settings
-from app.services.llm import get_llm_provider
+from shared.utils.cursor import decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -49,14 +56,8 @@ async def get_agent_service(
     chat_service: ChatService = Depends(get_chat_service),
     message_service: MessageService = Depends(get_message_service)
 ) -> AgentService:
-    """Get AgentService instance with LLM and graph runtime."""
-    llm_provider = get_llm_provider()
-    graph_runtime = GraphRuntime(
-        llm_provider=llm_provider,
-        chat_service=chat_service,
-        message_service=message_service
-    )
-    return AgentService(db, chat_service, message_service, graph_runtime)
+    """Get AgentService instance backed by the shared graph runtime."""
+    return AgentService(db, chat_service, message_service, get_graph_runtime())
 
 
 @router.post("/message", response_model=ChatMessageResponse)
@@ -72,6 +73,7 @@ async def send_message(
     Flow: Get/create session → Process message → Return response
     """
     logger.info(f"Message from user={request.user_id}, owner={request.owner_profile_id}")
+    chat = None
     
     try:
         # Get or create chat session
@@ -103,18 +105,91 @@ async def send_message(
         
     except ValueError as e:
         logger.error(f"Validation error: {e}")
-        await db.rollback()
+        await _rollback(db, chat)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
         
     except Exception as e:
         logger.error(f"Error processing message: {e}", exc_info=True)
-        await db.rollback()
+        await _rollback(db, chat)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error processing your message. Please try again."
         )
 
 
+async def _rollback(db: AsyncSession, chat) -> None:
+    """Roll back the request and drop cached history that may hold unsaved messages."""
+    await db.rollback()
+    if chat is not None:
+        history_cache.invalidate(chat.id)
+
+
+def _sse(event: str, data: dict) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.post("/message/stream")
+async def stream_message(request: ChatMessageRequest):
+    """
+    Process user message and stream the bot response as server-sent events.
+    
+    Events, in order:
+    - session: {"chat_id", "is_new"}
+    - node: {"node"} as each graph node starts
+    - token: {"node", "content"} for reply tokens from the LLM
+    - message: the final response (same fields as POST /message), sent
+      after the bot message has been committed
+    - error: {"detail"} if processing fails
+    
+    The stream outlives the request's dependencies, so it opens its own
+    database session.
+    """
+    logger.info(f"Streaming message from user={request.user_id}, owner={request.owner_profile_id}")
+    
+    async def event_stream():
+        async with AsyncSessionLocal() as db:
+            chat_service = await get_chat_service(db)
+            message_service = await get_message_service(db)
+            agent_service = AgentService(db, chat_service, message_service, get_graph_runtime())
+            chat = None
+            
+            try:
+                chat, is_new = await chat_service.determine_session(
+                    user_id=request.user_id,
+                    owner_profile_id=request.owner_profile_id
+                )
+                yield _sse("session", {"chat_id": chat.id, "is_new": is_new})
+                
+                async for event in agent_service.stream_message(chat=chat, user_message=request.content):
+                    event_type = event.pop("type")
+                    
+                    if event_type == "message":
+                        # Persist before the client sees the final message
+                        await db.commit()
+                        event = ChatMessageResponse(
+                            chat_id=chat.id,
+                            message_id=event["message_id"],
+                            content=event["content"],
+                            message_type=event["message_type"],
+                            message_metadata=event["metadata"]
+                        ).model_dump(mode="json")
+                        logger.info(f"Streamed message processed successfully, chat_id={chat.id}")
+                    
+                    yield _sse(event_type, event)
+                    
+            except Exception as e:
+                logger.error(f"Error streaming message: {e}", exc_info=True)
+                await _rollback(db, chat)
+                yield _sse("error", {"detail": "Error processing your message. Please try again."})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/history/{chat_id}", response_model=ChatHistoryResponse)
 async def get_chat_history(
     chat_id: UUID,
@@ -202,51 +277,60 @@ async def create_new_chat(
 
 @router.get("/list", response_model=ChatListResponse)
 async def list_user_chats(
-    user_id: UUID,
-    message_service: MessageService = Depends(get_message_service),
+    user_id: int,
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_async_db)
 ):
     """
-    List all chats for a user.
+    List chats for a user.
     
-    Returns chats ordered by most recent activity with message preview.
+    Returns chats ordered by most recent activity with message preview,
+    `limit` at a time. Pass the returned next_cursor to get the next page.
     """
     logger.info(f"Listing chats for user={user_id}")
     
+    before = None
+    if cursor:
+        try:
+            last_message_at, chat_id = decode_cursor(cursor, 2)
+            before = (datetime.fromisoformat(last_message_at), UUID(chat_id))
+        except (ValueError, TypeError, AttributeError):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    
     try:
-        # Get all chats
+        # Chats with their last message in one query; one extra row tells
+        # whether another page follows
         chat_repo = ChatRepository(db)
-        chats = await chat_repo.get_user_chats(user_id)
-        logger.info(f"Found {len(chats)} chats")
+        rows = await chat_repo.get_user_chat_summaries(
+            user_id, limit=limit + 1, before=before, preview_chars=100
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        logger.info(f"Found {len(rows)} chats")
         
         # Build summaries with last message preview
         chat_summaries = []
-        message_repo = MessageRepository(db)
-        
-        for chat in chats:
-            last_message = await message_repo.get_last_message(chat.id)
-            
+        for row in rows:
             # Truncate preview to 100 chars
-            preview = None
-            sender = None
-            if last_message:
-                preview = (
-                    last_message.content[:100] + "..."
-                    if len(last_message.content) > 100
-                    else last_message.content
-                )
-                sender = last_message.sender_type
+            preview = row.last_message_content
+            if preview is not None and len(preview) > 100:
+                preview = preview[:100] + "..."
             
             chat_summaries.append(ChatSummary(
-                chat_id=chat.id,
-                owner_profile_id=chat.owner_profile_id,
-                status=chat.status,
-                last_message_at=chat.last_message_at,
+                chat_id=row.id,
+                owner_profile_id=row.owner_profile_id,
+                status=row.status,
+                last_message_at=row.last_message_at,
                 last_message_preview=preview,
-                last_message_sender=sender
+                last_message_sender=row.last_message_sender
             ))
         
-        return ChatListResponse(chats=chat_summaries)
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_cursor(rows[-1].last_message_at.isoformat(), rows[-1].id)
+        
+        return ChatListResponse(chats=chat_summaries, next_cursor=next_cursor)
         
     except Exception as e:
         logger.error(f"Error listing chats: {e}", exc_info=True)
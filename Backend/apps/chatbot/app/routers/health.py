@@ -4,6 +4,10 @@ Health check endpoint for the chatbot service.
 This module provides comprehensive health checks including:
 - Database connectivity (async Chat_Database)
 - LLM provider availability
+- LLM client registry and connection reuse metrics
+- Owner catalogue, chat history and answer cache metrics
+- Intent fast path hit rate
+- Sync bridge executor metrics
 - Overall service health status
 """
 
@@ -15,7 +19,12 @@ from typing import Dict, Any
 from datetime import datetime
 
 from app.deps.db import get_async_db
-from app.services.llm import get_llm_provider, LLMProviderError
+from app.services.llm import get_llm_provider, get_llm_client_stats, LLMProviderError
+from app.services.catalogue_cache import catalogue_cache
+from app.services.history_cache import history_cache
+from app.services.response_cache import response_cache
+from app.agent.nodes.intent_fast_path import fast_path_stats
+from app.agent.tools.sync_bridge import get_executor_stats
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +67,14 @@ async def health_check(
     llm_status = await _check_llm_provider()
     health_status["checks"]["llm_provider"] = llm_status
     
+    # Connection reuse metrics (informational, does not affect status)
+    health_status["llm_clients"] = get_llm_client_stats()
+    health_status["catalogue_cache"] = catalogue_cache.stats()
+    health_status["history_cache"] = history_cache.stats()
+    health_status["response_cache"] = response_cache.stats()
+    health_status["intent_fast_path"] = fast_path_stats.snapshot()
+    health_status["sync_bridge"] = get_executor_stats()
+    
     # Determine overall health status
     if not db_status["healthy"]:
         health_status["status"] = "unhealthy"
@@ -117,3 +117,4 @@ class ChatSummary(BaseModel):
 class ChatListResponse(BaseModel):
     """Schema for chat list API response."""
     chats: list[ChatSummary] = Field(..., description="List of chat summaries ordered by last_message_at descending")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, None on the last page")
@@ -7,7 +7,16 @@ for chat and message management, following the service layer pattern.
 
 from app.services.chat_service import ChatService
 from app.services.message_service import MessageService
-from app.services.agent_service import AgentService
+
+
+def __getattr__(name):
+    # AgentService pulls in the graph runtime, whose nodes import
+    # app.services.llm; resolving it lazily keeps that import acyclic.
+    if name == "AgentService":
+        from app.services.agent_service import AgentService
+        return AgentService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "ChatService",
@@ -9,7 +9,7 @@ Orchestrates the complete message flow:
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any
 from uuid import UUID
 import logging
 
@@ -75,39 +75,93 @@ class AgentService:
             state = self._prepare_conversation_state(chat=chat, user_message=user_message)
             
             # 3. Run graph (intent detection → handler → response)
-            result = await self.graph_runtime.execute(state)
-            
-            # 4. Update chat state
-            await self.chat_service.update_chat_state(
-                chat=chat,
-                flow_state=result.get("flow_state"),
-                bot_memory=result.get("bot_memory")
+            result = await self.graph_runtime.execute(
+                state,
+                chat_service=self.chat_service,
+                message_service=self.message_service
             )
             
-            # 5. Save bot response
-            bot_message = await self.message_service.create_message(
+            # 4-6. Update chat state, save bot response, return it
+            response = await self._store_result(chat, result)
+            logger.info(f"Message processed successfully for chat {chat_id}")
+            return response
+            
+        except GraphExecutionError as e:
+            logger.error(f"Graph error for chat {chat_id}: {e}", exc_info=True)
+            return await self._store_error(chat_id, "I encountered an error. Please try again.")
+            
+        except Exception as e:
+            logger.error(f"Error processing message for chat {chat_id}: {e}", exc_info=True)
+            return await self._store_error(chat_id, "I'm having trouble right now. Please try again.")
+    
+    async def stream_message(self, chat: Chat, user_message: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process user message, yielding graph progress and reply tokens.
+        
+        Yields the runtime's "node" and "token" events while the graph runs,
+        then persists the final bot message exactly like process_message and
+        yields it last as {"type": "message", ...} with the same fields
+        process_message returns.
+        """
+        chat_id = chat.id
+        logger.info(f"Streaming message for chat {chat_id}")
+        
+        try:
+            await self.message_service.create_message(
                 chat_id=chat_id,
-                sender_type="bot",
-                content=result["response_content"],
-                message_type=result.get("response_type", "text"),
-                metadata=result.get("response_metadata", {}),
-                token_usage=result.get("token_usage")
+                sender_type="user",
+                content=user_message
             )
             
-            # 6. Return response
-            logger.info(f"Message processed successfully for chat {chat_id}")
+            state = self._prepare_conversation_state(chat=chat, user_message=user_message)
             
-            return {
-                "content": result["response_content"],
-                "message_type": result.get("response_type", "text"),
-                "metadata": result.get("response_metadata", {}),
-                "message_id": bot_message.id
-            }
+            result = None
+            async for event in self.graph_runtime.stream(
+                state,
+                chat_service=self.chat_service,
+                message_service=self.message_service
+            ):
+                if event["type"] == "final":
+                    result = event["state"]
+                else:
+                    yield event
             
-        except GraphExecutionError as e:
-            logger.error(f"Graph error for chat {chat_id}: {e}", exc_info=True)
+            response = await self._store_result(chat, result)
+            logger.info(f"Streamed message processed successfully for chat {chat_id}")
             
-            error_message = "I encountered an error. Please try again."
+        except Exception as e:
+            logger.error(f"Error streaming message for chat {chat_id}: {e}", exc_info=True)
+            response = await self._store_error(chat_id, "I'm having trouble right now. Please try again.")
+        
+        yield {"type": "message", **response}
+    
+    async def _store_result(self, chat: Chat, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Persist graph results (chat state + bot message) and build the response."""
+        await self.chat_service.update_chat_state(
+            chat=chat,
+            flow_state=result.get("flow_state"),
+            bot_memory=result.get("bot_memory")
+        )
+        
+        bot_message = await self.message_service.create_message(
+            chat_id=chat.id,
+            sender_type="bot",
+            content=result["response_content"],
+            message_type=result.get("response_type", "text"),
+            metadata=result.get("response_metadata", {}),
+            token_usage=result.get("token_usage")
+        )
+        
+        return {
+            "content": result["response_content"],
+            "message_type": result.get("response_type", "text"),
+            "metadata": result.get("response_metadata", {}),
+            "message_id": bot_message.id
+        }
+    
+    async def _store_error(self, chat_id: UUID, error_message: str) -> Dict[str, Any]:
+        """Persist an error reply for the user and build the response."""
+        try:
             bot_message = await self.message_service.create_message(
                 chat_id=chat_id,
                 sender_type="bot",
@@ -115,37 +169,16 @@ class AgentService:
                 message_type="text",
                 metadata={"error": True}
             )
-            
-            return {
-                "content": error_message,
-                "message_type": "text",
-                "metadata": {"error": True},
-                "message_id": bot_message.id
-            }
-            
-        except Exception as e:
-            logger.error(f"Error processing message for chat {chat_id}: {e}", exc_info=True)
-            
-            error_message = "I'm having trouble right now. Please try again."
-            
-            try:
-                bot_message = await self.message_service.create_message(
-                    chat_id=chat_id,
-                    sender_type="bot",
-                    content=error_message,
-                    message_type="text",
-                    metadata={"error": True}
-                )
-                
-                return {
-                    "content": error_message,
-                    "message_type": "text",
-                    "metadata": {"error": True},
-                    "message_id": bot_message.id
-                }
-            except Exception as store_error:
-                logger.critical(f"Failed to store error message: {store_error}", exc_info=True)
-                raise
+        except Exception as store_error:
+            logger.critical(f"Failed to store error message: {store_error}", exc_info=True)
+            raise
+        
+        return {
+            "content": error_message,
+            "message_type": "text",
+            "metadata": {"error": True},
+            "message_id": bot_message.id
+        }
     
     def _prepare_conversation_state(self, chat: Chat, user_message: str) -> Dict[str, Any]:
         """
@@ -0,0 +1,272 @@
+"""
+Cross-request cache of owners' catalogues.
+
+Every chat of an owner reads the same profile, property list and property
+details (courts, media) over and over; the per-execution tool memo only
+dedupes reads within one message. This cache keeps each owner's catalogue
+(async_public_service.get_owner_catalogue) in process memory, TTL + LRU bounded,
+and the property tools serve from it before touching the database.
+
+Freshness comes from a change signal: the management services send a
+PostgreSQL NOTIFY on CATALOGUE_CHANNEL after every profile, property, court
+or media change, and CatalogueListener drops that owner's entry. While the
+listener is not connected the cache falls back to a short TTL, and it is
+cleared whenever the listener (re)connects since notifications may have been
+missed. Pricing and availability are not part of the catalogue, but the same
+signal is sent on pricing changes and the listener then drops the cached
+pricing indexes (pricing_resolver) too. The owner's cached information
+answers (response_cache) are dropped on the same signal.
+"""
+
+import asyncio
+import copy
+import logging
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.core.database import MainAsyncSessionLocal
+from app.services.response_cache import response_cache
+from shared.services import async_public_service, pricing_resolver
+from shared.utils.catalogue_signal import CATALOGUE_CHANNEL
+from shared.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogueCache:
+    """
+    TTL + LRU cache of owner catalogues keyed by owner profile id.
+
+    Attributes:
+        ttl_seconds: Lifetime of an entry while change signals are received
+        fallback_ttl_seconds: Lifetime of an entry while they are not
+        listening: Whether the change listener is connected
+    """
+
+    def __init__(self, ttl_seconds: int, fallback_ttl_seconds: int, max_owners: int):
+        self.ttl_seconds = ttl_seconds
+        self.fallback_ttl_seconds = fallback_ttl_seconds
+        self.listening = False
+        self._entries: TTLCache[Dict[str, Any]] = TTLCache(max_owners, ttl_seconds)
+        # Property ownership never changes, so the index survives invalidation
+        self._property_owners: Dict[int, int] = {}
+        # Bumped on every invalidation so loads started before it are not stored
+        self._generation = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._entries.enabled
+
+    @property
+    def ttl(self) -> int:
+        """Effective TTL, shorter while change signals may be missed."""
+        return self.ttl_seconds if self.listening else min(self.ttl_seconds, self.fallback_ttl_seconds)
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, owner_profile_id: int) -> Optional[Dict[str, Any]]:
+        """Copy of an owner's cached catalogue, or None."""
+        catalogue = self._entries.get(owner_profile_id, ttl_seconds=self.ttl)
+        return copy.deepcopy(catalogue) if catalogue is not None else None
+
+    def set(self, owner_profile_id: int, catalogue: Dict[str, Any], generation: int) -> None:
+        """Store a catalogue loaded when the cache was at the given generation."""
+        for property_id in catalogue.get("property_details", {}):
+            self._property_owners[property_id] = owner_profile_id
+        for prop in catalogue.get("properties", []):
+            self._property_owners[prop["id"]] = owner_profile_id
+
+        if generation == self._generation:
+            self._entries.set(owner_profile_id, copy.deepcopy(catalogue))
+
+    def owner_of_property(self, property_id: int) -> Optional[int]:
+        """Owner of a property seen in an earlier catalogue, if any."""
+        return self._property_owners.get(property_id)
+
+    def invalidate(self, owner_profile_id: int) -> None:
+        """Drop an owner's catalogue after a change signal."""
+        self._generation += 1
+        self.invalidations += 1
+        self._entries.pop(owner_profile_id)
+
+    def clear(self) -> None:
+        """Drop every catalogue, e.g. when change signals may have been missed."""
+        self._generation += 1
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._entries.stats(),
+            "invalidations": self.invalidations,
+            "listening": self.listening,
+        }
+
+
+catalogue_cache = CatalogueCache(
+    ttl_seconds=settings.CATALOGUE_CACHE_TTL_SECONDS,
+    fallback_ttl_seconds=settings.CATALOGUE_CACHE_FALLBACK_TTL_SECONDS,
+    max_owners=settings.CATALOGUE_CACHE_MAX_OWNERS,
+)
+
+# Loads in flight per owner, so concurrent misses share one query
+_loading: Dict[int, "asyncio.Future"] = {}
+
+
+async def _load_catalogue(owner_profile_id: int) -> Optional[Dict[str, Any]]:
+    generation = catalogue_cache.generation
+    async with MainAsyncSessionLocal() as db:
+        result = await async_public_service.get_owner_catalogue(db, owner_profile_id=owner_profile_id)
+    if not result.success:
+        logger.warning(f"Failed to load catalogue for owner_profile_id={owner_profile_id}: {result.message}")
+        return None
+
+    catalogue_cache.set(owner_profile_id, result.data, generation)
+    return result.data
+
+
+async def get_owner_catalogue(owner_profile_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Owner's catalogue from the cache, loading it on a miss.
+
+    Returns:
+        {"profile", "properties", "property_details"} (a private copy), or
+        None if the owner does not exist, the cache is disabled or the load
+        failed; callers then fall back to their direct queries.
+    """
+    if not catalogue_cache.enabled:
+        return None
+
+    catalogue = catalogue_cache.get(owner_profile_id)
+    if catalogue is not None:
+        return catalogue
+
+    pending = _loading.get(owner_profile_id)
+    if pending is None:
+        pending = asyncio.ensure_future(_load_catalogue(owner_profile_id))
+        _loading[owner_profile_id] = pending
+        pending.add_done_callback(lambda _: _loading.pop(owner_profile_id, None))
+
+    try:
+        catalogue = await asyncio.shield(pending)
+    except Exception as e:
+        logger.error(f"Error loading catalogue for owner_profile_id={owner_profile_id}: {e}", exc_info=True)
+        return None
+
+    return copy.deepcopy(catalogue) if catalogue is not None else None
+
+
+async def get_cached_property_details(property_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Public details of an active property from its owner's catalogue.
+
+    Only properties whose owner's catalogue was loaded before are known;
+    None means "not served from the cache", not "not found".
+    """
+    owner_profile_id = catalogue_cache.owner_of_property(property_id)
+    if owner_profile_id is None:
+        return None
+
+    catalogue = await get_owner_catalogue(owner_profile_id)
+    if catalogue is None:
+        return None
+    return catalogue["property_details"].get(property_id)
+
+
+class CatalogueListener:
+    """
+    Listens for catalogue change signals and invalidates the cache.
+
+    Holds one dedicated asyncpg connection to the main database and
+    reconnects with exponential backoff when it drops.
+    """
+
+    def __init__(self, cache: CatalogueCache, dsn: str, max_backoff_seconds: float = 30.0):
+        self.cache = cache
+        self.dsn = dsn
+        self.max_backoff_seconds = max_backoff_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self.cache.listening = False
+
+    def _on_notification(self, connection, pid, channel, payload) -> None:
+        try:
+            owner_profile_id = int(payload)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring catalogue signal with payload {payload!r}")
+            return
+        logger.debug(f"Catalogue changed for owner_profile_id={owner_profile_id}")
+        self.cache.invalidate(owner_profile_id)
+        response_cache.invalidate_owner(owner_profile_id)
+        # Indexes are keyed by court, not owner; they reload in one query
+        pricing_resolver.clear()
+
+    async def _run(self) -> None:
+        import asyncpg
+
+        backoff = 1.0
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(CATALOGUE_CHANNEL, self._on_notification)
+
+                # Changes made while disconnected were not signalled
+                self.cache.clear()
+                response_cache.clear()
+                pricing_resolver.clear()
+                self.cache.listening = True
+                backoff = 1.0
+                logger.info(f"Listening for catalogue changes on '{CATALOGUE_CHANNEL}'")
+
+                await closed.wait()
+                logger.warning("Catalogue listener connection closed")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Catalogue listener unavailable: {e}")
+            finally:
+                self.cache.listening = False
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.max_backoff_seconds)
+
+
+def _listener_dsn() -> str:
+    """asyncpg DSN for the main database URL (which names a SQLAlchemy driver)."""
+    from sqlalchemy.engine import make_url
+
+    url = make_url(settings.MAIN_DATABASE_URL).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+catalogue_listener = CatalogueListener(catalogue_cache, dsn=_listener_dsn())
+
+
+__all__ = [
+    "CatalogueCache",
+    "CatalogueListener",
+    "catalogue_cache",
+    "catalogue_listener",
+    "get_owner_catalogue",
+    "get_cached_property_details",
+]
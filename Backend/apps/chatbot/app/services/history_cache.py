@@ -0,0 +1,87 @@
+"""
+In-process cache of recent chat history.
+
+Keeps the last CHAT_HISTORY_WINDOW formatted messages ({"role", "content"})
+per chat in a ring buffer so repeat turns in an active conversation skip the
+history query. The buffer is primed by load_chat from the database and then
+kept current by MessageService.create_message.
+
+Messages written by another worker are not seen, so the cache is off by
+default (CHAT_HISTORY_CACHE_CHATS=0) and should only be enabled for a single
+worker or with sticky sessions per chat.
+"""
+
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional
+from uuid import UUID
+import logging
+
+from app.core.config import settings
+from shared.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+def format_message(sender_type: str, content: str) -> Dict[str, str]:
+    """Format a stored message for the LLM (role + content)."""
+    if sender_type == "user":
+        role = "user"
+    elif sender_type == "system":
+        role = "system"
+    else:
+        role = "assistant"
+    return {"role": role, "content": content}
+
+
+class ChatHistoryCache:
+    """
+    LRU map of chat_id -> ring buffer of recent formatted messages.
+    
+    Attributes:
+        window: Messages kept per chat (ring buffer size)
+        max_chats: Chats kept before the least recently used is evicted;
+            0 disables the cache
+    """
+    
+    def __init__(self, window: int, max_chats: int):
+        self.window = window
+        self._chats: TTLCache[Deque[Dict[str, str]]] = TTLCache(max_chats)
+    
+    @property
+    def enabled(self) -> bool:
+        return self._chats.enabled and self.window > 0
+    
+    def get(self, chat_id: UUID, limit: int) -> Optional[List[Dict[str, str]]]:
+        """Return the last `limit` messages, or None if the chat is not cached."""
+        if limit > self.window:
+            return None
+        buffer = self._chats.get(chat_id)
+        return list(buffer)[-limit:] if buffer is not None else None
+    
+    def prime(self, chat_id: UUID, messages: Iterable[Dict[str, str]]) -> None:
+        """Store the most recent messages of a chat loaded from the database."""
+        if self.enabled:
+            self._chats.set(chat_id, deque(messages, maxlen=self.window))
+    
+    def append(self, chat_id: UUID, sender_type: str, content: str) -> None:
+        """Add a newly created message to a cached chat (no-op if not cached)."""
+        buffer = self._chats.peek(chat_id)
+        if buffer is not None:
+            buffer.append(format_message(sender_type, content))
+    
+    def invalidate(self, chat_id: UUID) -> None:
+        """Forget a chat, e.g. after its transaction was rolled back."""
+        self._chats.pop(chat_id)
+    
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters for monitoring."""
+        return self._chats.stats()
+
+
+history_cache = ChatHistoryCache(
+    window=settings.CHAT_HISTORY_WINDOW,
+    max_chats=settings.CHAT_HISTORY_CACHE_CHATS,
+)
+
+
+__all__ = ["ChatHistoryCache", "history_cache", "format_message"]
@@ -21,7 +21,8 @@ from app.services.llm.base import (
 )
 from app.services.llm.openai_provider import OpenAIProvider
 from app.services.llm.gemini_provider import GeminiProvider
-from app.services.llm.langchain_wrapper import create_langchain_llm
+from app.services.llm.langchain_wrapper import create_langchain_llm, clear_langchain_llms, get_llm_client_stats
+from app.services.llm.http_client import close_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +40,9 @@ __all__ = [
     "create_llm_provider",
     "get_llm_provider",
     "create_langchain_llm",
+    "clear_langchain_llms",
+    "get_llm_client_stats",
+    "close_http_client",
 ]
 
 
@@ -0,0 +1,95 @@
+"""
+Shared HTTP client for LLM API calls.
+
+OpenAIProvider and every LangChain ChatOpenAI built by langchain_wrapper send
+their requests through one httpx.AsyncClient, so TLS connections to the API
+are kept alive and reused across turns instead of each client opening its
+own pool. Connection reuse is tracked through httpcore trace events and
+reported by get_http_client_stats().
+
+The client is bound to the event loop that first uses it; close it on
+application shutdown with close_http_client().
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionStats:
+    """Counters for requests sent and connections opened by the shared client."""
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self) -> None:
+        self.requests = 0
+        self.connections_opened = 0
+        self.tls_handshakes = 0
+    
+    async def on_request(self, request: httpx.Request) -> None:
+        """httpx request hook: count the request and attach the trace callback."""
+        self.requests += 1
+        request.extensions["trace"] = self.on_trace
+    
+    async def on_trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        """httpcore trace callback: count new TCP connections and TLS handshakes."""
+        if event_name == "connection.connect_tcp.complete":
+            self.connections_opened += 1
+        elif event_name == "connection.start_tls.complete":
+            self.tls_handshakes += 1
+    
+    def snapshot(self) -> Dict[str, float]:
+        reused = max(self.requests - self.connections_opened, 0)
+        return {
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "tls_handshakes": self.tls_handshakes,
+            "connection_reuse_rate": reused / self.requests if self.requests else 0.0,
+        }
+
+
+connection_stats = ConnectionStats()
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient, creating it on first use."""
+    global _client
+    
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(settings.LLM_HTTP_TIMEOUT, connect=10.0),
+            event_hooks={"request": [connection_stats.on_request]},
+        )
+        logger.info(
+            f"Created shared LLM HTTP client: max_connections={settings.LLM_HTTP_MAX_CONNECTIONS}, "
+            f"max_keepalive={settings.LLM_HTTP_MAX_KEEPALIVE}"
+        )
+    
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client and its pooled connections."""
+    global _client
+    
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+
+
+def get_http_client_stats() -> Dict[str, float]:
+    """Connection reuse metrics for the shared client."""
+    return connection_stats.snapshot()
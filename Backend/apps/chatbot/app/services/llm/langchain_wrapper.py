@@ -4,17 +4,27 @@ LangChain LLM wrapper utility.
 This module provides a utility function to create LangChain ChatOpenAI instances
 from our LLMProvider abstraction. This ensures all nodes use LangChain's ChatOpenAI
 wrapper instead of making direct OpenAI API calls.
+
+Instances are kept in a registry keyed by (model, temperature, max_tokens), so
+each node reuses one client per configuration instead of building a new one
+every turn. All of them share the pooled HTTP client from http_client.
 """
 
 import logging
-from typing import Optional
+import threading
+from typing import Dict, Optional, Tuple
 
 from langchain_openai import ChatOpenAI
 
 from app.services.llm.base import LLMProvider
+from app.services.llm.http_client import get_http_client, get_http_client_stats
 
 logger = logging.getLogger(__name__)
 
+_registry: Dict[Tuple[str, float, int, str], ChatOpenAI] = {}
+_registry_lock = threading.Lock()
+_registry_stats = {"hits": 0, "misses": 0}
+
 
 def create_langchain_llm(
     llm_provider: LLMProvider,
@@ -24,11 +34,12 @@ def create_langchain_llm(
     **kwargs
 ) -> ChatOpenAI:
     """
-    Create a LangChain ChatOpenAI instance from an LLMProvider.
+    Get a LangChain ChatOpenAI instance for an LLMProvider.
     
     This function extracts the necessary configuration from our LLMProvider
-    abstraction and creates a ChatOpenAI instance that can be used with
-    LangChain agents and chains.
+    abstraction and returns a ChatOpenAI instance that can be used with
+    LangChain agents and chains. Instances are shared per (model, temperature,
+    max_tokens); calls passing extra kwargs get a dedicated, uncached instance.
     
     Args:
         llm_provider: The LLMProvider instance containing API key and config
@@ -62,20 +73,57 @@ def create_langchain_llm(
     temp = temperature if temperature is not None else getattr(llm_provider, 'temperature', 0.7)
     max_tok = max_tokens or getattr(llm_provider, 'max_tokens', 500)
     
+    if kwargs:
+        return _build_llm(api_key, model_name, temp, max_tok, **kwargs)
+    
+    # The key is included so providers with different keys never share a client
+    key = (model_name, temp, max_tok, api_key)
+    with _registry_lock:
+        llm = _registry.get(key)
+        if llm is not None:
+            _registry_stats["hits"] += 1
+            return llm
+        
+        _registry_stats["misses"] += 1
+        llm = _build_llm(api_key, model_name, temp, max_tok)
+        _registry[key] = llm
+    
+    return llm
+
+
+def _build_llm(api_key: str, model_name: str, temp: float, max_tok: int, **kwargs) -> ChatOpenAI:
+    """Create a ChatOpenAI instance on the shared HTTP client."""
     logger.info(
         f"Creating LangChain ChatOpenAI instance: "
         f"model={model_name}, temperature={temp}, max_tokens={max_tok}"
     )
     
-    # Create and return ChatOpenAI instance
     llm = ChatOpenAI(
         model=model_name,
         api_key=api_key,
         temperature=temp,
         max_tokens=max_tok,
+        http_async_client=get_http_client(),
         **kwargs
     )
     
     logger.debug("ChatOpenAI instance created successfully")
     
     return llm
+
+
+def clear_langchain_llms() -> None:
+    """Drop every registered ChatOpenAI instance (e.g. after closing the HTTP client)."""
+    with _registry_lock:
+        _registry.clear()
+
+
+def get_llm_client_stats() -> Dict[str, float]:
+    """Registry hit counts and connection reuse metrics for the LLM clients."""
+    with _registry_lock:
+        registry = {
+            "instances": len(_registry),
+            "hits": _registry_stats["hits"],
+            "misses": _registry_stats["misses"],
+        }
+    return {"registry": registry, "http": get_http_client_stats()}
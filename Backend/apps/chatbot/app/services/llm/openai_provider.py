@@ -11,6 +11,7 @@ from typing import Optional, Dict, Any, AsyncIterator
 from openai import AsyncOpenAI, OpenAIError, APIError, RateLimitError, APIConnectionError, AuthenticationError, APITimeoutError
 import tiktoken
 
+from app.services.llm.http_client import get_http_client
 from app.services.llm.base import (
     LLMProvider,
     LLMProviderError,
@@ -59,10 +60,11 @@ class OpenAIProvider(LLMProvider):
         # Store api_key as attribute for LangChain wrapper
         self.api_key = api_key
         
-        # Initialize AsyncOpenAI client with only supported parameters
+        # Initialize AsyncOpenAI client on the shared connection pool
         self.client = AsyncOpenAI(
             api_key=api_key,
-            max_retries=0  # We handle retries ourselves
+            max_retries=0,  # We handle retries ourselves
+            http_client=get_http_client()
         )
         self.model = model
         self.default_max_tokens = max_tokens
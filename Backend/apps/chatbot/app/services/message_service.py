@@ -19,6 +19,7 @@ import logging
 
 from app.repositories.message_repository import MessageRepository
 from app.models.message import Message
+from app.services.history_cache import history_cache
 
 logger = logging.getLogger(__name__)
 
@@ -143,6 +144,7 @@ class MessageService:
         
         # Create message through repository
         message = await self.message_repo.create(message_data)
+        history_cache.append(chat_id, sender_type, content)
         
         logger.info(
             f"Created {sender_type} message: {message.id} "
@@ -160,9 +162,9 @@ class MessageService:
         """
         Retrieve chat message history.
         
-        Returns all messages for a chat in chronological order (oldest first).
-        Useful for displaying conversation history or building context for
-        the LLM.
+        Returns messages for a chat in chronological order (oldest first);
+        with a limit, the most recent `limit` messages. Useful for displaying
+        conversation history or building context for the LLM.
         
         Implements Requirement 17.4-17.5 (chat history endpoint).
         
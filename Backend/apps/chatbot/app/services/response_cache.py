@@ -0,0 +1,122 @@
+"""
+Per-owner cache of information-node answers.
+
+Customers of the same owner ask the same FAQs ("what sports do you have",
+"opening hours", "price of futsal court"). Answers are cached per owner under
+a normalized form of the question (lowercased words, order and filler words
+ignored) plus the selected property/court and the chat context the agent's
+prompt carries, so a repeat question is answered without running the agent.
+Question words ("how much", "what", "which") are part of the key: "how much
+is futsal" and "do you have futsal" are different questions about the same
+sport.
+
+Freshness comes from the catalogue change signal: CatalogueListener drops an
+owner's answers on every property, court, pricing or media change and clears
+the cache when it (re)connects. Answers are only served while the listener
+is connected; a TTL bounds staleness for data outside the catalogue.
+
+Time-dependent or referential questions ("tomorrow", "is it free", "that
+one") are never cached, nor are answers that used the availability tool.
+"""
+
+import re
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+from shared.utils.ttl_cache import TTLCache
+
+
+# Filler words that do not change what is being asked. Question and price
+# words ("how", "much", "what", "which", "cost") are deliberately kept.
+STOPWORDS = frozenset({
+    "a", "about", "am", "an", "and", "any", "are", "at", "be", "can", "could",
+    "do", "does", "for", "from", "give", "hey", "hi", "i", "in", "is",
+    "kindly", "know", "let", "me", "my", "of", "on", "please", "plz",
+    "show", "tell", "the", "there", "to", "u", "want",
+    "would", "you", "your", "yours",
+})
+
+# Words that make an answer depend on the date or on earlier turns
+UNCACHEABLE_PATTERN = re.compile(
+    r"\b(?:today|tonight|tomorrow|yesterday|now|week|weekend|next|this|that|these|those"
+    r"|it|its|them|one|available|availability|free|slots?|book|booked|booking"
+    r"|(?:mon|tues|wednes|thurs|fri|satur|sun)day)\b"
+    r"|\d{1,2}[:/-]\d{1,2}|\d{1,2}\s*(?:am|pm)\b"
+)
+
+# Tools whose results change with bookings rather than catalogue edits
+UNCACHEABLE_TOOLS = frozenset({"get_court_availability", "get_property_availability"})
+
+
+def normalize_query(message: str) -> Optional[str]:
+    """
+    Normalized cache key for a question, or None if it must not be cached.
+
+    Example:
+        >>> normalize_query("What sports do you have?")
+        'have sports what'
+        >>> normalize_query("How much is futsal?")
+        'futsal how much'
+        >>> normalize_query("Is court 2 free tomorrow?") is None
+        True
+    """
+    text = message.lower()
+    if UNCACHEABLE_PATTERN.search(text):
+        return None
+
+    words = sorted({word for word in re.findall(r"[a-z0-9]+", text) if word not in STOPWORDS})
+    return " ".join(words) or None
+
+
+class ResponseCache:
+    """
+    TTL + LRU cache of answers keyed by owner and question.
+
+    Attributes:
+        ttl_seconds: Lifetime of an entry
+        max_entries: Entries kept across all owners; 0 disables the cache
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int):
+        self._entries: TTLCache[Dict[str, Any]] = TTLCache(max_entries, ttl_seconds)
+        # Bumped on every invalidation so answers computed before it are not stored
+        self._generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._entries.enabled
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, owner_profile_id: int, key: Tuple) -> Optional[Dict[str, Any]]:
+        """Cached answer for a question, or None."""
+        return self._entries.get((owner_profile_id,) + key)
+
+    def set(self, owner_profile_id: int, key: Tuple, answer: Dict[str, Any], generation: int) -> None:
+        """Store an answer computed when the cache was at the given generation."""
+        if generation == self._generation:
+            self._entries.set((owner_profile_id,) + key, answer)
+
+    def invalidate_owner(self, owner_profile_id: int) -> None:
+        """Drop every cached answer of an owner after a change signal."""
+        self._generation += 1
+        self._entries.discard_where(lambda entry_key: entry_key[0] == owner_profile_id)
+
+    def clear(self) -> None:
+        """Drop every answer, e.g. when change signals may have been missed."""
+        self._generation += 1
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        return self._entries.stats()
+
+
+response_cache = ResponseCache(
+    ttl_seconds=settings.INFO_CACHE_TTL_SECONDS,
+    max_entries=settings.INFO_CACHE_MAX_ENTRIES,
+)
+
+
+__all__ = ["ResponseCache", "response_cache", "normalize_query", "UNCACHEABLE_TOOLS"]
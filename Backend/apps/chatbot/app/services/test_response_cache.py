@@ -0,0 +1,94 @@
+"""
+Tests for the information answer cache key and entry handling.
+"""
+
+from app.services.response_cache import ResponseCache, normalize_query
+
+
+def test_normalize_query_ignores_order_case_and_filler():
+    assert normalize_query("What sports do you have?") == normalize_query("you have what SPORTS")
+    assert normalize_query("Please tell me what sports you have") == normalize_query("What sports do you have?")
+
+
+def test_normalize_query_keeps_question_and_price_words():
+    price = normalize_query("How much is futsal?")
+    offered = normalize_query("Do you have futsal?")
+
+    assert price != offered
+    assert price != normalize_query("Which futsal courts?")
+    assert normalize_query("What is the price of futsal?") != offered
+
+
+def test_normalize_query_skips_time_dependent_and_referential_questions():
+    assert normalize_query("Is court 2 free tomorrow?") is None
+    assert normalize_query("How much is that one?") is None
+    assert normalize_query("Anything at 6pm?") is None
+    assert normalize_query("?!") is None
+
+
+def test_cache_drops_owner_entries_on_change_signal():
+    cache = ResponseCache(ttl_seconds=60, max_entries=10)
+    key = (normalize_query("How much is futsal?"), None, None)
+
+    assert cache.get(1, key) is None
+    cache.set(1, key, {"output": "Rs 3000 per hour"}, cache.generation)
+    cache.set(2, key, {"output": "Rs 2500 per hour"}, cache.generation)
+    assert cache.get(1, key) == {"output": "Rs 3000 per hour"}
+
+    cache.invalidate_owner(1)
+
+    assert cache.get(1, key) is None
+    assert cache.get(2, key) == {"output": "Rs 2500 per hour"}
+
+
+def test_cache_skips_answers_computed_before_a_change_signal():
+    cache = ResponseCache(ttl_seconds=60, max_entries=10)
+    key = (normalize_query("How much is futsal?"), None, None)
+
+    generation = cache.generation
+    cache.invalidate_owner(1)
+    cache.set(1, key, {"output": "stale"}, generation)
+
+    assert cache.get(1, key) is None
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ResponseCache(ttl_seconds=60, max_entries=2)
+    for query in ("a", "b"):
+        cache.set(1, (query,), {"output": query}, cache.generation)
+
+    cache.get(1, ("a",))
+    cache.set(1, ("c",), {"output": "c"}, cache.generation)
+
+    assert cache.get(1, ("b",)) is None
+    assert cache.get(1, ("a",)) == {"output": "a"}
+
+
+def test_cache_key_includes_chat_context_from_the_prompt():
+    from app.agent.nodes.information import _response_cache_key
+
+    flow_state = {"property_id": None, "court_id": None}
+    fresh = _response_cache_key("What are your prices?", flow_state, {})
+    after_search = _response_cache_key(
+        "What are your prices?",
+        flow_state,
+        {"context": {"last_search_results": ["4", "9"]}, "user_preferences": {"preferred_sport": "futsal"}},
+    )
+    prefers_padel = _response_cache_key(
+        "What are your prices?", flow_state, {"user_preferences": {"preferred_sport": "padel"}}
+    )
+
+    assert len({fresh, after_search, prefers_padel}) == 3
+    assert fresh == _response_cache_key("what are your prices", flow_state, {"context": {}, "user_preferences": {}})
+
+
+def test_catalogue_signal_drops_owner_answers(monkeypatch):
+    from app.services import catalogue_cache as catalogue_module
+
+    cache = ResponseCache(ttl_seconds=60, max_entries=10)
+    monkeypatch.setattr(catalogue_module, "response_cache", cache)
+    cache.set(3, ("prices what",), {"output": "Rs 3000"}, cache.generation)
+
+    catalogue_module.catalogue_listener._on_notification(None, 1, "owner_catalogue_changed", "3")
+
+    assert cache.get(3, ("prices what",)) is None
@@ -30,6 +30,22 @@ class Settings(BaseSettings):
     cloudinary_cloud_name: str
     cloudinary_api_key: str
     cloudinary_api_secret: str
+    
+    # Media storage ("cloudinary", or "local" for offline development and tests)
+    storage_backend: str = "cloudinary"
+    local_storage_dir: str = str(Path(__file__).resolve().parent.parent.parent / "media_uploads")
+    local_storage_url: str = "/media"
+    upload_max_workers: int = 4
+    upload_chunk_size: int = 20_000_000
+    batch_upload_max_files: int = 10
+    batch_upload_concurrency: int = 3
+
+    # bcrypt hashing pool (0 = one worker per CPU core)
+    password_hash_workers: int = 0
+
+    # Authenticated principals reused across requests (0 entries = disabled)
+    principal_cache_ttl_seconds: int = 60
+    principal_cache_max_entries: int = 10_000
 
 
 @lru_cache()
@@ -7,16 +7,15 @@ from typing import Optional
 from app.core.config import get_settings
 from app.deps.db import get_db
 from app.repositories import users_repo
+from app.services.principal_cache import Principal, principal_cache
 from shared.utils import OwnerContext
 from shared.models import UserRole
 
 settings = get_settings()
 
 
-def get_current_user(authorization: Optional[str] = Header(None), db: Session = Depends(get_db)):
-    """
-    Dependency: verifies JWT and returns the current user (any role).
-    """
+def _decode_bearer(authorization: Optional[str]) -> dict:
+    """Verify the bearer token and return its claims."""
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing or invalid authorization header")
     
@@ -24,19 +23,53 @@ def get_current_user(authorization: Optional[str] = Header(None), db: Session =
     
     try:
         payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
-        user_id: str = payload.get("sub")
-        if not user_id:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
     except ExpiredSignatureError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token expired")
     except InvalidTokenError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate token")
 
-    user = users_repo.get_by_id(db, int(user_id))
+    if not payload.get("sub") or payload.get("typ", "access") != "access":
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+    return payload
+
+
+def _resolve_principal(db: Session, payload: dict) -> Principal:
+    """
+    Principal of a verified token, from the principal cache when possible.
+
+    On a miss the user row is loaded and the token's version checked against
+    it, so tokens issued before a revocation are rejected.
+    """
+    user_id = int(payload["sub"])
+    token_version = payload.get("tv", 0)
+
+    principal = principal_cache.get(user_id, token_version)
+    if principal:
+        return principal
+
+    user = users_repo.get_by_id(db, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    if user.token_version != token_version:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked")
 
-    return user
+    principal = Principal(
+        id=user.id,
+        email=user.email,
+        Name=user.Name,
+        role=user.role,
+        token_version=user.token_version,
+    )
+    principal_cache.set(principal)
+    return principal
+
+
+def get_current_user(authorization: Optional[str] = Header(None), db: Session = Depends(get_db)):
+    """
+    Dependency: verifies JWT and returns the current user (any role).
+    Returns a Principal, served from the principal cache for repeat requests.
+    """
+    return _resolve_principal(db, _decode_bearer(authorization))
 
 
 def get_current_customer(current_user = Depends(get_current_user)):
@@ -53,34 +86,19 @@ def get_current_owner(authorization: Optional[str] = Header(None), db: Session =
     Dependency: ensures the current user is an owner and returns OwnerContext.
     OwnerContext contains user_id and owner_profile_id from token.
     """
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing or invalid authorization header")
+    payload = _decode_bearer(authorization)
+    owner_profile_id = payload.get("owner_profile_id")
+
+    # Verify user is an owner (role from the principal, so role changes apply)
+    principal = _resolve_principal(db, payload)
+    if principal.role != UserRole.owner:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Property owners only")
     
-    token = authorization.replace("Bearer ", "")
+    # owner_profile_id should always exist (created on signup)
+    if not owner_profile_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Owner profile not found")
     
-    try:
-        payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
-        user_id = payload.get("sub")
-        role = payload.get("role")
-        owner_profile_id = payload.get("owner_profile_id")
-        
-        if not user_id:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-        
-        # Verify user is an owner
-        if role != UserRole.owner.value:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Property owners only")
-        
-        # owner_profile_id should always exist (created on signup)
-        if not owner_profile_id:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Owner profile not found")
-        
-        return OwnerContext(user_id=int(user_id), owner_profile_id=owner_profile_id)
-        
-    except ExpiredSignatureError:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token expired")
-    except InvalidTokenError:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate token")
+    return OwnerContext(user_id=principal.id, owner_profile_id=owner_profile_id)
 
 
 def get_current_admin(current_user = Depends(get_current_user)):
@@ -8,7 +8,11 @@ sys.path.insert(0, str(backend_dir))
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
+from app.core.config import get_settings
 from app.routers import health, auth, properties, courts, pricing, availability, media, public, bookings, owner
+from app.services.storage.executor import shutdown_executor
+from app.services.auth_service import shutdown_hash_executor
 
 app = FastAPI(title="Management API")
 
@@ -31,3 +35,15 @@ app.include_router(media.router, prefix="/api")
 app.include_router(public.router, prefix="/api")
 app.include_router(bookings.router, prefix="/api")
 app.include_router(owner.router, prefix="/api")
+
+# Serve files written by the local storage backend
+settings = get_settings()
+if settings.storage_backend == "local":
+    Path(settings.local_storage_dir).mkdir(parents=True, exist_ok=True)
+    app.mount(settings.local_storage_url, StaticFiles(directory=settings.local_storage_dir), name="media")
+
+
+@app.on_event("shutdown")
+def shutdown():
+    shutdown_executor(wait=True)
+    shutdown_hash_executor(wait=True)
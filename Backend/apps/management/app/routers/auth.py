@@ -9,14 +9,14 @@ router = APIRouter()
 
 
 @router.post("/signup", status_code=status.HTTP_200_OK)
-async def signup(
+def signup(
     payload: schemas.UserCreate,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """Create account and send OTP."""
     try:
-        return await auth_service.signup(
+        return auth_service.signup(
             db,
             email=payload.email,
             password=payload.password,
@@ -29,65 +29,65 @@ async def signup(
 
 
 @router.post("/request-code", status_code=status.HTTP_200_OK)
-async def request_code(
+def request_code(
     payload: schemas.RequestCodeIn,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """Resend OTP."""
     try:
-        return await auth_service.request_code(db, email=payload.email, background_tasks=background_tasks)
+        return auth_service.request_code(db, email=payload.email, background_tasks=background_tasks)
     except Exception as e:
         return make_response(False, "Could not send code", status_code=500, error=str(e))
 
 
 @router.post("/verify-code", status_code=status.HTTP_200_OK)
-async def verify_code(
+def verify_code(
     payload: schemas.VerifyCodeIn,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """Verify OTP."""
     try:
-        return await auth_service.verify_code(db, email=payload.email, code=payload.code, background_tasks=background_tasks)
+        return auth_service.verify_code(db, email=payload.email, code=payload.code, background_tasks=background_tasks)
     except Exception as e:
         return make_response(False, "Could not verify code", status_code=500, error=str(e))
 
 
 @router.post("/login/password", status_code=status.HTTP_200_OK)
-async def login_password(
+def login_password(
     payload: schemas.LoginPasswordIn,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """Password login."""
     try:
-        return await auth_service.login_password(db, email=payload.email, password=payload.password, background_tasks=background_tasks)
+        return auth_service.login_password(db, email=payload.email, password=payload.password, background_tasks=background_tasks)
     except Exception as e:
         return make_response(False, "Login failed", status_code=500, error=str(e))
 
 
 @router.post("/login/request-code", status_code=status.HTTP_200_OK)
-async def login_request_code(
+def login_request_code(
     payload: schemas.RequestCodeIn,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """Send login code."""
     try:
-        return await auth_service.login_send_code(db, email=payload.email, background_tasks=background_tasks)
+        return auth_service.login_send_code(db, email=payload.email, background_tasks=background_tasks)
     except Exception as e:
         return make_response(False, "Could not send login code", status_code=500, error=str(e))
 
 
 @router.post("/login/verify-code", status_code=status.HTTP_200_OK)
-async def login_verify_code(
+def login_verify_code(
     payload: schemas.VerifyCodeIn,
     db: Session = Depends(get_db)
 ):
     """Verify login code."""
     try:
-        return await auth_service.login_verify_code(db, email=payload.email, code=payload.code)
+        return auth_service.login_verify_code(db, email=payload.email, code=payload.code)
     except Exception as e:
         return make_response(False, "Could not verify code", status_code=500, error=str(e))
 
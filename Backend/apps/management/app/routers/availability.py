@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.deps.db import get_db
 from app.deps.auth import get_current_owner
 from shared.services import availability_service
+from shared.utils.response_utils import to_response
 from shared.utils import OwnerContext
 from shared.schemas.availability import CourtAvailabilityCreate
 from datetime import date
@@ -19,7 +20,7 @@ def block_time_slot(
     current_owner: OwnerContext = Depends(get_current_owner)
 ):
     """Block a time slot for court (Owner only)"""
-    return availability_service.block_time_slot(db, court_id=court_id, current_owner=current_owner, data=payload)
+    return to_response(availability_service.block_time_slot(db, court_id=court_id, current_owner=current_owner, data=payload))
 
 
 @router.get("/courts/{court_id}/availability")
@@ -30,7 +31,7 @@ def list_blocked_slots(
     current_owner: OwnerContext = Depends(get_current_owner)
 ):
     """List all blocked slots for a court"""
-    return availability_service.get_blocked_slots(db, court_id=court_id, current_owner=current_owner, from_date=from_date)
+    return to_response(availability_service.get_blocked_slots(db, court_id=court_id, current_owner=current_owner, from_date=from_date))
 
 
 @router.delete("/availability/{availability_id}")
@@ -40,4 +41,4 @@ def unblock_time_slot(
     current_owner: OwnerContext = Depends(get_current_owner)
 ):
     """Unblock a time slot"""
-    return availability_service.unblock_time_slot(db, availability_id=availability_id, current_owner=current_owner)
+    return to_response(availability_service.unblock_time_slot(db, availability_id=availability_id, current_owner=current_owner))
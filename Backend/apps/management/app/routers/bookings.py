@@ -1,11 +1,15 @@
-from fastapi import APIRouter, Depends, status
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 from app.deps.db import get_db
 from app.deps.auth import get_current_user, get_current_customer, get_current_owner
 from app.services import booking_service
+from app.services.principal_cache import Principal
+from shared.utils.response_utils import to_response
 from shared.utils import OwnerContext
 from shared.schemas.booking import BookingCreate
-from shared.models import User, UserRole
+from shared.models import BookingStatus, UserRole
 
 router = APIRouter(prefix="/bookings", tags=["Bookings"])
 
@@ -14,48 +18,74 @@ router = APIRouter(prefix="/bookings", tags=["Bookings"])
 def create_booking(
     payload: BookingCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_customer)
+    current_user: Principal = Depends(get_current_customer)
 ):
     """Create a new booking (Customer only)"""
-    return booking_service.create_booking(db, customer_id=current_user.id, data=payload)
+    return to_response(booking_service.create_booking(db, customer_id=current_user.id, data=payload))
 
 
 @router.get("")
 def list_my_bookings(
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None,
+    booking_status: Optional[BookingStatus] = Query(None, alias="status"),
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
-    """List bookings for current user (Customer view)"""
-    return booking_service.get_user_bookings(db, user_id=current_user.id)
+    """List bookings for current user (Customer view), a page at a time via next_cursor"""
+    return to_response(booking_service.get_user_bookings(
+        db,
+        user_id=current_user.id,
+        limit=limit,
+        cursor=cursor,
+        status=booking_status,
+        from_date=from_date,
+        to_date=to_date
+    ))
 
 
 @router.get("/owner")
 def list_owner_bookings(
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None,
+    booking_status: Optional[BookingStatus] = Query(None, alias="status"),
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
     db: Session = Depends(get_db),
     current_owner: OwnerContext = Depends(get_current_owner)
 ):
-    """List bookings for owner's properties (Owner only)"""
-    return booking_service.get_owner_bookings(db, current_owner=current_owner)
+    """List bookings for owner's properties (Owner only), a page at a time via next_cursor"""
+    return to_response(booking_service.get_owner_bookings(
+        db,
+        current_owner=current_owner,
+        limit=limit,
+        cursor=cursor,
+        status=booking_status,
+        from_date=from_date,
+        to_date=to_date
+    ))
 
 
 @router.get("/{booking_id}")
 def get_booking(
     booking_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """Get booking details (Customer or Owner)"""
-    return booking_service.get_booking_details(db, booking_id=booking_id, user_id=current_user.id)
+    return to_response(booking_service.get_booking_details(db, booking_id=booking_id, user_id=current_user.id))
 
 
 @router.patch("/{booking_id}/cancel")
 def cancel_booking(
     booking_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_customer)
+    current_user: Principal = Depends(get_current_customer)
 ):
     """Cancel booking (Customer only)"""
-    return booking_service.cancel_booking(db, booking_id=booking_id, user_id=current_user.id)
+    return to_response(booking_service.cancel_booking(db, booking_id=booking_id, user_id=current_user.id))
 
 
 
@@ -66,7 +96,7 @@ def confirm_booking(
     current_owner: OwnerContext = Depends(get_current_owner)
 ):
     """Confirm booking (Owner only)"""
-    return booking_service.confirm_booking(db, booking_id=booking_id, current_owner=current_owner)
+    return to_response(booking_service.confirm_booking(db, booking_id=booking_id, current_owner=current_owner))
 
 
 @router.patch("/{booking_id}/complete")
@@ -76,4 +106,4 @@ def complete_booking(
     current_owner: OwnerContext = Depends(get_current_owner)
 ):
     """Mark booking as completed (Owner only)"""
-    return booking_service.complete_booking(db, booking_id=booking_id, current_owner=current_owner)
+    return to_response(booking_service.complete_booking(db, booking_id=booking_id, current_owner=current_owner))
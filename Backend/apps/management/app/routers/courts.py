@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.deps.db import get_db
 from app.deps.auth import get_current_owner
 from shared.services import court_service
+from shared.utils.response_utils import to_response
 from shared.utils import OwnerContext
 from shared.schemas.court import CourtCreate, CourtUpdate
 
@@ -17,7 +18,7 @@ def create_court(
     current_owner: OwnerContext = Depends(get_current_owner)
 ):
     """Create a new court for property (Owner only)"""
-    return court_service.create_court(db, property_id=property_id, current_owner=current_owner, data=payload)
+    return to_response(court_service.create_court(db, property_id=property_id, current_owner=current_owner, data=payload))
 
 
 @router.get("/properties/{property_id}/courts")
@@ -27,7 +28,7 @@ def list_courts(
     current_owner: OwnerContext = Depends(get_current_owner)
 ):
     """List all courts for a property"""
-    return court_service.get_property_courts(db, property_id=property_id, current_owner=current_owner)
+    return to_response(court_service.get_property_courts(db, property_id=property_id, current_owner=current_owner))
 
 
 @router.get("/courts/{court_id}")
@@ -37,7 +38,7 @@ def get_court(
     current_owner: OwnerContext = Depends(get_current_owner)
 ):
     """Get court details"""
-    return court_service.get_court_details(db, court_id=court_id, current_owner=current_owner)
+    return to_response(court_service.get_court_details(db, court_id=court_id, current_owner=current_owner))
 
 
 @router.patch("/courts/{court_id}")
@@ -48,7 +49,7 @@ def update_court(
     current_owner: OwnerContext = Depends(get_current_owner)
 ):
     """Update court"""
-    return court_service.update_court(db, court_id=court_id, current_owner=current_owner, data=payload)
+    return to_response(court_service.update_court(db, court_id=court_id, current_owner=current_owner, data=payload))
 
 
 @router.delete("/courts/{court_id}")
@@ -58,4 +59,4 @@ def delete_court(
     current_owner: OwnerContext = Depends(get_current_owner)
 ):
     """Delete court"""
-    return court_service.delete_court(db, court_id=court_id, current_owner=current_owner)
+    return to_response(court_service.delete_court(db, court_id=court_id, current_owner=current_owner))
@@ -1,7 +1,9 @@
 from fastapi import APIRouter
 
+from app.services.principal_cache import principal_cache
+
 router = APIRouter()
 
 @router.get("/health")
 async def health_check():
-    return {"status": "healthy", "service": "management"}
+    return {"status": "healthy", "service": "management", "principal_cache": principal_cache.stats()}
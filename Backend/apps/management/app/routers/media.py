@@ -5,7 +5,7 @@ from app.deps.auth import get_current_owner
 from app.services import media_service
 from shared.utils import OwnerContext
 from shared.schemas.media import CourtMediaCreate, CourtMediaUpdate, MediaTypeEnum
-from typing import Optional
+from typing import List, Optional
 
 router = APIRouter(tags=["Media"])
 
@@ -60,6 +60,45 @@ async def upload_court_media(
     )
 
 
+@router.post("/properties/{property_id}/media/batch", status_code=status.HTTP_201_CREATED)
+async def upload_property_media_batch(
+    property_id: int,
+    files: List[UploadFile] = File(...),
+    caption: Optional[str] = Form(None),
+    display_order: int = Form(0),
+    db: Session = Depends(get_db),
+    current_owner: OwnerContext = Depends(get_current_owner)
+):
+    """Upload several media files for property at once (Owner only)"""
+    return await media_service.upload_property_media_batch(
+        db,
+        property_id=property_id,
+        current_owner=current_owner,
+        files=files,
+        caption=caption,
+        display_order=display_order
+    )
+
+
+@router.post("/courts/{court_id}/media/batch", status_code=status.HTTP_201_CREATED)
+async def upload_court_media_batch(
+    court_id: int,
+    files: List[UploadFile] = File(...),
+    caption: Optional[str] = Form(None),
+    display_order: int = Form(0),
+    db: Session = Depends(get_db),
+    current_owner: OwnerContext = Depends(get_current_owner)
+):
+    """Upload several media files for court at once (Owner only)"""
+    return await media_service.upload_court_media_batch(
+        db,
+        court_id=court_id,
+        current_owner=current_owner,
+        files=files,
+        caption=caption,
+        display_order=display_order
+    )
+
 
 @router.get("/properties/{property_id}/media")
 def list_property_media(
@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 from app.deps.db import get_db
 from app.deps.auth import get_current_owner
 from shared.services import owner_service
+from shared.utils.response_utils import to_response
 from shared.utils import OwnerContext
 from shared.schemas.owner import OwnerProfileCreate, OwnerProfileUpdate
+from typing import Optional
+from datetime import date
 
 router = APIRouter(prefix="/owner", tags=["Owner"])
 
@@ -16,7 +19,7 @@ def create_or_update_profile(
     current_owner: OwnerContext = Depends(get_current_owner)
 ):
     """Update owner profile (Owner only)"""
-    return owner_service.create_or_update_profile(db, current_owner=current_owner, data=payload)
+    return to_response(owner_service.create_or_update_profile(db, current_owner=current_owner, data=payload))
 
 
 @router.get("/profile")
@@ -25,11 +28,13 @@ def get_profile(
     current_owner: OwnerContext = Depends(get_current_owner)
 ):
     """Get owner profile (Owner only)"""
-    return owner_service.get_profile(db, current_owner=current_owner)
+    return to_response(owner_service.get_profile(db, current_owner=current_owner))
 
 
 @router.get("/dashboard")
 def get_dashboard(
+    from_date: Optional[date] = Query(None, description="Only count bookings on or after this date (YYYY-MM-DD)"),
+    to_date: Optional[date] = Query(None, description="Only count bookings on or before this date (YYYY-MM-DD)"),
     db: Session = Depends(get_db),
     current_owner: OwnerContext = Depends(get_current_owner)
 ):
@@ -42,5 +47,9 @@ def get_dashboard(
     - Revenue statistics
     - Revenue by property
     - Recent bookings
+    
+    Optional from_date/to_date limit every figure to bookings in that date range.
     """
-    return owner_service.get_dashboard_stats(db, current_owner=current_owner)
+    return to_response(
+        owner_service.get_dashboard_stats(db, current_owner=current_owner, from_date=from_date, to_date=to_date)
+    )
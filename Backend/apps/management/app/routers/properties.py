@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.deps.db import get_db
 from app.deps.auth import get_current_owner
 from shared.services import property_service
+from shared.utils.response_utils import to_response
 from shared.utils import OwnerContext
 from shared.schemas.property import PropertyCreate, PropertyUpdate
 
@@ -16,7 +17,7 @@ def create_property(
     current_owner: OwnerContext = Depends(get_current_owner)
 ):
     """Create a new property (Owner only)"""
-    return property_service.create_property(db, current_owner=current_owner, data=payload)
+    return to_response(property_service.create_property(db, current_owner=current_owner, data=payload))
 
 
 @router.get("")
@@ -25,7 +26,7 @@ def list_properties(
     current_owner: OwnerContext = Depends(get_current_owner)
 ):
     """List all properties owned by current user"""
-    return property_service.get_owner_properties(db, current_owner=current_owner)
+    return to_response(property_service.get_owner_properties(db, current_owner=current_owner))
 
 
 @router.get("/{property_id}")
@@ -35,7 +36,7 @@ def get_property(
     current_owner: OwnerContext = Depends(get_current_owner)
 ):
     """Get property details with courts"""
-    return property_service.get_property_details(db, property_id=property_id, current_owner=current_owner)
+    return to_response(property_service.get_property_details(db, property_id=property_id, current_owner=current_owner))
 
 
 @router.patch("/{property_id}")
@@ -46,7 +47,7 @@ def update_property(
     current_owner: OwnerContext = Depends(get_current_owner)
 ):
     """Update property"""
-    return property_service.update_property(db, property_id=property_id, current_owner=current_owner, data=payload)
+    return to_response(property_service.update_property(db, property_id=property_id, current_owner=current_owner, data=payload))
 
 
 @router.delete("/{property_id}")
@@ -56,4 +57,4 @@ def delete_property(
     current_owner: OwnerContext = Depends(get_current_owner)
 ):
     """Delete property"""
-    return property_service.delete_property(db, property_id=property_id, current_owner=current_owner)
+    return to_response(property_service.delete_property(db, property_id=property_id, current_owner=current_owner))
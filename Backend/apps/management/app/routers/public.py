@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from app.deps.db import get_db
 from shared.services import public_service
+from shared.utils.response_utils import to_response
 from typing import Optional
 from datetime import date
 
@@ -10,6 +11,7 @@ router = APIRouter(prefix="/public", tags=["Public"])
 
 @router.get("/properties")
 def search_properties(
+    q: Optional[str] = Query(None, description="Search property names (typo tolerant) and cities"),
     city: Optional[str] = Query(None, description="Filter by city"),
     sport_type: Optional[str] = Query(None, description="Filter by sport type"),
     min_price: Optional[float] = Query(None, ge=0, description="Minimum price per hour"),
@@ -22,20 +24,22 @@ def search_properties(
     Search and filter properties (Public endpoint)
     
     Filters:
+    - q: Free-text search; results are ranked by closeness of the match
     - city: Filter by city name
-    - sport_type: Filter by sport type (futsal, padel, cricket, etc.)
+    - sport_type: Filter by sport type (futsal, padel, cricket, etc.; spelling variants such as "5-a-side" or "ping pong" are matched)
     - min_price/max_price: Filter by price range
     - page/limit: Pagination
     """
-    return public_service.search_properties(
+    return to_response(public_service.search_properties(
         db,
+        q=q,
         city=city,
         sport_type=sport_type,
         min_price=min_price,
         max_price=max_price,
         page=page,
         limit=limit
-    )
+    ))
 
 
 @router.get("/properties/{property_id}")
@@ -44,7 +48,7 @@ def get_property_details(
     db: Session = Depends(get_db)
 ):
     """Get property details with courts and media (Public endpoint)"""
-    return public_service.get_property_details(db, property_id=property_id)
+    return to_response(public_service.get_property_details(db, property_id=property_id))
 
 
 @router.get("/courts/{court_id}")
@@ -53,7 +57,7 @@ def get_court_details(
     db: Session = Depends(get_db)
 ):
     """Get court details with pricing and media (Public endpoint)"""
-    return public_service.get_court_details(db, court_id=court_id)
+    return to_response(public_service.get_court_details(db, court_id=court_id))
 
 
 @router.get("/courts/{court_id}/pricing")
@@ -63,13 +67,14 @@ def get_court_pricing_for_date(
     db: Session = Depends(get_db)
 ):
     """Get pricing for a specific court and date (Public endpoint)"""
-    return public_service.get_court_pricing_for_date(db, court_id=court_id, date_val=date)
+    return to_response(public_service.get_court_pricing_for_date(db, court_id=court_id, date_val=date))
 
 
 @router.get("/courts/{court_id}/available-slots")
 def get_available_slots(
     court_id: int,
     date: date = Query(..., description="Date to check availability (YYYY-MM-DD)"),
+    slot_minutes: int = Query(60, description="Slot length in minutes (30, 60 or 90)"),
     db: Session = Depends(get_db)
 ):
     """
@@ -80,4 +85,30 @@ def get_available_slots(
     - Not already booked
     - Within court's pricing hours
     """
-    return public_service.get_available_slots(db, court_id=court_id, date_val=date)
+    return to_response(
+        public_service.get_available_slots(db, court_id=court_id, date_val=date, slot_minutes=slot_minutes)
+    )
+
+
+@router.get("/courts/{court_id}/available-slots/range")
+def get_available_slots_range(
+    court_id: int,
+    start_date: date = Query(..., description="First date to check (YYYY-MM-DD)"),
+    end_date: date = Query(..., description="Last date to check, inclusive (YYYY-MM-DD)"),
+    slot_minutes: int = Query(60, description="Slot length in minutes (30, 60 or 90)"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get available time slots for a court for each day in a date range (Public endpoint)
+
+    Days without pricing for their weekday are left out; the range is limited to 31 days.
+    """
+    return to_response(
+        public_service.get_available_slots_range(
+            db,
+            court_id=court_id,
+            start_date=start_date,
+            end_date=end_date,
+            slot_minutes=slot_minutes
+        )
+    )
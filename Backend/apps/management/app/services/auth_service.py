@@ -1,5 +1,6 @@
 from __future__ import annotations
 import os, hmac, hashlib, time, jwt
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from passlib.context import CryptContext
 from sqlalchemy.orm import Session
@@ -7,6 +8,7 @@ from fastapi import BackgroundTasks
 from app.repositories import auth_repo, users_repo
 from app.core.config import get_settings
 from app.services.email_service import send_otp_email, send_password_reset_email
+from app.services.principal_cache import principal_cache
 from shared.utils.response_utils import make_response
 
 settings = get_settings()
@@ -14,6 +16,14 @@ settings = get_settings()
 # Password context for the auth service
 _pwd_ctx = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt takes ~100-300 ms of CPU and releases the GIL, so hashes run in a
+# pool sized to the cores. Service functions are sync and run in FastAPI's
+# request threadpool; only the hashing itself is capped here.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers or os.cpu_count() or 1,
+    thread_name_prefix="password-hash",
+)
+
 
 # ---------- Helper Functions ----------
 def now_ts() -> int:
@@ -25,13 +35,28 @@ def normalize_email(email: str) -> str:
 
 
 def hash_password(p: str) -> str:
-    return _pwd_ctx.hash(p)
+    return _hash_executor.submit(_pwd_ctx.hash, p).result()
 
 
 def verify_password(p: str, p_hash: Optional[str]) -> bool:
     if not p_hash:
         return False
-    return _pwd_ctx.verify(p, p_hash)
+    return _hash_executor.submit(_pwd_ctx.verify, p, p_hash).result()
+
+
+def shutdown_hash_executor(wait: bool = True):
+    """Stop the password hashing pool (called on application shutdown)."""
+    _hash_executor.shutdown(wait=wait)
+
+
+def revoke_tokens(db: Session, user) -> None:
+    """
+    Invalidate every token issued to a user. Call after a password reset or
+    a role change so cached principals and old tokens stop authenticating.
+    """
+    user.token_version = (user.token_version or 0) + 1
+    db.commit()
+    principal_cache.invalidate(user.id)
 
 
 def gen_code_6() -> str:
@@ -106,7 +131,7 @@ def decode_token(
 # ---------- Service Functions ----------
 
 
-async def signup(
+def signup(
     db: Session,
     *,
     email: str,
@@ -144,7 +169,7 @@ async def signup(
     )
 
 
-async def request_code(
+def request_code(
     db: Session,
     *,
     email: str,
@@ -165,7 +190,7 @@ async def request_code(
     return make_response(True, "Verification code sent", status_code=200)
 
 
-async def verify_code(
+def verify_code(
     db: Session,
     *,
     email: str,
@@ -191,7 +216,7 @@ async def verify_code(
     return make_response(True, "Email verified successfully", status_code=200)
 
 
-async def login_password(
+def login_password(
     db: Session,
     *,
     email: str,
@@ -216,6 +241,7 @@ async def login_password(
         user_id=user.id,
         role=user.role.value,
         owner_profile_id=owner_profile_id,
+        token_version=user.token_version,
         ttl_seconds=3600,
         jwt_secret=settings.jwt_secret,
         jwt_algorithm=settings.jwt_algorithm,
@@ -233,7 +259,7 @@ async def login_password(
     )
 
 
-async def login_send_code(
+def login_send_code(
     db: Session,
     *,
     email: str,
@@ -253,7 +279,7 @@ async def login_send_code(
     return make_response(True, "Login code sent", status_code=200)
 
 
-async def login_verify_code(
+def login_verify_code(
     db: Session,
     *,
     email: str,
@@ -285,6 +311,7 @@ async def login_verify_code(
         user_id=user.id,
         role=user.role.value,
         owner_profile_id=owner_profile_id,
+        token_version=user.token_version,
         ttl_seconds=3600,
         jwt_secret=settings.jwt_secret,
         jwt_algorithm=settings.jwt_algorithm,
@@ -315,6 +342,7 @@ def request_password_reset(
     if user:
         token = issue_reset_token(
             user_id=user.id,
+            token_version=user.token_version,
             ttl_seconds=3600,
             jwt_secret=settings.jwt_secret,
             jwt_algorithm=settings.jwt_algorithm,
@@ -342,10 +370,11 @@ def confirm_password_reset(
         return make_response(False, "Invalid reset link", status_code=400)
 
     user = users_repo.get_by_id(db, int(data.get("sub")))
-    if not user:
+    # A used link no longer matches the bumped token version
+    if not user or data.get("tv", 0) != user.token_version:
         return make_response(False, "Invalid reset link", status_code=400)
 
     user.password_hash = hash_password(new_password)
-    db.commit()
+    revoke_tokens(db, user)
     
     return make_response(True, "Password updated successfully", status_code=200)
\ No newline at end of file
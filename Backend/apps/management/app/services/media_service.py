@@ -1,12 +1,15 @@
+import asyncio
 from sqlalchemy.orm import Session
 from fastapi import UploadFile
+from app.core.config import get_settings
 from app.repositories import media_repo
 from shared.repositories import property_repo, court_repo
-from app.services.storage.storage_cloudinary import upload_file, delete_file
+from app.services.storage import get_storage
 from shared.utils.response_utils import make_response
 from shared.utils import OwnerContext
+from shared.utils.catalogue_signal import notify_catalogue_changed
 from shared.schemas.media import CourtMediaCreate, CourtMediaUpdate
-from typing import Optional
+from typing import List, Optional
 
 
 async def upload_property_media(
@@ -27,7 +30,7 @@ async def upload_property_media(
         return make_response(False, "Access denied", status_code=403)
     
     try:
-        upload_result = await upload_file(
+        upload_result = await get_storage().upload_file(
             file,
             folder=f"properties/{property_id}",
             resource_type="auto"
@@ -42,6 +45,7 @@ async def upload_property_media(
             caption=data.caption,
             display_order=data.display_order
         )
+        notify_catalogue_changed(db, current_owner.owner_profile_id)
         
         return make_response(
             True,
@@ -79,7 +83,7 @@ async def upload_court_media(
         return make_response(False, "Access denied", status_code=403)
     
     try:
-        upload_result = await upload_file(
+        upload_result = await get_storage().upload_file(
             file,
             folder=f"courts/{court_id}",
             resource_type="auto"
@@ -94,6 +98,7 @@ async def upload_court_media(
             caption=data.caption,
             display_order=data.display_order
         )
+        notify_catalogue_changed(db, current_owner.owner_profile_id)
         
         return make_response(
             True,
@@ -110,6 +115,158 @@ async def upload_court_media(
         return make_response(False, "Failed to upload media", status_code=500, error=str(e))
 
 
+async def _discard_upload(storage, url: str):
+    """Delete a stored file whose media row could not be written"""
+    try:
+        await storage.delete_file(url)
+    except Exception as e:
+        print(f"Warning: Failed to delete orphaned upload {url} from storage: {e}")
+
+
+async def _upload_batch(
+    db: Session,
+    *,
+    files: List[UploadFile],
+    folder: str,
+    caption: Optional[str],
+    display_order: int,
+    property_id: Optional[int] = None,
+    court_id: Optional[int] = None
+):
+    """Upload files concurrently (capped per request) and record the successful ones"""
+    settings = get_settings()
+    
+    if not files:
+        return make_response(False, "No files provided", status_code=400)
+    
+    if len(files) > settings.batch_upload_max_files:
+        return make_response(
+            False,
+            f"At most {settings.batch_upload_max_files} files can be uploaded at once",
+            status_code=400
+        )
+    
+    storage = get_storage()
+    semaphore = asyncio.Semaphore(settings.batch_upload_concurrency)
+    
+    async def upload_one(file: UploadFile):
+        async with semaphore:
+            return await storage.upload_file(file, folder=folder, resource_type="auto")
+    
+    results = await asyncio.gather(*(upload_one(file) for file in files), return_exceptions=True)
+    
+    # DB writes stay on the request's session, one after another
+    uploaded = []
+    failed = []
+    for index, (file, result) in enumerate(zip(files, results)):
+        if isinstance(result, Exception):
+            failed.append({"filename": file.filename, "error": str(result)})
+            continue
+        
+        try:
+            media = media_repo.create(
+                db,
+                property_id=property_id,
+                court_id=court_id,
+                media_type="video" if result.get("resource_type") == "video" else "image",
+                url=result["url"],
+                thumbnail_url=result.get("thumbnail_url"),
+                caption=caption,
+                display_order=display_order + index
+            )
+        except Exception as e:
+            # No row points at the stored file, so it must not be kept
+            db.rollback()
+            await _discard_upload(storage, result["url"])
+            failed.append({"filename": file.filename, "error": f"Failed to save media: {e}"})
+            continue
+        
+        uploaded.append({
+            "id": media.id,
+            "filename": file.filename,
+            "url": media.url,
+            "thumbnail_url": media.thumbnail_url,
+            "media_type": media.media_type.value
+        })
+    
+    if not uploaded:
+        return make_response(
+            False,
+            "Failed to upload media",
+            data={"uploaded": [], "failed": failed},
+            status_code=500
+        )
+    
+    return make_response(
+        True,
+        "Media uploaded successfully" if not failed else "Some media failed to upload",
+        data={"uploaded": uploaded, "failed": failed},
+        status_code=201
+    )
+
+
+async def upload_property_media_batch(
+    db: Session,
+    *,
+    property_id: int,
+    current_owner: OwnerContext,
+    files: List[UploadFile],
+    caption: Optional[str] = None,
+    display_order: int = 0
+):
+    """Upload several media files for property"""
+    property = property_repo.get_by_id(db, property_id)
+    
+    if not property:
+        return make_response(False, "Property not found", status_code=404)
+    
+    if property.owner_profile_id != current_owner.owner_profile_id:
+        return make_response(False, "Access denied", status_code=403)
+    
+    response = await _upload_batch(
+        db,
+        files=files,
+        folder=f"properties/{property_id}",
+        caption=caption,
+        display_order=display_order,
+        property_id=property_id
+    )
+    notify_catalogue_changed(db, current_owner.owner_profile_id)
+    return response
+
+
+async def upload_court_media_batch(
+    db: Session,
+    *,
+    court_id: int,
+    current_owner: OwnerContext,
+    files: List[UploadFile],
+    caption: Optional[str] = None,
+    display_order: int = 0
+):
+    """Upload several media files for court"""
+    court = court_repo.get_by_id(db, court_id)
+    
+    if not court:
+        return make_response(False, "Court not found", status_code=404)
+    
+    property = property_repo.get_by_id(db, court.property_id)
+    
+    if not property or property.owner_profile_id != current_owner.owner_profile_id:
+        return make_response(False, "Access denied", status_code=403)
+    
+    response = await _upload_batch(
+        db,
+        files=files,
+        folder=f"courts/{court_id}",
+        caption=caption,
+        display_order=display_order,
+        court_id=court_id
+    )
+    notify_catalogue_changed(db, current_owner.owner_profile_id)
+    return response
+
+
 def get_property_media(db: Session, *, property_id: int, current_owner: OwnerContext):
     """Get all media for a property"""
     property = property_repo.get_by_id(db, property_id)
@@ -186,6 +343,7 @@ def update_media(db: Session, *, media_id: int, current_owner: OwnerContext, dat
     
     try:
         updated = media_repo.update(db, media, **data.model_dump(exclude_unset=True))
+        notify_catalogue_changed(db, current_owner.owner_profile_id)
         return make_response(
             True,
             "Media updated successfully",
@@ -213,13 +371,15 @@ async def delete_media(db: Session, *, media_id: int, current_owner: OwnerContex
             return make_response(False, "Access denied", status_code=403)
     
     try:
-        if "cloudinary.com" in media.url:
+        storage = get_storage()
+        if storage.owns_url(media.url):
             try:
-                await delete_file(media.url)
+                await storage.delete_file(media.url)
             except Exception as e:
-                print(f"Warning: Failed to delete from Cloudinary: {e}")
+                print(f"Warning: Failed to delete from storage: {e}")
         
         media_repo.delete(db, media)
+        notify_catalogue_changed(db, current_owner.owner_profile_id)
         return make_response(True, "Media deleted successfully")
     except Exception as e:
         return make_response(False, "Failed to delete media", status_code=500, error=str(e))
@@ -1,7 +1,9 @@
 from sqlalchemy.orm import Session
 from shared.repositories import property_repo, court_repo, pricing_repo
+from shared.services import pricing_resolver
 from shared.utils.response_utils import make_response
 from shared.utils import OwnerContext
+from shared.utils.catalogue_signal import notify_catalogue_changed
 from shared.schemas.pricing import CourtPricingCreate, CourtPricingUpdate
 
 
@@ -29,6 +31,8 @@ def create_pricing(db: Session, *, court_id: int, current_owner: OwnerContext, d
             court_id=court_id,
             **data.model_dump()
         )
+        pricing_resolver.invalidate(court_id)
+        notify_catalogue_changed(db, current_owner.owner_profile_id)
         return make_response(
             True,
             "Pricing rule created successfully",
@@ -101,6 +105,8 @@ def update_pricing(db: Session, *, pricing_id: int, current_owner: OwnerContext,
     
     try:
         updated = pricing_repo.update(db, pricing, **update_data)
+        pricing_resolver.invalidate(updated.court_id)
+        notify_catalogue_changed(db, current_owner.owner_profile_id)
         return make_response(
             True,
             "Pricing rule updated successfully",
@@ -123,7 +129,10 @@ def delete_pricing(db: Session, *, pricing_id: int, current_owner: OwnerContext)
         return make_response(False, "Access denied", status_code=403)
     
     try:
+        court_id = pricing.court_id
         pricing_repo.delete(db, pricing)
+        pricing_resolver.invalidate(court_id)
+        notify_catalogue_changed(db, current_owner.owner_profile_id)
         return make_response(True, "Pricing rule deleted successfully")
     except Exception as e:
         return make_response(False, "Failed to delete pricing rule", status_code=500, error=str(e))
@@ -0,0 +1,72 @@
+"""
+Short-lived cache of authenticated principals.
+
+Every authenticated request used to load the user row after decoding the
+JWT. Tokens carry the user's token version ("tv" claim), so a principal
+loaded once can be reused for the same (user id, token version) until its
+TTL expires. Bumping users.token_version (auth_service.revoke_tokens, on
+password reset or role change) makes old tokens miss the cache and fail the
+version check, and drops this process's entries for the user right away.
+
+Other workers keep their own entries and may serve one for up to
+principal_cache_ttl_seconds after a revocation.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from app.core.config import get_settings
+from shared.models import UserRole
+from shared.utils.ttl_cache import TTLCache
+
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Detached snapshot of the authenticated user."""
+    id: int
+    email: str
+    Name: str
+    role: UserRole
+    token_version: int
+
+
+class PrincipalCache:
+    """
+    TTL + LRU cache of principals keyed by (user id, token version).
+
+    Attributes:
+        ttl_seconds: Lifetime of an entry
+        max_entries: Principals kept; 0 disables the cache
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int):
+        self._cache: TTLCache[Principal] = TTLCache(max_entries, ttl_seconds)
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.enabled
+
+    def get(self, user_id: int, token_version: int) -> Optional[Principal]:
+        """Cached principal for a token, or None."""
+        return self._cache.get((user_id, token_version))
+
+    def set(self, principal: Principal) -> None:
+        self._cache.set((principal.id, principal.token_version), principal)
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop every cached principal of a user."""
+        self._cache.discard_where(lambda key: key[0] == user_id)
+
+    def stats(self) -> Dict[str, float]:
+        return self._cache.stats()
+
+
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+    max_entries=settings.principal_cache_max_entries,
+)
+
+
+__all__ = ["Principal", "PrincipalCache", "principal_cache"]
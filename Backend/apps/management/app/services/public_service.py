@@ -13,4 +13,4 @@ get_property_details = public_service.get_property_details
 get_court_details = public_service.get_court_details
 get_court_pricing_for_date = public_service.get_court_pricing_for_date
 get_available_slots = public_service.get_available_slots
-
+get_available_slots_range = public_service.get_available_slots_range
@@ -0,0 +1,18 @@
+"""
+Media storage backends.
+
+Each backend module exposes the same async interface:
+upload_file(file, folder, resource_type), delete_file(url) and owns_url(url).
+"""
+
+from app.core.config import get_settings
+
+
+def get_storage():
+    """Return the storage backend module selected by settings.storage_backend."""
+    if get_settings().storage_backend == "local":
+        from app.services.storage import storage_local
+        return storage_local
+
+    from app.services.storage import storage_cloudinary
+    return storage_cloudinary
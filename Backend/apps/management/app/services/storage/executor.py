@@ -0,0 +1,29 @@
+"""
+Bounded thread pool for blocking storage I/O.
+
+Storage SDK calls and file copies are synchronous; running them here keeps
+large uploads off the event loop while capping how many run at once per
+worker process.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from app.core.config import get_settings
+
+
+_executor = ThreadPoolExecutor(
+    max_workers=get_settings().upload_max_workers,
+    thread_name_prefix="media-upload",
+)
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking storage call in the upload executor and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, partial(func, *args, **kwargs))
+
+
+def shutdown_executor(wait: bool = True):
+    """Stop the upload executor (called on application shutdown)."""
+    _executor.shutdown(wait=wait)
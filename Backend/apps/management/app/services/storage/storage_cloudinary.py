@@ -9,6 +9,7 @@ import cloudinary.uploader
 from cloudinary.utils import cloudinary_url
 from fastapi import UploadFile
 from app.core.config import get_settings
+from app.services.storage.executor import run_blocking
 
 
 def configure_cloudinary():
@@ -110,10 +111,36 @@ def upload_video_bytes(file_bytes: bytes, folder: str, filename: str | None = No
     }
 
 
+def _upload_stream(stream, size: int | None, folder: str, resource_type: str) -> dict:
+    """Blocking upload of a file object; large files go up in chunks."""
+    settings = get_settings()
+    stream.seek(0)
+    if size is not None and size > settings.upload_chunk_size:
+        return cloudinary.uploader.upload_large(
+            stream,
+            folder=folder,
+            resource_type=resource_type,
+            chunk_size=settings.upload_chunk_size,
+        )
+    return cloudinary.uploader.upload(
+        stream,
+        folder=folder,
+        resource_type=resource_type
+    )
+
+
+def owns_url(url: str) -> bool:
+    """Check whether a URL points at a Cloudinary asset."""
+    return "cloudinary.com" in url
+
+
 async def upload_file(file: UploadFile, folder: str = "indoor", resource_type: str = "auto") -> dict:
     """
     Upload file from FastAPI UploadFile to Cloudinary.
     
+    The file is streamed from the UploadFile spool (no full in-memory copy)
+    and the blocking SDK call runs in the bounded upload executor.
+    
     Args:
         file: UploadFile from FastAPI
         folder: Cloudinary folder path
@@ -126,13 +153,7 @@ async def upload_file(file: UploadFile, folder: str = "indoor", resource_type: s
         raise RuntimeError("Cloudinary is not configured")
     
     try:
-        contents = await file.read()
-        
-        result = cloudinary.uploader.upload(
-            contents,
-            folder=folder,
-            resource_type=resource_type
-        )
+        result = await run_blocking(_upload_stream, file.file, file.size, folder, resource_type)
         
         # Generate thumbnail for videos
         thumbnail_url = None
@@ -189,7 +210,7 @@ async def delete_file(url: str) -> dict:
             resource_type = "raw"
         
         # Delete from Cloudinary
-        result = cloudinary.uploader.destroy(public_id, resource_type=resource_type)
+        result = await run_blocking(cloudinary.uploader.destroy, public_id, resource_type=resource_type)
         
         return result
     except Exception as e:
@@ -0,0 +1,81 @@
+"""
+Local filesystem storage backend.
+
+Drop-in replacement for storage_cloudinary used for offline development and
+tests. Files are streamed from the upload spool into settings.local_storage_dir
+and served under settings.local_storage_url.
+"""
+
+import shutil
+import uuid
+from pathlib import Path
+from fastapi import UploadFile
+from app.core.config import get_settings
+from app.services.storage.executor import run_blocking
+
+
+def _root() -> Path:
+    return Path(get_settings().local_storage_dir)
+
+
+def _resource_type(file: UploadFile, resource_type: str) -> str:
+    if resource_type != "auto":
+        return resource_type
+    content_type = file.content_type or ""
+    if content_type.startswith("video/"):
+        return "video"
+    if content_type.startswith("image/"):
+        return "image"
+    return "raw"
+
+
+def _copy_to_disk(source, destination: Path):
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    source.seek(0)
+    with open(destination, "wb") as target:
+        shutil.copyfileobj(source, target, length=1024 * 1024)
+
+
+def owns_url(url: str) -> bool:
+    """Check whether a URL points at a file stored by this backend."""
+    return url.startswith(get_settings().local_storage_url.rstrip("/") + "/")
+
+
+async def upload_file(file: UploadFile, folder: str = "indoor", resource_type: str = "auto") -> dict:
+    """
+    Store an UploadFile on local disk.
+    
+    Returns:
+        Dictionary with url, thumbnail_url, public_id, format, resource_type
+        (same shape as storage_cloudinary.upload_file)
+    """
+    suffix = Path(file.filename or "").suffix.lower()
+    public_id = f"{folder}/{uuid.uuid4().hex}"
+    relative_path = f"{public_id}{suffix}"
+
+    try:
+        await run_blocking(_copy_to_disk, file.file, _root() / relative_path)
+    except Exception as e:
+        raise Exception(f"Failed to store file locally: {str(e)}")
+
+    return {
+        "url": f"{get_settings().local_storage_url.rstrip('/')}/{relative_path}",
+        "thumbnail_url": None,
+        "public_id": public_id,
+        "format": suffix.lstrip(".") or None,
+        "resource_type": _resource_type(file, resource_type)
+    }
+
+
+async def delete_file(url: str) -> dict:
+    """Delete a locally stored file by its URL."""
+    if not owns_url(url):
+        raise Exception("Failed to delete local file: URL is not served by local storage")
+
+    prefix = get_settings().local_storage_url.rstrip("/") + "/"
+    path = (_root() / url[len(prefix):]).resolve()
+    if _root().resolve() not in path.parents:
+        raise Exception("Failed to delete local file: path escapes storage directory")
+
+    await run_blocking(path.unlink, missing_ok=True)
+    return {"result": "ok"}
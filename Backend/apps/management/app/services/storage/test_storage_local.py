@@ -0,0 +1,71 @@
+"""
+Unit tests for the local filesystem storage backend.
+
+This module tests:
+- Storing uploads under the configured directory and URL prefix
+- Resource type detection from the content type
+- Deleting stored files and refusing URLs outside the storage directory
+"""
+
+import io
+
+import pytest
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from app.core.config import get_settings
+from app.services.storage import storage_local
+
+
+def _upload(content: bytes, filename: str, content_type: str) -> UploadFile:
+    return UploadFile(file=io.BytesIO(content), filename=filename, headers=Headers({"content-type": content_type}))
+
+
+@pytest.fixture
+def local_storage(tmp_path, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "local_storage_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "local_storage_url", "/media")
+    return tmp_path
+
+
+def _path(root, url: str):
+    return root / url[len("/media/"):]
+
+
+@pytest.mark.asyncio
+async def test_upload_file_writes_under_folder(local_storage):
+    result = await storage_local.upload_file(_upload(b"jpeg-bytes", "Court.JPG", "image/jpeg"), folder="courts/3")
+
+    assert result["url"].startswith("/media/courts/3/")
+    assert result["url"].endswith(".jpg")
+    assert result["resource_type"] == "image"
+    assert result["format"] == "jpg"
+    assert _path(local_storage, result["url"]).read_bytes() == b"jpeg-bytes"
+
+
+@pytest.mark.asyncio
+async def test_upload_file_detects_video_and_raw(local_storage):
+    video = await storage_local.upload_file(_upload(b"v", "clip.mp4", "video/mp4"), folder="p")
+    raw = await storage_local.upload_file(_upload(b"r", "notes.txt", "text/plain"), folder="p")
+
+    assert video["resource_type"] == "video"
+    assert raw["resource_type"] == "raw"
+
+
+@pytest.mark.asyncio
+async def test_delete_file_removes_stored_file(local_storage):
+    result = await storage_local.upload_file(_upload(b"x", "a.png", "image/png"), folder="p")
+
+    assert storage_local.owns_url(result["url"])
+    await storage_local.delete_file(result["url"])
+    assert not _path(local_storage, result["url"]).exists()
+
+
+@pytest.mark.asyncio
+async def test_delete_file_rejects_foreign_and_escaping_urls(local_storage):
+    assert not storage_local.owns_url("https://res.cloudinary.com/x/image.png")
+    with pytest.raises(Exception, match="not served by local storage"):
+        await storage_local.delete_file("https://res.cloudinary.com/x/image.png")
+    with pytest.raises(Exception, match="escapes storage directory"):
+        await storage_local.delete_file("/media/../outside.png")
@@ -0,0 +1,166 @@
+"""
+Unit tests for batch media uploads.
+
+Runs the batch path against the local storage backend in a temporary
+directory with a stubbed media repository. This module tests:
+- Recording every uploaded file with consecutive display orders
+- Reporting files whose storage upload failed
+- Removing stored files whose media row could not be written
+- Rejecting empty and oversized batches
+"""
+
+import io
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from app.core.config import get_settings
+from app.services import media_service
+from app.services.storage import storage_local
+
+
+def _upload(name: str, content_type: str = "image/jpeg") -> UploadFile:
+    return UploadFile(file=io.BytesIO(name.encode()), filename=name, headers=Headers({"content-type": content_type}))
+
+
+@pytest.fixture
+def local_storage(tmp_path, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "storage_backend", "local")
+    monkeypatch.setattr(settings, "local_storage_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "local_storage_url", "/media")
+    monkeypatch.setattr(settings, "batch_upload_max_files", 3)
+    return tmp_path
+
+
+@pytest.fixture
+def created(monkeypatch):
+    """Media rows written by the batch, by call order"""
+    rows = []
+
+    def create(db, *, media_type, url, property_id=None, court_id=None, thumbnail_url=None, caption=None, display_order=0):
+        row = SimpleNamespace(
+            id=len(rows) + 1,
+            property_id=property_id,
+            court_id=court_id,
+            url=url,
+            thumbnail_url=thumbnail_url,
+            caption=caption,
+            display_order=display_order,
+            media_type=SimpleNamespace(value=media_type),
+        )
+        rows.append(row)
+        return row
+
+    monkeypatch.setattr(media_service.media_repo, "create", create)
+    return rows
+
+
+def _payload(response):
+    return response.status_code, json.loads(response.body)
+
+
+def _stored_files(root):
+    return sorted(p for p in root.rglob("*") if p.is_file())
+
+
+@pytest.mark.asyncio
+async def test_batch_records_every_upload(local_storage, created):
+    result = await media_service._upload_batch(
+        MagicMock(),
+        files=[_upload("a.jpg"), _upload("b.mp4", "video/mp4")],
+        folder="courts/4",
+        caption="Night",
+        display_order=5,
+        court_id=4,
+    )
+
+    status_code, body = _payload(result)
+    assert body["success"] and status_code == 201
+    assert [m["filename"] for m in body["data"]["uploaded"]] == ["a.jpg", "b.mp4"]
+    assert [(r.court_id, r.property_id, r.display_order, r.media_type.value) for r in created] == [
+        (4, None, 5, "image"),
+        (4, None, 6, "video"),
+    ]
+    assert len(_stored_files(local_storage)) == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_failed_storage_uploads(local_storage, created, monkeypatch):
+    real_upload = storage_local.upload_file
+
+    async def flaky_upload(file, folder, resource_type="auto"):
+        if file.filename == "bad.jpg":
+            raise Exception("Failed to store file locally: disk full")
+        return await real_upload(file, folder=folder, resource_type=resource_type)
+
+    monkeypatch.setattr(storage_local, "upload_file", flaky_upload)
+
+    result = await media_service._upload_batch(
+        MagicMock(), files=[_upload("ok.jpg"), _upload("bad.jpg")], folder="p/1", caption=None, display_order=0, property_id=1
+    )
+
+    _, body = _payload(result)
+    assert body["success"]
+    assert body["message"] == "Some media failed to upload"
+    assert [f["filename"] for f in body["data"]["failed"]] == ["bad.jpg"]
+    assert len(created) == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_removes_stored_file_when_row_write_fails(local_storage, created, monkeypatch):
+    write_row = media_service.media_repo.create
+
+    def failing_create(db, **kwargs):
+        if kwargs["display_order"] == 1:
+            raise RuntimeError("connection lost")
+        return write_row(db, **kwargs)
+
+    monkeypatch.setattr(media_service.media_repo, "create", failing_create)
+    db = MagicMock()
+
+    result = await media_service._upload_batch(
+        db, files=[_upload("a.jpg"), _upload("b.jpg")], folder="p/1", caption=None, display_order=0, property_id=1
+    )
+
+    _, body = _payload(result)
+    assert body["success"]
+    assert [f["filename"] for f in body["data"]["failed"]] == ["b.jpg"]
+    assert "connection lost" in body["data"]["failed"][0]["error"]
+    db.rollback.assert_called_once()
+    # Only the recorded file is left in storage
+    assert [p.name for p in _stored_files(local_storage)] == [created[0].url.rsplit("/", 1)[1]]
+
+
+@pytest.mark.asyncio
+async def test_batch_fails_when_nothing_is_recorded(local_storage, monkeypatch):
+    def failing_create(db, **kwargs):
+        raise RuntimeError("connection lost")
+
+    monkeypatch.setattr(media_service.media_repo, "create", failing_create)
+
+    result = await media_service._upload_batch(
+        MagicMock(), files=[_upload("a.jpg")], folder="p/1", caption=None, display_order=0, property_id=1
+    )
+
+    status_code, body = _payload(result)
+    assert not body["success"] and status_code == 500
+    assert _stored_files(local_storage) == []
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_empty_and_oversized_batches(local_storage, created):
+    empty = await media_service._upload_batch(
+        MagicMock(), files=[], folder="p/1", caption=None, display_order=0, property_id=1
+    )
+    oversized = await media_service._upload_batch(
+        MagicMock(), files=[_upload(f"{i}.jpg") for i in range(4)], folder="p/1", caption=None, display_order=0, property_id=1
+    )
+
+    assert empty.status_code == 400
+    assert oversized.status_code == 400
+    assert created == []
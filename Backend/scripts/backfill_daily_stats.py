@@ -0,0 +1,58 @@
+"""
+Backfill the court_daily_stats rollup from the bookings table.
+
+Run once after the migration that creates court_daily_stats, and again
+whenever the rollup needs to be rebuilt (for example after bookings were
+changed directly in the database). Rows in the selected date range are
+deleted and recomputed in one transaction.
+
+Usage:
+    python Backend/scripts/backfill_daily_stats.py
+    python Backend/scripts/backfill_daily_stats.py --from-date 2025-01-01 --to-date 2025-12-31
+"""
+
+import argparse
+import os
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add Backend to path
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from shared.repositories import daily_stats_repo
+
+# Load environment variables
+env_path = backend_dir / "apps" / "management" / ".env"
+load_dotenv(env_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--from-date", type=date.fromisoformat, default=None)
+    parser.add_argument("--to-date", type=date.fromisoformat, default=None)
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        print("❌ DATABASE_URL not found in environment variables")
+        sys.exit(1)
+
+    engine = create_engine(database_url)
+    db = sessionmaker(bind=engine)()
+    try:
+        rows = daily_stats_repo.rebuild(db, from_date=args.from_date, to_date=args.to_date)
+    finally:
+        db.close()
+
+    scope = f"{args.from_date or 'start'} .. {args.to_date or 'end'}"
+    print(f"✅ Rebuilt {rows} court/day rows ({scope})")
+
+
+if __name__ == "__main__":
+    main()
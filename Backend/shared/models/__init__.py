@@ -5,9 +5,10 @@ from .owner_profile import OwnerProfile
 from .property import Property
 from .court import Court
 from .court_pricing import CourtPricing
-from .booking import Booking, BookingStatus, PaymentStatus
+from .booking import Booking, BookingStatus, PaymentStatus, BOOKING_OVERLAP_CONSTRAINT
 from .court_media import CourtMedia, MediaType
 from .court_availability import CourtAvailability
+from .court_daily_stats import CourtDailyStats
 
 __all__ = [
     "Base",
@@ -21,8 +22,10 @@ __all__ = [
     "Booking",
     "BookingStatus",
     "PaymentStatus",
+    "BOOKING_OVERLAP_CONSTRAINT",
     "CourtMedia",
     "MediaType",
     "CourtAvailability",
+    "CourtDailyStats",
 ]
 
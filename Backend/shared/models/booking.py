@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Date, Time, DateTime, ForeignKey, Float, Enum, func
+from sqlalchemy import Column, Integer, String, Date, Time, DateTime, ForeignKey, Float, Enum, Index, func, text
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.orm import relationship
 import enum
 from .base import Base
@@ -17,6 +18,10 @@ class PaymentStatus(enum.Enum):
     refunded = "refunded"
 
 
+# Name of the exclusion constraint that rejects overlapping active bookings
+BOOKING_OVERLAP_CONSTRAINT = "ex_bookings_court_time_overlap"
+
+
 class Booking(Base):
     __tablename__ = "bookings"
     
@@ -47,3 +52,20 @@ class Booking(Base):
     # Relationships
     customer = relationship("User", foreign_keys=[customer_id], back_populates="bookings")
     court = relationship("Court", back_populates="bookings")
+    
+    __table_args__ = (
+        # Requires the btree_gist extension (see the matching migration)
+        ExcludeConstraint(
+            (court_id, "="),
+            (
+                func.tsrange(booking_date + start_time, booking_date + end_time, text("'[)'")),
+                "&&"
+            ),
+            name=BOOKING_OVERLAP_CONSTRAINT,
+            using="gist",
+            where=text("status IN ('pending', 'confirmed')")
+        ),
+        # Keyset pagination of booking lists on (booking_date, start_time, id)
+        Index("ix_bookings_customer_date_start", customer_id, booking_date, start_time, "id"),
+        Index("ix_bookings_court_date_start", court_id, booking_date, start_time, "id"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, func, JSON
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index, func, JSON
 from sqlalchemy.orm import relationship
 from .base import Base
 
@@ -10,6 +10,8 @@ class Court(Base):
     property_id = Column(Integer, ForeignKey("properties.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String(100), nullable=False)
     sport_type = Column(String(50), nullable=False)
+    # Normalized sport_type (shared.utils.sport_taxonomy), set by court_repo
+    sport_key = Column(String(50), index=True)
     description = Column(Text)
     specifications = Column(JSON, default=dict)
     amenities = Column(JSON, default=list)
@@ -23,3 +25,8 @@ class Court(Base):
     bookings = relationship("Booking", back_populates="court", cascade="all, delete-orphan")
     media = relationship("CourtMedia", foreign_keys="[CourtMedia.court_id]", back_populates="court", cascade="all, delete-orphan")
     availability = relationship("CourtAvailability", back_populates="court", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        # Requires the pg_trgm extension (see the matching migration)
+        Index("ix_courts_sport_type_trgm", sport_type, postgresql_using="gin", postgresql_ops={"sport_type": "gin_trgm_ops"}),
+    )
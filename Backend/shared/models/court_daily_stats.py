@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, Float, Date, DateTime, ForeignKey, func, UniqueConstraint
+from .base import Base
+
+
+class CourtDailyStats(Base):
+    """Per-court, per-day booking rollup maintained by booking_repo writes"""
+    __tablename__ = "court_daily_stats"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    court_id = Column(Integer, ForeignKey("courts.id", ondelete="CASCADE"), nullable=False, index=True)
+    stat_date = Column(Date, nullable=False, index=True)
+    pending_count = Column(Integer, nullable=False, server_default="0")
+    confirmed_count = Column(Integer, nullable=False, server_default="0")
+    completed_count = Column(Integer, nullable=False, server_default="0")
+    cancelled_count = Column(Integer, nullable=False, server_default="0")
+    pending_revenue = Column(Float, nullable=False, server_default="0")
+    confirmed_revenue = Column(Float, nullable=False, server_default="0")
+    completed_revenue = Column(Float, nullable=False, server_default="0")
+    paid_revenue = Column(Float, nullable=False, server_default="0")
+    booked_hours = Column(Float, nullable=False, server_default="0")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    __table_args__ = (
+        UniqueConstraint('court_id', 'stat_date', name='uq_court_daily_stats_court_date'),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, func, JSON
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index, func, JSON
 from sqlalchemy.orm import relationship
 from .base import Base
 
@@ -26,3 +26,9 @@ class Property(Base):
     owner_profile = relationship("OwnerProfile", back_populates="properties")
     courts = relationship("Court", back_populates="property", cascade="all, delete-orphan")
     media = relationship("CourtMedia", foreign_keys="[CourtMedia.property_id]", back_populates="property", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        # Public search; require the pg_trgm extension (see the matching migration)
+        Index("ix_properties_name_trgm", name, postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_properties_city_trgm", city, postgresql_using="gin", postgresql_ops={"city": "gin_trgm_ops"}),
+    )
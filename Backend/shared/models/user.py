@@ -22,6 +22,8 @@ class User(Base):
         nullable=False,
         server_default=UserRole.customer.value,
     )
+    # Bumped to revoke issued tokens (password reset, role change)
+    token_version = Column(Integer, nullable=False, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -1,6 +1,6 @@
 """
 Shared repositories for database operations.
 """
-from shared.repositories import property_repo, court_repo, pricing_repo, availability_repo, booking_repo, owner_repo
+from shared.repositories import property_repo, court_repo, pricing_repo, availability_repo, booking_repo, owner_repo, daily_stats_repo
 
-__all__ = ["property_repo", "court_repo", "pricing_repo", "availability_repo", "booking_repo", "owner_repo"]
+__all__ = ["property_repo", "court_repo", "pricing_repo", "availability_repo", "booking_repo", "owner_repo", "daily_stats_repo"]
@@ -3,7 +3,7 @@ Availability repository for database operations.
 """
 from sqlalchemy.orm import Session
 from shared.models import CourtAvailability
-from typing import Optional, List
+from typing import Optional, List, Sequence
 from datetime import date, time
 
 
@@ -45,6 +45,23 @@ def get_by_date(db: Session, court_id: int, date_val: date) -> List[CourtAvailab
     ).order_by(CourtAvailability.start_time).all()
 
 
+def get_by_date_range(db: Session, court_id: int, start_date: date, end_date: date) -> List[CourtAvailability]:
+    """Get blocked slots for a court between two dates (inclusive)"""
+    return db.query(CourtAvailability).filter(
+        CourtAvailability.court_id == court_id,
+        CourtAvailability.date >= start_date,
+        CourtAvailability.date <= end_date
+    ).order_by(CourtAvailability.date, CourtAvailability.start_time).all()
+
+
+def get_by_courts_date(db: Session, court_ids: Sequence[int], date_val: date) -> List[CourtAvailability]:
+    """Get blocked slots of several courts on one date"""
+    return db.query(CourtAvailability).filter(
+        CourtAvailability.court_id.in_(court_ids),
+        CourtAvailability.date == date_val
+    ).order_by(CourtAvailability.court_id, CourtAvailability.start_time).all()
+
+
 def delete(db: Session, availability: CourtAvailability) -> None:
     """Delete availability block"""
     db.delete(availability)
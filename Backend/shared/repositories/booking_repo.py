@@ -1,9 +1,12 @@
 """
 Booking repository for database operations.
 """
+from sqlalchemy import tuple_
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session, joinedload
-from shared.models import Booking, BookingStatus, PaymentStatus
-from typing import Optional, List
+from shared.models import Booking, BookingStatus, PaymentStatus, Court, Property, User
+from shared.repositories import daily_stats_repo
+from typing import Optional, List, Sequence, Tuple
 from datetime import date, time
 
 
@@ -35,6 +38,13 @@ def create(
         payment_status=PaymentStatus.pending
     )
     db.add(booking)
+    daily_stats_repo.apply_change(
+        db,
+        court_id=court_id,
+        stat_date=booking_date,
+        before=None,
+        after=daily_stats_repo.contribution(booking)
+    )
     db.commit()
     db.refresh(booking)
     return booking
@@ -45,30 +55,24 @@ def get_by_id(db: Session, booking_id: int) -> Optional[Booking]:
     return db.query(Booking).filter(Booking.id == booking_id).first()
 
 
-def get_with_details(db: Session, booking_id: int) -> Optional[Booking]:
-    """Get booking with court and property details"""
-    return (
+def get_with_details(db: Session, booking_id: int, *, for_update: bool = False) -> Optional[Booking]:
+    """Get booking with court and property details
+
+    With for_update the booking row is locked until the transaction ends, so
+    concurrent status changes run one after another and each checks the
+    status (and works out its daily stats delta) from the committed row.
+    """
+    query = (
         db.query(Booking)
         .options(
-            joinedload(Booking.court).joinedload("property"),
+            joinedload(Booking.court).joinedload(Court.property),
             joinedload(Booking.customer)
         )
         .filter(Booking.id == booking_id)
-        .first()
-    )
-
-
-def get_by_customer(db: Session, customer_id: int) -> List[Booking]:
-    """Get all bookings for a customer"""
-    return (
-        db.query(Booking)
-        .options(
-            joinedload(Booking.court).joinedload("property")
-        )
-        .filter(Booking.customer_id == customer_id)
-        .order_by(Booking.booking_date.desc(), Booking.start_time.desc())
-        .all()
     )
+    if for_update:
+        query = query.with_for_update(of=Booking)
+    return query.first()
 
 
 def get_by_court(db: Session, court_id: int, from_date: Optional[date] = None) -> List[Booking]:
@@ -85,53 +89,179 @@ def get_by_court(db: Session, court_id: int, from_date: Optional[date] = None) -
     return query.order_by(Booking.booking_date, Booking.start_time).all()
 
 
-def get_by_property_owner(db: Session, owner_profile_id: int) -> List[Booking]:
-    """Get all bookings for properties owned by owner profile"""
+def get_active_by_court_range(db: Session, court_id: int, start_date: date, end_date: date) -> List[Booking]:
+    """Get pending and confirmed bookings for a court between two dates (inclusive)"""
     return (
         db.query(Booking)
-        .join(Booking.court)
-        .join("property")
+        .filter(
+            Booking.court_id == court_id,
+            Booking.booking_date >= start_date,
+            Booking.booking_date <= end_date,
+            Booking.status.in_([BookingStatus.pending, BookingStatus.confirmed])
+        )
+        .order_by(Booking.booking_date, Booking.start_time)
+        .all()
+    )
+
+
+def get_active_by_courts_date(db: Session, court_ids: Sequence[int], date_val: date) -> List[Booking]:
+    """Get pending and confirmed bookings of several courts on one date"""
+    return (
+        db.query(Booking)
+        .filter(
+            Booking.court_id.in_(court_ids),
+            Booking.booking_date == date_val,
+            Booking.status.in_([BookingStatus.pending, BookingStatus.confirmed])
+        )
+        .order_by(Booking.court_id, Booking.start_time)
+        .all()
+    )
+
+
+def _owner_bookings_query(
+    db: Session,
+    owner_profile_id: int,
+    columns: Sequence = (Booking,),
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None
+):
+    """Query over an owner's bookings, optionally limited to a booking date range"""
+    query = (
+        db.query(*columns)
+        .select_from(Booking)
+        .join(Court, Booking.court_id == Court.id)
+        .join(Property, Court.property_id == Property.id)
+        .filter(Property.owner_profile_id == owner_profile_id)
+    )
+
+    if from_date:
+        query = query.filter(Booking.booking_date >= from_date)
+    if to_date:
+        query = query.filter(Booking.booking_date <= to_date)
+
+    return query
+
+
+def get_recent_by_property_owner(
+    db: Session,
+    owner_profile_id: int,
+    limit: int = 10,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None
+) -> List[Booking]:
+    """Get an owner's latest bookings by booking date and start time"""
+    return (
+        _owner_bookings_query(db, owner_profile_id, from_date=from_date, to_date=to_date)
         .options(
-            joinedload(Booking.court).joinedload("property"),
+            joinedload(Booking.court).joinedload(Court.property),
             joinedload(Booking.customer)
         )
-        .filter("property.owner_profile_id" == owner_profile_id)
         .order_by(Booking.booking_date.desc(), Booking.start_time.desc())
+        .limit(limit)
         .all()
     )
 
 
-def check_conflict(
-    db: Session,
-    court_id: int,
-    booking_date: date,
-    start_time: time,
-    end_time: time,
-    exclude_booking_id: Optional[int] = None
-) -> bool:
-    """Check if booking conflicts with existing bookings"""
-    query = db.query(Booking).filter(
-        Booking.court_id == court_id,
-        Booking.booking_date == booking_date,
-        Booking.status.in_([BookingStatus.pending, BookingStatus.confirmed])
+# Columns of booking list rows (no ORM objects are loaded)
+_LIST_COLUMNS = (
+    Booking.id,
+    Booking.booking_date,
+    Booking.start_time,
+    Booking.end_time,
+    Booking.total_price,
+    Booking.status,
+    Booking.payment_status,
+    Court.name.label("court_name"),
+    Court.sport_type,
+    Property.name.label("property_name"),
+)
+
+
+def _page(
+    query,
+    *,
+    limit: int,
+    before: Optional[Tuple[date, time, int]] = None,
+    status: Optional[BookingStatus] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None
+) -> List[Row]:
+    """Filter a booking list query and return one page, latest first.
+
+    `before` is the (booking_date, start_time, id) of the last row of the
+    previous page; rows are ordered by that key so pages never overlap.
+    """
+    if status:
+        query = query.filter(Booking.status == status)
+    if from_date:
+        query = query.filter(Booking.booking_date >= from_date)
+    if to_date:
+        query = query.filter(Booking.booking_date <= to_date)
+    if before:
+        query = query.filter(tuple_(Booking.booking_date, Booking.start_time, Booking.id) < tuple_(*before))
+
+    return (
+        query
+        .order_by(Booking.booking_date.desc(), Booking.start_time.desc(), Booking.id.desc())
+        .limit(limit)
+        .all()
     )
 
-    if exclude_booking_id:
-        query = query.filter(Booking.id != exclude_booking_id)
 
-    existing = query.all()
+def list_by_customer(
+    db: Session,
+    customer_id: int,
+    *,
+    limit: int,
+    before: Optional[Tuple[date, time, int]] = None,
+    status: Optional[BookingStatus] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None
+) -> List[Row]:
+    """Get one page of a customer's bookings as rows with court and property columns"""
+    query = (
+        db.query(*_LIST_COLUMNS, Property.address.label("property_address"))
+        .select_from(Booking)
+        .join(Court, Booking.court_id == Court.id)
+        .join(Property, Court.property_id == Property.id)
+        .filter(Booking.customer_id == customer_id)
+    )
+    return _page(query, limit=limit, before=before, status=status, from_date=from_date, to_date=to_date)
 
-    for booking in existing:
-        # Check if time ranges overlap
-        if not (end_time <= booking.start_time or start_time >= booking.end_time):
-            return True
 
-    return False
+def list_by_property_owner(
+    db: Session,
+    owner_profile_id: int,
+    *,
+    limit: int,
+    before: Optional[Tuple[date, time, int]] = None,
+    status: Optional[BookingStatus] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None
+) -> List[Row]:
+    """Get one page of bookings for an owner's properties as rows with court, property and customer columns"""
+    query = (
+        _owner_bookings_query(
+            db,
+            owner_profile_id,
+            columns=_LIST_COLUMNS + (User.Name.label("customer_name"), User.email.label("customer_email")),
+        )
+        .join(User, Booking.customer_id == User.id)
+    )
+    return _page(query, limit=limit, before=before, status=status, from_date=from_date, to_date=to_date)
 
 
 def update_status(db: Session, booking: Booking, status: BookingStatus) -> Booking:
     """Update booking status"""
+    before = daily_stats_repo.contribution(booking)
     booking.status = status
+    daily_stats_repo.apply_change(
+        db,
+        court_id=booking.court_id,
+        stat_date=booking.booking_date,
+        before=before,
+        after=daily_stats_repo.contribution(booking)
+    )
     db.commit()
     db.refresh(booking)
     return booking
@@ -139,7 +269,15 @@ def update_status(db: Session, booking: Booking, status: BookingStatus) -> Booki
 
 def update_payment_status(db: Session, booking: Booking, payment_status: PaymentStatus) -> Booking:
     """Update payment status"""
+    before = daily_stats_repo.contribution(booking)
     booking.payment_status = payment_status
+    daily_stats_repo.apply_change(
+        db,
+        court_id=booking.court_id,
+        stat_date=booking.booking_date,
+        before=before,
+        after=daily_stats_repo.contribution(booking)
+    )
     db.commit()
     db.refresh(booking)
     return booking
@@ -3,12 +3,13 @@ Court repository for database operations.
 """
 from sqlalchemy.orm import Session
 from shared.models import Court
+from shared.utils.sport_taxonomy import normalize_sport
 from typing import Optional, List
 
 
 def create(db: Session, *, property_id: int, name: str, sport_type: str, **kwargs) -> Court:
     """Create a new court"""
-    court = Court(property_id=property_id, name=name, sport_type=sport_type, **kwargs)
+    court = Court(property_id=property_id, name=name, sport_type=sport_type, sport_key=normalize_sport(sport_type), **kwargs)
     db.add(court)
     db.commit()
     db.refresh(court)
@@ -30,6 +31,7 @@ def update(db: Session, court: Court, **kwargs) -> Court:
     for key, value in kwargs.items():
         if value is not None and hasattr(court, key):
             setattr(court, key, value)
+    court.sport_key = normalize_sport(court.sport_type)
     db.commit()
     db.refresh(court)
     return court
@@ -0,0 +1,185 @@
+"""
+Daily stats repository for the per-court booking rollup.
+
+Rows are kept current incrementally: booking_repo applies the difference
+between a booking's contribution before and after each write, inside the
+same transaction as the booking change. rebuild() recomputes rows from the
+bookings table and is used by the backfill script.
+"""
+from sqlalchemy import func, case, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from shared.models import CourtDailyStats, Booking, BookingStatus, PaymentStatus, Court, Property
+from typing import Dict, Optional, List, Tuple
+from datetime import date
+
+STAT_COLUMNS = (
+    "pending_count",
+    "confirmed_count",
+    "completed_count",
+    "cancelled_count",
+    "pending_revenue",
+    "confirmed_revenue",
+    "completed_revenue",
+    "paid_revenue",
+    "booked_hours",
+)
+
+
+def contribution(booking: Booking) -> Dict[str, float]:
+    """Stat values a single booking adds to its court/day row"""
+    values = {column: 0 for column in STAT_COLUMNS}
+    status = booking.status.value
+
+    values[f"{status}_count"] = 1
+    if booking.status != BookingStatus.cancelled:
+        values["booked_hours"] = booking.total_hours
+        values[f"{status}_revenue"] = booking.total_price
+    if booking.payment_status == PaymentStatus.paid:
+        values["paid_revenue"] = booking.total_price
+
+    return values
+
+
+def apply_change(
+    db: Session,
+    *,
+    court_id: int,
+    stat_date: date,
+    before: Optional[Dict[str, float]],
+    after: Optional[Dict[str, float]]
+) -> None:
+    """Add (after - before) to the court/day row without committing"""
+    before = before or {}
+    after = after or {}
+    delta = {
+        column: after.get(column, 0) - before.get(column, 0)
+        for column in STAT_COLUMNS
+    }
+    delta = {column: value for column, value in delta.items() if value}
+    if not delta:
+        return
+
+    stmt = insert(CourtDailyStats).values(court_id=court_id, stat_date=stat_date, **delta)
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_court_daily_stats_court_date",
+        set_={
+            **{
+                column: getattr(CourtDailyStats, column) + getattr(stmt.excluded, column)
+                for column in delta
+            },
+            "updated_at": func.now(),
+        }
+    )
+    db.execute(stmt)
+
+
+def _owner_stats_query(
+    db: Session,
+    owner_profile_id: int,
+    columns,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None
+):
+    """Query over an owner's rollup rows, optionally limited to a date range"""
+    query = (
+        db.query(*columns)
+        .select_from(CourtDailyStats)
+        .join(Court, CourtDailyStats.court_id == Court.id)
+        .join(Property, Court.property_id == Property.id)
+        .filter(Property.owner_profile_id == owner_profile_id)
+    )
+
+    if from_date:
+        query = query.filter(CourtDailyStats.stat_date >= from_date)
+    if to_date:
+        query = query.filter(CourtDailyStats.stat_date <= to_date)
+
+    return query
+
+
+def get_owner_totals(
+    db: Session,
+    owner_profile_id: int,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None
+) -> Dict[str, float]:
+    """Sum every stat column over an owner's courts"""
+    row = _owner_stats_query(
+        db,
+        owner_profile_id,
+        [
+            func.coalesce(func.sum(getattr(CourtDailyStats, column)), 0).label(column)
+            for column in STAT_COLUMNS
+        ],
+        from_date,
+        to_date
+    ).one()
+    return dict(row._mapping)
+
+
+def get_owner_revenue_by_property(
+    db: Session,
+    owner_profile_id: int,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None
+) -> List[Tuple[int, str, int, float]]:
+    """Get (property id, property name, completed bookings, completed revenue) rows"""
+    completed_count = func.sum(CourtDailyStats.completed_count)
+    return (
+        _owner_stats_query(
+            db,
+            owner_profile_id,
+            (Property.id, Property.name, completed_count, func.sum(CourtDailyStats.completed_revenue)),
+            from_date,
+            to_date
+        )
+        .group_by(Property.id, Property.name)
+        .having(completed_count > 0)
+        .order_by(Property.id)
+        .all()
+    )
+
+
+def rebuild(db: Session, from_date: Optional[date] = None, to_date: Optional[date] = None) -> int:
+    """Recompute rollup rows from bookings for a date range (all dates when unset) and commit"""
+    active = Booking.status != BookingStatus.cancelled
+
+    def count_of(status: BookingStatus):
+        return func.count(case((Booking.status == status, 1)))
+
+    def revenue_of(status: BookingStatus):
+        return func.coalesce(func.sum(case((Booking.status == status, Booking.total_price))), 0)
+
+    aggregate = select(
+        Booking.court_id,
+        Booking.booking_date,
+        count_of(BookingStatus.pending),
+        count_of(BookingStatus.confirmed),
+        count_of(BookingStatus.completed),
+        count_of(BookingStatus.cancelled),
+        revenue_of(BookingStatus.pending),
+        revenue_of(BookingStatus.confirmed),
+        revenue_of(BookingStatus.completed),
+        func.coalesce(func.sum(case((Booking.payment_status == PaymentStatus.paid, Booking.total_price))), 0),
+        func.coalesce(func.sum(case((active, Booking.total_hours))), 0),
+        func.now(),
+    ).group_by(Booking.court_id, Booking.booking_date)
+
+    delete = db.query(CourtDailyStats)
+    if from_date:
+        aggregate = aggregate.where(Booking.booking_date >= from_date)
+        delete = delete.filter(CourtDailyStats.stat_date >= from_date)
+    if to_date:
+        aggregate = aggregate.where(Booking.booking_date <= to_date)
+        delete = delete.filter(CourtDailyStats.stat_date <= to_date)
+
+    delete.delete(synchronize_session=False)
+    result = db.execute(
+        insert(CourtDailyStats).from_select(
+            ["court_id", "stat_date", *STAT_COLUMNS, "updated_at"],
+            aggregate
+        )
+    )
+    db.commit()
+    return result.rowcount
@@ -3,7 +3,7 @@ Pricing repository for database operations.
 """
 from sqlalchemy.orm import Session
 from shared.models import CourtPricing
-from typing import Optional, List
+from typing import Optional, List, Sequence
 from datetime import time
 
 
@@ -33,6 +33,11 @@ def get_by_court(db: Session, court_id: int) -> List[CourtPricing]:
     return db.query(CourtPricing).filter(CourtPricing.court_id == court_id).order_by(CourtPricing.created_at.desc()).all()
 
 
+def get_by_courts(db: Session, court_ids: Sequence[int]) -> List[CourtPricing]:
+    """Get all pricing rules of several courts"""
+    return db.query(CourtPricing).filter(CourtPricing.court_id.in_(court_ids)).all()
+
+
 def update(db: Session, pricing: CourtPricing, **kwargs) -> CourtPricing:
     """Update pricing fields"""
     for key, value in kwargs.items():
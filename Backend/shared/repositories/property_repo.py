@@ -1,9 +1,10 @@
 """
 Property repository for database operations.
 """
+from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
-from shared.models import Property
-from typing import Optional, List
+from shared.models import Property, Court
+from typing import Optional, List, Tuple
 
 
 def create(db: Session, *, owner_profile_id: int, name: str, address: str, **kwargs) -> Property:
@@ -25,6 +26,18 @@ def get_by_owner_profile(db: Session, owner_profile_id: int) -> List[Property]:
     return db.query(Property).filter(Property.owner_profile_id == owner_profile_id).order_by(Property.created_at.desc()).all()
 
 
+def count_with_courts_by_owner_profile(db: Session, owner_profile_id: int) -> Tuple[int, int]:
+    """Count an owner's properties and the courts under them"""
+    total_properties, total_courts = (
+        db.query(func.count(func.distinct(Property.id)), func.count(Court.id))
+        .select_from(Property)
+        .outerjoin(Court, Court.property_id == Property.id)
+        .filter(Property.owner_profile_id == owner_profile_id)
+        .one()
+    )
+    return total_properties, total_courts
+
+
 def get_with_courts(db: Session, property_id: int) -> Optional[Property]:
     """Get property with courts eagerly loaded"""
     return (
@@ -0,0 +1,259 @@
+"""
+Async variants of the read-only public service functions.
+
+Same queries, validation and response shapes as public_service, executed
+over an AsyncSession so async callers (the chatbot) read the main database
+on the event loop instead of through a worker thread. Response formatting
+is shared with public_service.
+"""
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from shared.models import Booking, BookingStatus, Court, CourtAvailability, OwnerProfile, Property
+from shared.services import availability_engine, pricing_resolver
+from shared.services.public_service import (
+    _format_court_details,
+    _format_day_pricing,
+    _format_day_slots,
+    _format_owner_catalogue,
+    _format_property_availability,
+    _format_property_details,
+    _format_range_slots,
+    _format_search_page,
+    _search_statements,
+    _sport_condition,
+    _validate_slot_request,
+)
+from shared.utils.response_utils import make_result
+
+
+async def search_properties(
+    db: AsyncSession,
+    *,
+    q: Optional[str] = None,
+    city: Optional[str] = None,
+    sport_type: Optional[str] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    page: int = 1,
+    limit: int = 20
+):
+    """Search and filter properties, best matches first"""
+    page_statement, count_statement = _search_statements(
+        q=q, city=city, sport_type=sport_type, min_price=min_price, max_price=max_price, page=page, limit=limit
+    )
+
+    rows = (await db.execute(page_statement)).all()
+    properties = [row[0] for row in rows]
+
+    if rows:
+        total = rows[0].total
+    else:
+        total = await db.scalar(count_statement) if page > 1 else 0
+
+    return make_result(True, "Properties retrieved successfully", data=_format_search_page(properties, total, page, limit))
+
+
+async def get_property_details(db: AsyncSession, *, property_id: int):
+    """Get property details with courts and media"""
+    property = await db.scalar(
+        select(Property)
+        .options(
+            selectinload(Property.courts).selectinload(Court.media),
+            selectinload(Property.media)
+        )
+        .where(Property.id == property_id, Property.is_active == True)
+    )
+
+    if not property:
+        return make_result(False, "Property not found", status_code=404)
+
+    return make_result(True, "Property details retrieved successfully", data=_format_property_details(property))
+
+
+async def get_owner_catalogue(db: AsyncSession, *, owner_profile_id: int):
+    """Get an owner's profile, properties and public property details at once"""
+    profile = await db.get(OwnerProfile, owner_profile_id)
+    if not profile:
+        return make_result(False, "Owner profile not found", status_code=404)
+
+    properties = (await db.scalars(
+        select(Property)
+        .options(
+            selectinload(Property.courts).selectinload(Court.media),
+            selectinload(Property.media)
+        )
+        .where(Property.owner_profile_id == owner_profile_id)
+        .order_by(Property.created_at.desc())
+    )).all()
+
+    return make_result(True, "Owner catalogue retrieved successfully", data=_format_owner_catalogue(profile, properties))
+
+
+async def get_court_details(db: AsyncSession, *, court_id: int):
+    """Get court details with pricing and media"""
+    court = await db.scalar(
+        select(Court)
+        .options(
+            selectinload(Court.property),
+            selectinload(Court.pricing),
+            selectinload(Court.media)
+        )
+        .where(Court.id == court_id, Court.is_active == True)
+    )
+
+    if not court:
+        return make_result(False, "Court not found", status_code=404)
+
+    return make_result(True, "Court details retrieved successfully", data=_format_court_details(court))
+
+
+async def get_court_pricing_for_date(db: AsyncSession, *, court_id: int, date_val: date):
+    """Get pricing for a specific court and date"""
+    court = await db.get(Court, court_id)
+
+    if not court or not court.is_active:
+        return make_result(False, "Court not found", status_code=404)
+
+    pricing_rules = (await pricing_resolver.get_index_async(db, court_id)).rules_for_day(date_val)
+
+    if not pricing_rules:
+        return make_result(False, "No pricing available for this date", status_code=404)
+
+    return make_result(True, "Pricing retrieved successfully", data=_format_day_pricing(date_val, pricing_rules))
+
+
+async def _busy_intervals(db: AsyncSession, court_id: int, start_date: date, end_date: date):
+    """Blocked slots and active bookings of a court between two dates (inclusive)"""
+    blocked_slots = (await db.scalars(
+        select(CourtAvailability)
+        .where(
+            CourtAvailability.court_id == court_id,
+            CourtAvailability.date >= start_date,
+            CourtAvailability.date <= end_date
+        )
+        .order_by(CourtAvailability.date, CourtAvailability.start_time)
+    )).all()
+
+    bookings = (await db.scalars(
+        select(Booking)
+        .where(
+            Booking.court_id == court_id,
+            Booking.booking_date >= start_date,
+            Booking.booking_date <= end_date,
+            Booking.status.in_([BookingStatus.pending, BookingStatus.confirmed])
+        )
+        .order_by(Booking.booking_date, Booking.start_time)
+    )).all()
+
+    return blocked_slots, bookings
+
+
+async def get_available_slots(db: AsyncSession, *, court_id: int, date_val: date, slot_minutes: int = 60):
+    """Get available time slots for a court on a specific date"""
+    invalid = _validate_slot_request(slot_minutes)
+    if invalid:
+        return invalid
+
+    court = await db.get(Court, court_id)
+
+    if not court or not court.is_active:
+        return make_result(False, "Court not found", status_code=404)
+
+    pricing_rules = (await pricing_resolver.get_index_async(db, court_id)).rules_for_day(date_val)
+
+    if not pricing_rules:
+        return make_result(False, "Court not available on this date", status_code=404)
+
+    blocked_slots, bookings = await _busy_intervals(db, court_id, date_val, date_val)
+
+    slots_by_day = availability_engine.compute_range_slots(
+        pricing_rules, blocked_slots, bookings, date_val, date_val, slot_minutes
+    )
+
+    data = _format_day_slots(court, date_val, slot_minutes, slots_by_day)
+
+    return make_result(True, "Available slots retrieved successfully", data=data)
+
+
+async def get_available_slots_range(
+    db: AsyncSession,
+    *,
+    court_id: int,
+    start_date: date,
+    end_date: date,
+    slot_minutes: int = 60
+):
+    """Get available time slots for a court for every day in a date range"""
+    invalid = _validate_slot_request(slot_minutes, start_date, end_date)
+    if invalid:
+        return invalid
+
+    court = await db.get(Court, court_id)
+
+    if not court or not court.is_active:
+        return make_result(False, "Court not found", status_code=404)
+
+    pricing_rules = (await pricing_resolver.get_index_async(db, court_id)).rules
+    blocked_slots, bookings = await _busy_intervals(db, court_id, start_date, end_date)
+
+    slots_by_day = availability_engine.compute_range_slots(
+        pricing_rules, blocked_slots, bookings, start_date, end_date, slot_minutes
+    )
+
+    data = _format_range_slots(court, start_date, end_date, slot_minutes, slots_by_day)
+
+    return make_result(True, "Available slots retrieved successfully", data=data)
+
+
+async def get_property_availability(
+    db: AsyncSession,
+    *,
+    property_id: int,
+    date_val: date,
+    sport_type: Optional[str] = None,
+    slot_minutes: int = 60
+):
+    """Get a free-slot summary for every active court of a property on a date"""
+    invalid = _validate_slot_request(slot_minutes)
+    if invalid:
+        return invalid
+
+    property = await db.get(Property, property_id)
+
+    if not property or not property.is_active:
+        return make_result(False, "Property not found", status_code=404)
+
+    query = select(Court).where(Court.property_id == property_id, Court.is_active == True)
+    if sport_type:
+        query = query.where(_sport_condition(sport_type))
+    courts = (await db.scalars(query.order_by(Court.name))).all()
+
+    court_ids = [c.id for c in courts]
+    indexes, blocked_slots, bookings = {}, [], []
+    if court_ids:
+        indexes = await pricing_resolver.get_indexes_async(db, court_ids)
+        blocked_slots = (await db.scalars(
+            select(CourtAvailability)
+            .where(CourtAvailability.court_id.in_(court_ids), CourtAvailability.date == date_val)
+            .order_by(CourtAvailability.court_id, CourtAvailability.start_time)
+        )).all()
+        bookings = (await db.scalars(
+            select(Booking)
+            .where(
+                Booking.court_id.in_(court_ids),
+                Booking.booking_date == date_val,
+                Booking.status.in_([BookingStatus.pending, BookingStatus.confirmed])
+            )
+            .order_by(Booking.court_id, Booking.start_time)
+        )).all()
+
+    data = _format_property_availability(
+        property, courts, indexes, blocked_slots, bookings, date_val, sport_type, slot_minutes
+    )
+
+    return make_result(True, "Property availability retrieved successfully", data=data)
@@ -0,0 +1,178 @@
+"""
+Interval-based slot availability engine.
+
+Times are handled as minutes from midnight so a day's busy time (bookings and
+owner blocks) can be merged once and subtracted from each pricing window,
+instead of testing every candidate slot against every booking and block.
+An end time at or before its start time (e.g. 18:00-00:00) runs to midnight.
+
+Bookable slots never end at midnight: a booking stores its end time on the
+booking date, so a 23:00-00:00 slot could not be quoted or stored. The last
+slot of a window that runs to midnight therefore ends before 00:00.
+"""
+from collections import defaultdict
+from datetime import date, time, timedelta
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+DAY_MINUTES = 24 * 60
+# Latest end of a bookable slot (23:59); see the module docstring
+LAST_SLOT_END = DAY_MINUTES - 1
+SLOT_MINUTES_CHOICES = (30, 60, 90)
+
+Interval = Tuple[int, int]
+
+
+def to_minutes(value: time) -> int:
+    """Minutes from midnight for a time value"""
+    return value.hour * 60 + value.minute
+
+
+def to_time(minutes: int) -> time:
+    """Time value for minutes from midnight; 24:00 wraps to 00:00"""
+    minutes %= DAY_MINUTES
+    return time(minutes // 60, minutes % 60)
+
+
+def to_interval(start: time, end: time) -> Interval:
+    """Minute interval for a start/end pair, running to midnight when end <= start"""
+    start_min = to_minutes(start)
+    end_min = to_minutes(end)
+    if end_min <= start_min:
+        end_min = DAY_MINUTES
+    return start_min, end_min
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """Merge overlapping or touching intervals into a sorted disjoint list"""
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_intervals(window: Interval, busy: Sequence[Interval]) -> List[Interval]:
+    """Free parts of a window given merged, sorted busy intervals"""
+    free: List[Interval] = []
+    cursor, window_end = window
+    for start, end in busy:
+        if end <= cursor:
+            continue
+        if start >= window_end:
+            break
+        if start > cursor:
+            free.append((cursor, start))
+        cursor = max(cursor, end)
+        if cursor >= window_end:
+            break
+    if cursor < window_end:
+        free.append((cursor, window_end))
+    return free
+
+
+def slots_for_window(window: Interval, busy: Sequence[Interval], slot_minutes: int) -> List[Interval]:
+    """
+    Bookable slots inside a pricing window.
+
+    Slots start on the window's grid (window start + n * slot_minutes) and must
+    fit completely inside both the window and a free interval, and end
+    before midnight.
+    """
+    window_start, window_end = window[0], min(window[1], LAST_SLOT_END)
+    window = (window_start, window_end)
+    slots: List[Interval] = []
+    for free_start, free_end in subtract_intervals(window, busy):
+        offset = (free_start - window_start) % slot_minutes
+        slot_start = free_start if offset == 0 else free_start + slot_minutes - offset
+        while slot_start + slot_minutes <= free_end:
+            slots.append((slot_start, slot_start + slot_minutes))
+            slot_start += slot_minutes
+    return slots
+
+
+def busy_by_date(*groups: Iterable) -> Dict[date, List[Interval]]:
+    """
+    Merge busy intervals per date.
+
+    Each group holds rows with a date attribute (``date`` for blocks,
+    ``booking_date`` for bookings) plus ``start_time``/``end_time``.
+    """
+    raw: Dict[date, List[Interval]] = defaultdict(list)
+    for rows in groups:
+        for row in rows:
+            day = getattr(row, "booking_date", None) or row.date
+            raw[day].append(to_interval(row.start_time, row.end_time))
+    return {day: merge_intervals(intervals) for day, intervals in raw.items()}
+
+
+def compute_day_slots(pricing_rules: Sequence, busy: Sequence[Interval], day: date, slot_minutes: int) -> List[dict]:
+    """Available slots for one day, in pricing-rule order"""
+    weekday = day.weekday()
+    available = []
+    for pricing in pricing_rules:
+        if weekday not in (pricing.days or []):
+            continue
+        window = to_interval(pricing.start_time, pricing.end_time)
+        for start, end in slots_for_window(window, busy, slot_minutes):
+            available.append({
+                "start_time": to_time(start).isoformat(),
+                "end_time": to_time(end).isoformat(),
+                "price_per_hour": pricing.price_per_hour,
+                "label": pricing.label
+            })
+    return available
+
+
+def compute_range_slots(
+    pricing_rules: Sequence,
+    blocks: Iterable,
+    bookings: Iterable,
+    start_date: date,
+    end_date: date,
+    slot_minutes: int = 60
+) -> Dict[date, List[dict]]:
+    """
+    Available slots for every day from start_date to end_date (inclusive).
+
+    Days with no pricing rule for their weekday are omitted; days that are
+    priced but fully taken map to an empty list.
+    """
+    rules = sorted(pricing_rules, key=lambda p: p.start_time)
+    busy = busy_by_date(blocks, bookings)
+    priced_weekdays = {day for pricing in rules for day in (pricing.days or [])}
+
+    result: Dict[date, List[dict]] = {}
+    day = start_date
+    while day <= end_date:
+        if day.weekday() in priced_weekdays:
+            result[day] = compute_day_slots(rules, busy.get(day, []), day, slot_minutes)
+        day += timedelta(days=1)
+    return result
+
+
+def free_windows(slots: Sequence[dict]) -> List[dict]:
+    """
+    Collapse consecutive slots (as from compute_day_slots) into free windows.
+
+    Each window carries HH:MM bounds and the range of hourly prices of the
+    slots it covers, e.g. 18:00-21:00 at 2000-2500.
+    """
+    windows: List[dict] = []
+    for slot in slots:
+        start, end, price = slot["start_time"][:5], slot["end_time"][:5], slot["price_per_hour"]
+        if windows and windows[-1]["end_time"] == start:
+            window = windows[-1]
+            window["end_time"] = end
+            window["min_price_per_hour"] = min(window["min_price_per_hour"], price)
+            window["max_price_per_hour"] = max(window["max_price_per_hour"], price)
+        else:
+            windows.append({
+                "start_time": start,
+                "end_time": end,
+                "min_price_per_hour": price,
+                "max_price_per_hour": price
+            })
+    return windows
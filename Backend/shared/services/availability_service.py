@@ -3,7 +3,7 @@ Availability service for business logic operations.
 """
 from sqlalchemy.orm import Session
 from shared.repositories import property_repo, court_repo, availability_repo
-from shared.utils.response_utils import make_response
+from shared.utils.response_utils import make_result
 from shared.utils import OwnerContext
 from shared.schemas.availability import CourtAvailabilityCreate
 from datetime import date
@@ -14,14 +14,14 @@ def block_time_slot(db: Session, *, court_id: int, current_owner: OwnerContext,
     court = court_repo.get_by_id(db, court_id)
 
     if not court:
-        return make_response(False, "Court not found", status_code=404)
+        return make_result(False, "Court not found", status_code=404)
 
     property = property_repo.get_by_id(db, court.property_id)
     if not property or property.owner_profile_id != current_owner.owner_profile_id:
-        return make_response(False, "Access denied", status_code=403)
+        return make_result(False, "Access denied", status_code=403)
 
     if availability_repo.check_overlap(db, court_id, data.date, data.start_time, data.end_time):
-        return make_response(
+        return make_result(
             False,
             "Time slot overlaps with existing blocked slot",
             status_code=409
@@ -36,7 +36,7 @@ def block_time_slot(db: Session, *, court_id: int, current_owner: OwnerContext,
             end_time=data.end_time,
             reason=data.reason
         )
-        return make_response(
+        return make_result(
             True,
             "Time slot blocked successfully",
             data={
@@ -49,7 +49,7 @@ def block_time_slot(db: Session, *, court_id: int, current_owner: OwnerContext,
             status_code=201
         )
     except Exception as e:
-        return make_response(False, "Failed to block time slot", status_code=500, error=str(e))
+        return make_result(False, "Failed to block time slot", status_code=500, error=str(e))
 
 
 def get_blocked_slots(db: Session, *, court_id: int, current_owner: OwnerContext, from_date: date = None):
@@ -57,11 +57,11 @@ def get_blocked_slots(db: Session, *, court_id: int, current_owner: OwnerContext
     court = court_repo.get_by_id(db, court_id)
 
     if not court:
-        return make_response(False, "Court not found", status_code=404)
+        return make_result(False, "Court not found", status_code=404)
 
     property = property_repo.get_by_id(db, court.property_id)
     if not property or property.owner_profile_id != current_owner.owner_profile_id:
-        return make_response(False, "Access denied", status_code=403)
+        return make_result(False, "Access denied", status_code=403)
 
     blocked_slots = availability_repo.get_by_court(db, court_id, from_date or date.today())
 
@@ -76,7 +76,7 @@ def get_blocked_slots(db: Session, *, court_id: int, current_owner: OwnerContext
         for slot in blocked_slots
     ]
 
-    return make_response(True, "Blocked slots retrieved successfully", data=data)
+    return make_result(True, "Blocked slots retrieved successfully", data=data)
 
 
 def unblock_time_slot(db: Session, *, availability_id: int, current_owner: OwnerContext):
@@ -84,15 +84,15 @@ def unblock_time_slot(db: Session, *, availability_id: int, current_owner: Owner
     availability = availability_repo.get_by_id(db, availability_id)
 
     if not availability:
-        return make_response(False, "Blocked slot not found", status_code=404)
+        return make_result(False, "Blocked slot not found", status_code=404)
 
     court = court_repo.get_by_id(db, availability.court_id)
     property = property_repo.get_by_id(db, court.property_id)
     if not property or property.owner_profile_id != current_owner.owner_profile_id:
-        return make_response(False, "Access denied", status_code=403)
+        return make_result(False, "Access denied", status_code=403)
 
     try:
         availability_repo.delete(db, availability)
-        return make_response(True, "Time slot unblocked successfully")
+        return make_result(True, "Time slot unblocked successfully")
     except Exception as e:
-        return make_response(False, "Failed to unblock time slot", status_code=500, error=str(e))
+        return make_result(False, "Failed to unblock time slot", status_code=500, error=str(e))
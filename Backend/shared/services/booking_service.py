@@ -1,13 +1,18 @@
 """
 Booking service for business logic operations.
 """
+from datetime import date, time
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from shared.repositories import booking_repo, court_repo, pricing_repo, availability_repo, property_repo
-from shared.utils.response_utils import make_response
+from shared.services import pricing_resolver
+from shared.utils.response_utils import make_result
 from shared.utils import OwnerContext
+from shared.utils.cursor import decode_cursor, encode_cursor
 from shared.schemas.booking import BookingCreate
-from shared.models import BookingStatus, PaymentStatus, CourtPricing
-from datetime import datetime, timedelta
+from shared.models import BookingStatus, PaymentStatus, BOOKING_OVERLAP_CONSTRAINT
 
 
 def create_booking(db: Session, *, customer_id: int, data: BookingCreate):
@@ -15,39 +20,25 @@ def create_booking(db: Session, *, customer_id: int, data: BookingCreate):
     court = court_repo.get_by_id(db, data.court_id)
 
     if not court or not court.is_active:
-        return make_response(False, "Court not found or inactive", status_code=404)
+        return make_result(False, "Court not found or inactive", status_code=404)
 
     blocked_slots = availability_repo.get_by_date(db, data.court_id, data.booking_date)
     for block in blocked_slots:
         if not (data.end_time <= block.start_time or data.start_time >= block.end_time):
-            return make_response(
+            return make_result(
                 False,
                 f"Court is not available during this time. Reason: {block.reason or 'Blocked'}",
                 status_code=409
             )
 
-    if booking_repo.check_conflict(db, data.court_id, data.booking_date, data.start_time, data.end_time):
-        return make_response(False, "This time slot is already booked", status_code=409)
-
-    day_of_week = data.booking_date.weekday()
-    pricing = (
-        db.query(CourtPricing)
-        .filter(
-            CourtPricing.court_id == data.court_id,
-            CourtPricing.days.contains([day_of_week]),
-            CourtPricing.start_time <= data.start_time,
-            CourtPricing.end_time >= data.end_time
-        )
-        .first()
+    # Ranges that straddle two adjacent rules are charged per rule; the
+    # price is stored, so it is quoted from freshly loaded rules
+    quote = pricing_resolver.get_index(db, data.court_id, fresh=True).quote(
+        data.booking_date, data.start_time, data.end_time
     )
 
-    if not pricing:
-        return make_response(False, "No pricing available for this time slot", status_code=400)
-
-    start_datetime = datetime.combine(data.booking_date, data.start_time)
-    end_datetime = datetime.combine(data.booking_date, data.end_time)
-    total_hours = (end_datetime - start_datetime).total_seconds() / 3600
-    total_price = total_hours * pricing.price_per_hour
+    if not quote:
+        return make_result(False, "No pricing available for this time slot", status_code=400)
 
     try:
         booking = booking_repo.create(
@@ -57,13 +48,13 @@ def create_booking(db: Session, *, customer_id: int, data: BookingCreate):
             booking_date=data.booking_date,
             start_time=data.start_time,
             end_time=data.end_time,
-            total_hours=total_hours,
-            price_per_hour=pricing.price_per_hour,
-            total_price=total_price,
+            total_hours=quote.total_hours,
+            price_per_hour=quote.price_per_hour,
+            total_price=quote.total_price,
             notes=data.notes
         )
 
-        return make_response(
+        return make_result(
             True,
             "Booking created successfully",
             data={
@@ -77,32 +68,78 @@ def create_booking(db: Session, *, customer_id: int, data: BookingCreate):
             },
             status_code=201
         )
+    except IntegrityError as e:
+        db.rollback()
+        # Overlapping active bookings are rejected by the database itself
+        if BOOKING_OVERLAP_CONSTRAINT in str(e.orig):
+            return make_result(False, "This time slot is already booked", status_code=409)
+        return make_result(False, "Failed to create booking", status_code=500, error=str(e))
     except Exception as e:
-        return make_response(False, "Failed to create booking", status_code=500, error=str(e))
+        return make_result(False, "Failed to create booking", status_code=500, error=str(e))
+
+
+def _decode_booking_cursor(cursor: Optional[str]):
+    """(booking_date, start_time, id) of a booking list cursor, or None"""
+    if not cursor:
+        return None
+    booking_date, start_time, booking_id = decode_cursor(cursor, 3)
+    return date.fromisoformat(booking_date), time.fromisoformat(start_time), int(booking_id)
+
+
+def _format_booking_page(rows, limit: int, extra_fields) -> dict:
+    """One page of a booking list; rows holds up to limit + 1 rows"""
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        last = page[-1]
+        next_cursor = encode_cursor(last.booking_date.isoformat(), last.start_time.isoformat(), last.id)
+
+    return {
+        "items": [
+            {
+                "id": b.id,
+                "booking_date": b.booking_date.isoformat(),
+                "start_time": b.start_time.isoformat(),
+                "end_time": b.end_time.isoformat(),
+                "total_price": b.total_price,
+                "status": b.status.value,
+                "payment_status": b.payment_status.value,
+                "court_name": b.court_name,
+                "sport_type": b.sport_type,
+                "property_name": b.property_name,
+                **{field: getattr(b, field) for field in extra_fields}
+            }
+            for b in page
+        ],
+        "next_cursor": next_cursor,
+        "limit": limit
+    }
 
 
-def get_user_bookings(db: Session, *, user_id: int):
-    """Get all bookings for a user"""
-    bookings = booking_repo.get_by_customer(db, user_id)
+def get_user_bookings(
+    db: Session,
+    *,
+    user_id: int,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    status: Optional[BookingStatus] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None
+):
+    """Get one page of a user's bookings, latest first"""
+    try:
+        before = _decode_booking_cursor(cursor)
+    except (ValueError, TypeError):
+        return make_result(False, "Invalid cursor", status_code=400)
+
+    # One extra row tells whether another page follows
+    rows = booking_repo.list_by_customer(
+        db, user_id, limit=limit + 1, before=before, status=status, from_date=from_date, to_date=to_date
+    )
 
-    data = [
-        {
-            "id": b.id,
-            "booking_date": b.booking_date.isoformat(),
-            "start_time": b.start_time.isoformat(),
-            "end_time": b.end_time.isoformat(),
-            "total_price": b.total_price,
-            "status": b.status.value,
-            "payment_status": b.payment_status.value,
-            "court_name": b.court.name,
-            "sport_type": b.court.sport_type,
-            "property_name": b.court.property.name,
-            "property_address": b.court.property.address
-        }
-        for b in bookings
-    ]
+    data = _format_booking_page(rows, limit, extra_fields=("property_address",))
 
-    return make_response(True, "Bookings retrieved successfully", data=data)
+    return make_result(True, "Bookings retrieved successfully", data=data)
 
 
 def get_booking_details(db: Session, *, booking_id: int, user_id: int):
@@ -110,13 +147,13 @@ def get_booking_details(db: Session, *, booking_id: int, user_id: int):
     booking = booking_repo.get_with_details(db, booking_id)
 
     if not booking:
-        return make_response(False, "Booking not found", status_code=404)
+        return make_result(False, "Booking not found", status_code=404)
 
     is_customer = booking.customer_id == user_id
     is_owner = booking.court.property.owner_profile_id  # We'll check this in the router
 
     if not is_customer and not is_owner:
-        return make_response(False, "Access denied", status_code=403)
+        return make_result(False, "Access denied", status_code=403)
 
     data = {
         "id": booking.id,
@@ -147,24 +184,24 @@ def get_booking_details(db: Session, *, booking_id: int, user_id: int):
         } if is_owner else None
     }
 
-    return make_response(True, "Booking details retrieved successfully", data=data)
+    return make_result(True, "Booking details retrieved successfully", data=data)
 
 
 def cancel_booking(db: Session, *, booking_id: int, user_id: int):
     """Cancel a booking (customer only)"""
-    booking = booking_repo.get_with_details(db, booking_id)
+    booking = booking_repo.get_with_details(db, booking_id, for_update=True)
 
     if not booking:
-        return make_response(False, "Booking not found", status_code=404)
+        return make_result(False, "Booking not found", status_code=404)
 
     if booking.customer_id != user_id:
-        return make_response(False, "Only the customer can cancel their booking", status_code=403)
+        return make_result(False, "Only the customer can cancel their booking", status_code=403)
 
     if booking.status == BookingStatus.cancelled:
-        return make_response(False, "Booking is already cancelled", status_code=400)
+        return make_result(False, "Booking is already cancelled", status_code=400)
 
     if booking.status == BookingStatus.completed:
-        return make_response(False, "Cannot cancel completed booking", status_code=400)
+        return make_result(False, "Cannot cancel completed booking", status_code=400)
 
     try:
         booking_repo.update_status(db, booking, BookingStatus.cancelled)
@@ -172,70 +209,77 @@ def cancel_booking(db: Session, *, booking_id: int, user_id: int):
         if booking.payment_status == PaymentStatus.paid:
             booking_repo.update_payment_status(db, booking, PaymentStatus.refunded)
 
-        return make_response(True, "Booking cancelled successfully")
+        return make_result(True, "Booking cancelled successfully")
     except Exception as e:
-        return make_response(False, "Failed to cancel booking", status_code=500, error=str(e))
+        return make_result(False, "Failed to cancel booking", status_code=500, error=str(e))
 
 
 def confirm_booking(db: Session, *, booking_id: int, current_owner: OwnerContext):
     """Confirm a booking (owner only)"""
-    booking = booking_repo.get_with_details(db, booking_id)
+    booking = booking_repo.get_with_details(db, booking_id, for_update=True)
 
     if not booking:
-        return make_response(False, "Booking not found", status_code=404)
+        return make_result(False, "Booking not found", status_code=404)
 
     if booking.court.property.owner_profile_id != current_owner.owner_profile_id:
-        return make_response(False, "Only the property owner can confirm bookings", status_code=403)
+        return make_result(False, "Only the property owner can confirm bookings", status_code=403)
 
     if booking.status != BookingStatus.pending:
-        return make_response(False, f"Cannot confirm booking with status: {booking.status.value}", status_code=400)
+        return make_result(False, f"Cannot confirm booking with status: {booking.status.value}", status_code=400)
 
     try:
         booking_repo.update_status(db, booking, BookingStatus.confirmed)
-        return make_response(True, "Booking confirmed successfully")
+        return make_result(True, "Booking confirmed successfully")
     except Exception as e:
-        return make_response(False, "Failed to confirm booking", status_code=500, error=str(e))
+        return make_result(False, "Failed to confirm booking", status_code=500, error=str(e))
 
 
 def complete_booking(db: Session, *, booking_id: int, current_owner: OwnerContext):
     """Mark booking as completed (owner only)"""
-    booking = booking_repo.get_with_details(db, booking_id)
+    booking = booking_repo.get_with_details(db, booking_id, for_update=True)
 
     if not booking:
-        return make_response(False, "Booking not found", status_code=404)
+        return make_result(False, "Booking not found", status_code=404)
 
     if booking.court.property.owner_profile_id != current_owner.owner_profile_id:
-        return make_response(False, "Only the property owner can complete bookings", status_code=403)
+        return make_result(False, "Only the property owner can complete bookings", status_code=403)
 
     if booking.status not in [BookingStatus.pending, BookingStatus.confirmed]:
-        return make_response(False, f"Cannot complete booking with status: {booking.status.value}", status_code=400)
+        return make_result(False, f"Cannot complete booking with status: {booking.status.value}", status_code=400)
 
     try:
         booking_repo.update_status(db, booking, BookingStatus.completed)
-        return make_response(True, "Booking marked as completed")
+        return make_result(True, "Booking marked as completed")
     except Exception as e:
-        return make_response(False, "Failed to complete booking", status_code=500, error=str(e))
-
-
-def get_owner_bookings(db: Session, *, current_owner: OwnerContext):
-    """Get all bookings for properties owned by user"""
-    bookings = booking_repo.get_by_property_owner(db, current_owner.owner_profile_id)
-
-    data = [
-        {
-            "id": b.id,
-            "booking_date": b.booking_date.isoformat(),
-            "start_time": b.start_time.isoformat(),
-            "end_time": b.end_time.isoformat(),
-            "total_price": b.total_price,
-            "status": b.status.value,
-            "payment_status": b.payment_status.value,
-            "court_name": b.court.name,
-            "property_name": b.court.property.name,
-            "customer_name": b.customer.Name,
-            "customer_email": b.customer.email
-        }
-        for b in bookings
-    ]
-
-    return make_response(True, "Bookings retrieved successfully", data=data)
+        return make_result(False, "Failed to complete booking", status_code=500, error=str(e))
+
+
+def get_owner_bookings(
+    db: Session,
+    *,
+    current_owner: OwnerContext,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    status: Optional[BookingStatus] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None
+):
+    """Get one page of bookings for properties owned by user, latest first"""
+    try:
+        before = _decode_booking_cursor(cursor)
+    except (ValueError, TypeError):
+        return make_result(False, "Invalid cursor", status_code=400)
+
+    rows = booking_repo.list_by_property_owner(
+        db,
+        current_owner.owner_profile_id,
+        limit=limit + 1,
+        before=before,
+        status=status,
+        from_date=from_date,
+        to_date=to_date
+    )
+
+    data = _format_booking_page(rows, limit, extra_fields=("customer_name", "customer_email"))
+
+    return make_result(True, "Bookings retrieved successfully", data=data)
@@ -3,8 +3,9 @@ Court service for business logic operations.
 """
 from sqlalchemy.orm import Session
 from shared.repositories import court_repo, property_repo
-from shared.utils.response_utils import make_response
+from shared.utils.response_utils import make_result
 from shared.utils import OwnerContext
+from shared.utils.catalogue_signal import notify_catalogue_changed
 from shared.schemas.court import CourtCreate, CourtUpdate
 
 
@@ -13,10 +14,10 @@ def create_court(db: Session, *, property_id: int, current_owner: OwnerContext,
     property = property_repo.get_by_id(db, property_id)
 
     if not property:
-        return make_response(False, "Property not found", status_code=404)
+        return make_result(False, "Property not found", status_code=404)
 
     if property.owner_profile_id != current_owner.owner_profile_id:
-        return make_response(False, "Access denied", status_code=403)
+        return make_result(False, "Access denied", status_code=403)
 
     try:
         court = court_repo.create(
@@ -24,14 +25,15 @@ def create_court(db: Session, *, property_id: int, current_owner: OwnerContext,
             property_id=property_id,
             **data.model_dump()
         )
-        return make_response(
+        notify_catalogue_changed(db, current_owner.owner_profile_id)
+        return make_result(
             True,
             "Court created successfully",
             data={"id": court.id, "name": court.name, "sport_type": court.sport_type},
             status_code=201
         )
     except Exception as e:
-        return make_response(False, "Failed to create court", status_code=500, error=str(e))
+        return make_result(False, "Failed to create court", status_code=500, error=str(e))
 
 
 def get_property_courts(db: Session, *, property_id: int, current_owner: OwnerContext):
@@ -39,10 +41,10 @@ def get_property_courts(db: Session, *, property_id: int, current_owner: OwnerCo
     property = property_repo.get_by_id(db, property_id)
 
     if not property:
-        return make_response(False, "Property not found", status_code=404)
+        return make_result(False, "Property not found", status_code=404)
 
     if property.owner_profile_id != current_owner.owner_profile_id:
-        return make_response(False, "Access denied", status_code=403)
+        return make_result(False, "Access denied", status_code=403)
 
     courts = court_repo.get_by_property(db, property_id)
 
@@ -59,7 +61,7 @@ def get_property_courts(db: Session, *, property_id: int, current_owner: OwnerCo
         for c in courts
     ]
 
-    return make_response(True, "Courts retrieved successfully", data=data)
+    return make_result(True, "Courts retrieved successfully", data=data)
 
 
 def get_court_details(db: Session, *, court_id: int, current_owner: OwnerContext):
@@ -67,11 +69,11 @@ def get_court_details(db: Session, *, court_id: int, current_owner: OwnerContext
     court = court_repo.get_by_id(db, court_id)
 
     if not court:
-        return make_response(False, "Court not found", status_code=404)
+        return make_result(False, "Court not found", status_code=404)
 
     property = property_repo.get_by_id(db, court.property_id)
     if not property or property.owner_profile_id != current_owner.owner_profile_id:
-        return make_response(False, "Access denied", status_code=403)
+        return make_result(False, "Access denied", status_code=403)
 
     data = {
         "id": court.id,
@@ -85,7 +87,7 @@ def get_court_details(db: Session, *, court_id: int, current_owner: OwnerContext
         "created_at": court.created_at.isoformat() if court.created_at else None
     }
 
-    return make_response(True, "Court retrieved successfully", data=data)
+    return make_result(True, "Court retrieved successfully", data=data)
 
 
 def update_court(db: Session, *, court_id: int, current_owner: OwnerContext, data: CourtUpdate):
@@ -93,21 +95,22 @@ def update_court(db: Session, *, court_id: int, current_owner: OwnerContext, dat
     court = court_repo.get_by_id(db, court_id)
 
     if not court:
-        return make_response(False, "Court not found", status_code=404)
+        return make_result(False, "Court not found", status_code=404)
 
     property = property_repo.get_by_id(db, court.property_id)
     if not property or property.owner_profile_id != current_owner.owner_profile_id:
-        return make_response(False, "Access denied", status_code=403)
+        return make_result(False, "Access denied", status_code=403)
 
     try:
         updated = court_repo.update(db, court, **data.model_dump(exclude_unset=True))
-        return make_response(
+        notify_catalogue_changed(db, current_owner.owner_profile_id)
+        return make_result(
             True,
             "Court updated successfully",
             data={"id": updated.id, "name": updated.name}
         )
     except Exception as e:
-        return make_response(False, "Failed to update court", status_code=500, error=str(e))
+        return make_result(False, "Failed to update court", status_code=500, error=str(e))
 
 
 def delete_court(db: Session, *, court_id: int, current_owner: OwnerContext):
@@ -115,14 +118,15 @@ def delete_court(db: Session, *, court_id: int, current_owner: OwnerContext):
     court = court_repo.get_by_id(db, court_id)
 
     if not court:
-        return make_response(False, "Court not found", status_code=404)
+        return make_result(False, "Court not found", status_code=404)
 
     property = property_repo.get_by_id(db, court.property_id)
     if not property or property.owner_profile_id != current_owner.owner_profile_id:
-        return make_response(False, "Access denied", status_code=403)
+        return make_result(False, "Access denied", status_code=403)
 
     try:
         court_repo.delete(db, court)
-        return make_response(True, "Court deleted successfully")
+        notify_catalogue_changed(db, current_owner.owner_profile_id)
+        return make_result(True, "Court deleted successfully")
     except Exception as e:
-        return make_response(False, "Failed to delete court", status_code=500, error=str(e))
+        return make_result(False, "Failed to delete court", status_code=500, error=str(e))
@@ -1,11 +1,11 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from shared.repositories import owner_repo, property_repo, court_repo, booking_repo
-from shared.utils.response_utils import make_response
+from shared.repositories import owner_repo, property_repo, court_repo, booking_repo, daily_stats_repo
+from shared.utils.response_utils import make_result
 from shared.utils import OwnerContext
+from shared.utils.catalogue_signal import notify_catalogue_changed
 from shared.schemas.owner import OwnerProfileCreate, OwnerProfileUpdate
-from shared.models import Booking, BookingStatus, PaymentStatus, Property, Court
-from datetime import datetime, timedelta
+from datetime import date
+from typing import Optional
 
 
 def create_or_update_profile(db: Session, *, current_owner: OwnerContext, data: OwnerProfileCreate):
@@ -13,11 +13,12 @@ def create_or_update_profile(db: Session, *, current_owner: OwnerContext, data:
     profile = owner_repo.get_by_user_id(db, current_owner.user_id)
     
     if not profile:
-        return make_response(False, "Profile not found", status_code=404)
+        return make_result(False, "Profile not found", status_code=404)
     
     try:
         updated = owner_repo.update(db, profile, **data.model_dump(exclude_unset=True))
-        return make_response(
+        notify_catalogue_changed(db, updated.id)
+        return make_result(
             True,
             "Profile updated successfully",
             data={
@@ -29,7 +30,7 @@ def create_or_update_profile(db: Session, *, current_owner: OwnerContext, data:
             }
         )
     except Exception as e:
-        return make_response(False, "Failed to save profile", status_code=500, error=str(e))
+        return make_result(False, "Failed to save profile", status_code=500, error=str(e))
 
 
 def get_profile(db: Session, *, current_owner: OwnerContext):
@@ -37,7 +38,7 @@ def get_profile(db: Session, *, current_owner: OwnerContext):
     profile = owner_repo.get_by_user_id(db, current_owner.user_id)
     
     if not profile:
-        return make_response(False, "Profile not found", status_code=404)
+        return make_result(False, "Profile not found", status_code=404)
     
     data = {
         "id": profile.id,
@@ -48,62 +49,62 @@ def get_profile(db: Session, *, current_owner: OwnerContext):
         "created_at": profile.created_at.isoformat() if profile.created_at else None
     }
     
-    return make_response(True, "Profile retrieved successfully", data=data)
+    return make_result(True, "Profile retrieved successfully", data=data)
 
 
-def get_dashboard_stats(db: Session, *, current_owner: OwnerContext):
-    """Get dashboard statistics for owner"""
+def get_dashboard_stats(
+    db: Session,
+    *,
+    current_owner: OwnerContext,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None
+):
+    """Get dashboard statistics for owner, optionally limited to a booking date range"""
+    if from_date and to_date and to_date < from_date:
+        return make_result(False, "to_date must not be before from_date", status_code=400)
+
     # Use owner_profile_id from token (no DB query needed!)
-    properties = property_repo.get_by_owner_profile(db, current_owner.owner_profile_id)
-    total_properties = len(properties)
-    
-    total_courts = sum(len(p.courts) for p in properties)
-    
-    bookings = booking_repo.get_by_property_owner(db, current_owner.owner_profile_id)
-    
-    total_bookings = len(bookings)
-    pending_bookings = sum(1 for b in bookings if b.status == BookingStatus.pending)
-    confirmed_bookings = sum(1 for b in bookings if b.status == BookingStatus.confirmed)
-    completed_bookings = sum(1 for b in bookings if b.status == BookingStatus.completed)
-    cancelled_bookings = sum(1 for b in bookings if b.status == BookingStatus.cancelled)
-    
-    total_revenue = sum(b.total_price for b in bookings if b.status == BookingStatus.completed)
-    pending_revenue = sum(b.total_price for b in bookings if b.status == BookingStatus.pending)
-    confirmed_revenue = sum(b.total_price for b in bookings if b.status == BookingStatus.confirmed)
-    
-    revenue_by_property = {}
-    for booking in bookings:
-        if booking.status == BookingStatus.completed:
-            prop_id = booking.court.property_id
-            prop_name = booking.court.property.name
-            
-            if prop_id not in revenue_by_property:
-                revenue_by_property[prop_id] = {
-                    "property_id": prop_id,
-                    "property_name": prop_name,
-                    "total_bookings": 0,
-                    "total_revenue": 0.0
-                }
-            
-            revenue_by_property[prop_id]["total_bookings"] += 1
-            revenue_by_property[prop_id]["total_revenue"] += booking.total_price
-    
-    recent_bookings = sorted(bookings, key=lambda b: (b.booking_date, b.start_time), reverse=True)[:10]
+    owner_profile_id = current_owner.owner_profile_id
+    total_properties, total_courts = property_repo.count_with_courts_by_owner_profile(db, owner_profile_id)
+
+    # Counts and revenue come from the per-court daily rollup, not raw bookings
+    totals = daily_stats_repo.get_owner_totals(db, owner_profile_id, from_date=from_date, to_date=to_date)
+
+    revenue_by_property = [
+        {
+            "property_id": prop_id,
+            "property_name": prop_name,
+            "total_bookings": int(count),
+            "total_revenue": float(revenue)
+        }
+        for prop_id, prop_name, count, revenue in daily_stats_repo.get_owner_revenue_by_property(
+            db, owner_profile_id, from_date=from_date, to_date=to_date
+        )
+    ]
+
+    recent_bookings = booking_repo.get_recent_by_property_owner(
+        db, owner_profile_id, limit=10, from_date=from_date, to_date=to_date
+    )
     
     data = {
         "stats": {
             "total_properties": total_properties,
             "total_courts": total_courts,
-            "total_bookings": total_bookings,
-            "pending_bookings": pending_bookings,
-            "confirmed_bookings": confirmed_bookings,
-            "completed_bookings": completed_bookings,
-            "cancelled_bookings": cancelled_bookings,
-            "total_revenue": total_revenue,
-            "pending_revenue": pending_revenue,
-            "confirmed_revenue": confirmed_revenue
+            "total_bookings": int(
+                totals["pending_count"] + totals["confirmed_count"]
+                + totals["completed_count"] + totals["cancelled_count"]
+            ),
+            "pending_bookings": int(totals["pending_count"]),
+            "confirmed_bookings": int(totals["confirmed_count"]),
+            "completed_bookings": int(totals["completed_count"]),
+            "cancelled_bookings": int(totals["cancelled_count"]),
+            "total_revenue": float(totals["completed_revenue"]),
+            "pending_revenue": float(totals["pending_revenue"]),
+            "confirmed_revenue": float(totals["confirmed_revenue"]),
+            "paid_revenue": float(totals["paid_revenue"]),
+            "booked_hours": float(totals["booked_hours"])
         },
-        "revenue_by_property": list(revenue_by_property.values()),
+        "revenue_by_property": revenue_by_property,
         "recent_bookings": [
             {
                 "id": b.id,
@@ -119,7 +120,11 @@ def get_dashboard_stats(db: Session, *, current_owner: OwnerContext):
                 "customer_email": b.customer.email
             }
             for b in recent_bookings
-        ]
+        ],
+        "filters": {
+            "from_date": from_date.isoformat() if from_date else None,
+            "to_date": to_date.isoformat() if to_date else None
+        }
     }
     
-    return make_response(True, "Dashboard stats retrieved successfully", data=data)
+    return make_result(True, "Dashboard stats retrieved successfully", data=data)
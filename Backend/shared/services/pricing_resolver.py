@@ -0,0 +1,201 @@
+"""
+Per-court pricing resolver.
+
+All pricing rules of a court are loaded once and indexed per weekday as
+sorted minute intervals, so price lookups no longer query court_pricing
+with an ARRAY containment filter on every call. Indexes are cached per
+court; the management pricing service invalidates a court's entry when its
+rules change and sends the catalogue change signal, on which the chatbot's
+listener drops its indexes. A TTL bounds staleness in processes that miss
+both. Booking writes always quote from freshly loaded rules (fresh=True),
+so a stale index can never set a booking's price.
+"""
+import threading
+import time as clock
+from dataclasses import dataclass
+from datetime import date, time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from shared.models import CourtPricing
+from shared.repositories import pricing_repo
+from shared.services.availability_engine import to_interval, to_minutes
+
+CACHE_TTL_SECONDS = 300
+
+
+@dataclass(frozen=True)
+class PricingRule:
+    """Session-independent copy of a CourtPricing row"""
+    id: int
+    days: Tuple[int, ...]
+    start_time: time
+    end_time: time
+    price_per_hour: float
+    label: Optional[str]
+
+
+@dataclass(frozen=True)
+class PriceQuote:
+    """Price for a booking range, split into the rules it spans"""
+    total_hours: float
+    total_price: float
+    segments: Tuple[dict, ...]
+
+    @property
+    def price_per_hour(self) -> float:
+        """Blended hourly rate across all segments"""
+        return self.total_price / self.total_hours if self.total_hours else 0.0
+
+
+class PricingIndex:
+    """Pricing rules of one court indexed by weekday"""
+
+    def __init__(self, rules: Sequence[PricingRule]):
+        self.rules: List[PricingRule] = sorted(rules, key=lambda r: r.start_time)
+        self._by_weekday: Dict[int, List[Tuple[int, int, PricingRule]]] = {}
+        for rule in self.rules:
+            start, end = to_interval(rule.start_time, rule.end_time)
+            for day in rule.days:
+                self._by_weekday.setdefault(day, []).append((start, end, rule))
+        for intervals in self._by_weekday.values():
+            intervals.sort(key=lambda item: (item[0], item[1]))
+
+    def rules_for_day(self, day: date) -> List[PricingRule]:
+        """Rules that apply on a date, ordered by start time"""
+        return [rule for _, _, rule in self._by_weekday.get(day.weekday(), [])]
+
+    def quote(self, day: date, start_time: time, end_time: time) -> Optional[PriceQuote]:
+        """
+        Price for [start_time, end_time) on a date.
+
+        A range may straddle several adjacent rules; each part is charged at
+        its own rate. Returns None if any part of the range is not priced.
+        """
+        cursor, end = to_minutes(start_time), to_minutes(end_time)
+        if end <= cursor:
+            return None
+
+        total_price = 0.0
+        segments = []
+        for rule_start, rule_end, rule in self._by_weekday.get(day.weekday(), []):
+            if rule_end <= cursor:
+                continue
+            if rule_start > cursor:
+                break
+            segment_end = min(rule_end, end)
+            hours = (segment_end - cursor) / 60
+            total_price += hours * rule.price_per_hour
+            segments.append({
+                "pricing_id": rule.id,
+                "hours": hours,
+                "price_per_hour": rule.price_per_hour,
+                "label": rule.label
+            })
+            cursor = segment_end
+            if cursor >= end:
+                break
+
+        if cursor < end:
+            return None
+
+        total_hours = (end - to_minutes(start_time)) / 60
+        return PriceQuote(total_hours=total_hours, total_price=total_price, segments=tuple(segments))
+
+
+_cache: Dict[int, Tuple[float, PricingIndex]] = {}
+_lock = threading.Lock()
+
+
+def _cached_index(court_id: int, now: float) -> Optional[PricingIndex]:
+    with _lock:
+        entry = _cache.get(court_id)
+    if entry and now - entry[0] < CACHE_TTL_SECONDS:
+        return entry[1]
+    return None
+
+
+def _store_index(court_id: int, now: float, rows: Sequence[CourtPricing]) -> PricingIndex:
+    index = PricingIndex([
+        PricingRule(
+            id=p.id,
+            days=tuple(p.days or ()),
+            start_time=p.start_time,
+            end_time=p.end_time,
+            price_per_hour=p.price_per_hour,
+            label=p.label
+        )
+        for p in rows
+    ])
+    with _lock:
+        _cache[court_id] = (now, index)
+    return index
+
+
+def get_index(db: Session, court_id: int, *, fresh: bool = False) -> PricingIndex:
+    """
+    Cached pricing index for a court, loading all its rules on a miss.
+
+    fresh=True always reloads the rules (and refreshes the cache); use it
+    where the price is written, not just shown.
+    """
+    now = clock.monotonic()
+    index = None if fresh else _cached_index(court_id, now)
+    if index is not None:
+        return index
+
+    return _store_index(court_id, now, pricing_repo.get_by_court(db, court_id))
+
+
+def _store_indexes(court_ids: Sequence[int], now: float, rows: Sequence[CourtPricing]) -> Dict[int, PricingIndex]:
+    rows_by_court: Dict[int, List[CourtPricing]] = {court_id: [] for court_id in court_ids}
+    for row in rows:
+        rows_by_court[row.court_id].append(row)
+    return {court_id: _store_index(court_id, now, court_rows) for court_id, court_rows in rows_by_court.items()}
+
+
+def get_indexes(db: Session, court_ids: Sequence[int]) -> Dict[int, PricingIndex]:
+    """Cached pricing indexes for several courts, loading all misses in one query"""
+    now = clock.monotonic()
+    indexes = {court_id: _cached_index(court_id, now) for court_id in court_ids}
+    missing = [court_id for court_id, index in indexes.items() if index is None]
+    if missing:
+        indexes.update(_store_indexes(missing, now, pricing_repo.get_by_courts(db, missing)))
+    return indexes
+
+
+async def get_index_async(db: AsyncSession, court_id: int) -> PricingIndex:
+    """get_index over an AsyncSession; shares the same cache"""
+    now = clock.monotonic()
+    index = _cached_index(court_id, now)
+    if index is not None:
+        return index
+
+    rows = await db.scalars(select(CourtPricing).where(CourtPricing.court_id == court_id))
+    return _store_index(court_id, now, rows.all())
+
+
+async def get_indexes_async(db: AsyncSession, court_ids: Sequence[int]) -> Dict[int, PricingIndex]:
+    """get_indexes over an AsyncSession; shares the same cache"""
+    now = clock.monotonic()
+    indexes = {court_id: _cached_index(court_id, now) for court_id in court_ids}
+    missing = [court_id for court_id, index in indexes.items() if index is None]
+    if missing:
+        rows = await db.scalars(select(CourtPricing).where(CourtPricing.court_id.in_(missing)))
+        indexes.update(_store_indexes(missing, now, rows.all()))
+    return indexes
+
+
+def invalidate(court_id: int) -> None:
+    """Drop a court's cached index after its pricing rules change"""
+    with _lock:
+        _cache.pop(court_id, None)
+
+
+def clear() -> None:
+    """Drop every cached index"""
+    with _lock:
+        _cache.clear()
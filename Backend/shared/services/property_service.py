@@ -3,8 +3,9 @@ Property service for business logic operations.
 """
 from sqlalchemy.orm import Session
 from shared.repositories import property_repo
-from shared.utils.response_utils import make_response
+from shared.utils.response_utils import make_result
 from shared.utils import OwnerContext
+from shared.utils.catalogue_signal import notify_catalogue_changed
 from shared.schemas.property import PropertyCreate, PropertyUpdate
 
 
@@ -16,14 +17,15 @@ def create_property(db: Session, *, current_owner: OwnerContext, data: PropertyC
             owner_profile_id=current_owner.owner_profile_id,
             **data.model_dump()
         )
-        return make_response(
+        notify_catalogue_changed(db, current_owner.owner_profile_id)
+        return make_result(
             True,
             "Property created successfully",
             data={"id": property.id, "name": property.name},
             status_code=201
         )
     except Exception as e:
-        return make_response(False, "Failed to create property", status_code=500, error=str(e))
+        return make_result(False, "Failed to create property", status_code=500, error=str(e))
 
 
 def get_owner_properties(db: Session, *, current_owner: OwnerContext):
@@ -42,7 +44,7 @@ def get_owner_properties(db: Session, *, current_owner: OwnerContext):
         for p in properties
     ]
 
-    return make_response(
+    return make_result(
         True,
         "Properties retrieved successfully",
         data=data
@@ -54,10 +56,10 @@ def get_property_details(db: Session, *, property_id: int, current_owner: OwnerC
     property = property_repo.get_with_courts(db, property_id)
 
     if not property:
-        return make_response(False, "Property not found", status_code=404)
+        return make_result(False, "Property not found", status_code=404)
 
     if property.owner_profile_id != current_owner.owner_profile_id:
-        return make_response(False, "Access denied", status_code=403)
+        return make_result(False, "Access denied", status_code=403)
 
     data = {
         "id": property.id,
@@ -84,7 +86,7 @@ def get_property_details(db: Session, *, property_id: int, current_owner: OwnerC
         ]
     }
 
-    return make_response(True, "Property retrieved successfully", data=data)
+    return make_result(True, "Property retrieved successfully", data=data)
 
 
 def update_property(db: Session, *, property_id: int, current_owner: OwnerContext, data: PropertyUpdate):
@@ -92,20 +94,21 @@ def update_property(db: Session, *, property_id: int, current_owner: OwnerContex
     property = property_repo.get_by_id(db, property_id)
 
     if not property:
-        return make_response(False, "Property not found", status_code=404)
+        return make_result(False, "Property not found", status_code=404)
 
     if property.owner_profile_id != current_owner.owner_profile_id:
-        return make_response(False, "Access denied", status_code=403)
+        return make_result(False, "Access denied", status_code=403)
 
     try:
         updated = property_repo.update(db, property, **data.model_dump(exclude_unset=True))
-        return make_response(
+        notify_catalogue_changed(db, current_owner.owner_profile_id)
+        return make_result(
             True,
             "Property updated successfully",
             data={"id": updated.id, "name": updated.name}
         )
     except Exception as e:
-        return make_response(False, "Failed to update property", status_code=500, error=str(e))
+        return make_result(False, "Failed to update property", status_code=500, error=str(e))
 
 
 def delete_property(db: Session, *, property_id: int, current_owner: OwnerContext):
@@ -113,13 +116,14 @@ def delete_property(db: Session, *, property_id: int, current_owner: OwnerContex
     property = property_repo.get_by_id(db, property_id)
 
     if not property:
-        return make_response(False, "Property not found", status_code=404)
+        return make_result(False, "Property not found", status_code=404)
 
     if property.owner_profile_id != current_owner.owner_profile_id:
-        return make_response(False, "Access denied", status_code=403)
+        return make_result(False, "Access denied", status_code=403)
 
     try:
         property_repo.delete(db, property)
-        return make_response(True, "Property deleted successfully")
+        notify_catalogue_changed(db, current_owner.owner_profile_id)
+        return make_result(True, "Property deleted successfully")
     except Exception as e:
-        return make_response(False, "Failed to delete property", status_code=500, error=str(e))
+        return make_result(False, "Failed to delete property", status_code=500, error=str(e))
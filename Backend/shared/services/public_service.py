@@ -1,18 +1,28 @@
 """
 Public service for business logic operations accessible to all users.
 """
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_
-from shared.repositories import property_repo, court_repo, pricing_repo, availability_repo
-from shared.utils.response_utils import make_response
-from shared.models import Property, Court, CourtPricing, Booking, BookingStatus
-from datetime import date, time, datetime, timedelta
-from typing import Optional
-
-
-def search_properties(
-    db: Session,
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import and_, exists, func, or_, select
+from shared.repositories import property_repo, court_repo, pricing_repo, availability_repo, booking_repo, owner_repo
+from shared.services import availability_engine, pricing_resolver
+from shared.utils.response_utils import make_result
+from shared.utils.sport_taxonomy import is_known_sport, normalize_sport
+from shared.models import Property, Court, CourtPricing
+from collections import defaultdict
+from datetime import date, time
+from typing import Dict, Optional
+
+
+def _sport_condition(sport_type: str):
+    """Court filter for a sport: indexed sport_key for known sports, else a substring match"""
+    if is_known_sport(sport_type):
+        return Court.sport_key == normalize_sport(sport_type)
+    return Court.sport_type.ilike(f"%{sport_type}%")
+
+
+def _search_statements(
     *,
+    q: Optional[str] = None,
     city: Optional[str] = None,
     sport_type: Optional[str] = None,
     min_price: Optional[float] = None,
@@ -20,40 +30,94 @@ def search_properties(
     page: int = 1,
     limit: int = 20
 ):
-    """Search and filter properties"""
-    # Base query - only active properties
-    query = db.query(Property).filter(Property.is_active == True)
+    """
+    Ranked property search.
+
+    Returns (page statement, count statement). Page rows are (Property,
+    total matches), the total coming from a window function; the count
+    statement is only needed when the page is past the last match. Text
+    filters use the pg_trgm GIN indexes on name, city and sport_type, and
+    known sports match on the indexed court sport_key.
+    """
+    conditions = [Property.is_active == True]
+    rank_terms = []
+
+    if q:
+        conditions.append(or_(
+            Property.name.ilike(f"%{q}%"),
+            Property.name.bool_op("%")(q),
+            Property.city.ilike(f"%{q}%")
+        ))
+        rank_terms.append(func.similarity(Property.name, q))
 
-    # Apply filters
     if city:
-        query = query.filter(Property.city.ilike(f"%{city}%"))
+        conditions.append(Property.city.ilike(f"%{city}%"))
+        rank_terms.append(func.similarity(Property.city, city))
 
-    # If sport_type or price filters, need to join with courts and pricing
+    # Courts are matched with EXISTS, so no DISTINCT over joined rows is needed
     if sport_type or min_price is not None or max_price is not None:
-        query = query.join(Property.courts).filter(Court.is_active == True)
+        court_conditions = [Court.property_id == Property.id, Court.is_active == True]
 
         if sport_type:
-            query = query.filter(Court.sport_type.ilike(f"%{sport_type}%"))
+            court_conditions.append(_sport_condition(sport_type))
 
         if min_price is not None or max_price is not None:
-            query = query.join(Court.pricing)
+            pricing_conditions = [CourtPricing.court_id == Court.id]
             if min_price is not None:
-                query = query.filter(CourtPricing.price_per_hour >= min_price)
+                pricing_conditions.append(CourtPricing.price_per_hour >= min_price)
             if max_price is not None:
-                query = query.filter(CourtPricing.price_per_hour <= max_price)
+                pricing_conditions.append(CourtPricing.price_per_hour <= max_price)
+            court_conditions.append(exists().where(*pricing_conditions))
+
+        conditions.append(exists().where(*court_conditions))
+
+    order_by = [Property.id]
+    if rank_terms:
+        order_by.insert(0, sum(rank_terms[1:], rank_terms[0]).desc())
+
+    page_statement = (
+        select(Property, func.count().over().label("total"))
+        .where(*conditions)
+        .order_by(*order_by)
+        .offset((page - 1) * limit)
+        .limit(limit)
+    )
+    count_statement = select(func.count()).select_from(Property).where(*conditions)
+
+    return page_statement, count_statement
+
+
+def search_properties(
+    db: Session,
+    *,
+    q: Optional[str] = None,
+    city: Optional[str] = None,
+    sport_type: Optional[str] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    page: int = 1,
+    limit: int = 20
+):
+    """Search and filter properties, best matches first"""
+    page_statement, count_statement = _search_statements(
+        q=q, city=city, sport_type=sport_type, min_price=min_price, max_price=max_price, page=page, limit=limit
+    )
+
+    rows = db.execute(page_statement).all()
+    properties = [row[0] for row in rows]
 
-        # Distinct to avoid duplicates
-        query = query.distinct()
+    # Total comes with the page; only an empty page past the end needs a count
+    if rows:
+        total = rows[0].total
+    else:
+        total = db.scalar(count_statement) if page > 1 else 0
 
-    # Count total
-    total = query.count()
+    return make_result(True, "Properties retrieved successfully", data=_format_search_page(properties, total, page, limit))
 
-    # Pagination
-    offset = (page - 1) * limit
-    properties = query.offset(offset).limit(limit).all()
 
-    # Format response
-    data = {
+def _format_search_page(properties, total: int, page: int, limit: int) -> dict:
+    """One page of property search results"""
+    return {
         "items": [
             {
                 "id": p.id,
@@ -72,8 +136,6 @@ def search_properties(
         "pages": (total + limit - 1) // limit
     }
 
-    return make_response(True, "Properties retrieved successfully", data=data)
-
 
 def get_property_details(db: Session, *, property_id: int):
     """Get property details with courts and media"""
@@ -88,10 +150,14 @@ def get_property_details(db: Session, *, property_id: int):
     )
 
     if not property:
-        return make_response(False, "Property not found", status_code=404)
+        return make_result(False, "Property not found", status_code=404)
+
+    return make_result(True, "Property details retrieved successfully", data=_format_property_details(property))
+
 
-    # Format response
-    data = {
+def _format_property_details(property: Property) -> dict:
+    """Public view of a property with its active courts and media"""
+    return {
         "id": property.id,
         "name": property.name,
         "description": property.description,
@@ -136,7 +202,59 @@ def get_property_details(db: Session, *, property_id: int):
         ]
     }
 
-    return make_response(True, "Property details retrieved successfully", data=data)
+
+def get_owner_catalogue(db: Session, *, owner_profile_id: int):
+    """
+    Get an owner's profile, properties and public property details at once.
+
+    Loads everything the chatbot serves from its catalogue cache in a few
+    queries (courts and media are selectin-loaded for all properties).
+    property_details only covers active properties, matching get_property_details.
+    """
+    profile = owner_repo.get_by_id(db, owner_profile_id)
+    if not profile:
+        return make_result(False, "Owner profile not found", status_code=404)
+
+    properties = (
+        db.query(Property)
+        .options(
+            selectinload(Property.courts).selectinload(Court.media),
+            selectinload(Property.media)
+        )
+        .filter(Property.owner_profile_id == owner_profile_id)
+        .order_by(Property.created_at.desc())
+        .all()
+    )
+
+    return make_result(True, "Owner catalogue retrieved successfully", data=_format_owner_catalogue(profile, properties))
+
+
+def _format_owner_catalogue(profile, properties) -> dict:
+    """Owner profile, property list and details of the active properties"""
+    return {
+        "profile": {
+            "id": profile.id,
+            "business_name": profile.business_name,
+            "phone": profile.phone,
+            "address": profile.address,
+            "verified": profile.verified
+        },
+        "properties": [
+            {
+                "id": p.id,
+                "name": p.name,
+                "city": p.city,
+                "state": p.state,
+                "address": p.address,
+                "is_active": p.is_active
+            }
+            for p in properties
+        ],
+        "property_details": {
+            p.id: _format_property_details(p)
+            for p in properties if p.is_active
+        }
+    }
 
 
 def get_court_details(db: Session, *, court_id: int):
@@ -153,10 +271,14 @@ def get_court_details(db: Session, *, court_id: int):
     )
 
     if not court:
-        return make_response(False, "Court not found", status_code=404)
+        return make_result(False, "Court not found", status_code=404)
+
+    return make_result(True, "Court details retrieved successfully", data=_format_court_details(court))
 
-    # Format response
-    data = {
+
+def _format_court_details(court: Court) -> dict:
+    """Public view of a court with its property, pricing rules and media"""
+    return {
         "id": court.id,
         "name": court.name,
         "sport_type": court.sport_type,
@@ -193,36 +315,28 @@ def get_court_details(db: Session, *, court_id: int):
         ]
     }
 
-    return make_response(True, "Court details retrieved successfully", data=data)
-
 
 def get_court_pricing_for_date(db: Session, *, court_id: int, date_val: date):
     """Get pricing for a specific court and date"""
     court = court_repo.get_by_id(db, court_id)
 
     if not court or not court.is_active:
-        return make_response(False, "Court not found", status_code=404)
-
-    # Get day of week (0=Monday, 6=Sunday)
-    day_of_week = date_val.weekday()
+        return make_result(False, "Court not found", status_code=404)
 
-    # Get pricing rules for this day
-    pricing_rules = (
-        db.query(CourtPricing)
-        .filter(
-            CourtPricing.court_id == court_id,
-            CourtPricing.days.contains([day_of_week])
-        )
-        .order_by(CourtPricing.start_time)
-        .all()
-    )
+    # Get pricing rules for this day from the court's cached pricing index
+    pricing_rules = pricing_resolver.get_index(db, court_id).rules_for_day(date_val)
 
     if not pricing_rules:
-        return make_response(False, "No pricing available for this date", status_code=404)
+        return make_result(False, "No pricing available for this date", status_code=404)
 
-    data = {
+    return make_result(True, "Pricing retrieved successfully", data=_format_day_pricing(date_val, pricing_rules))
+
+
+def _format_day_pricing(date_val: date, pricing_rules) -> dict:
+    """Pricing rules that apply on a date"""
+    return {
         "date": date_val.isoformat(),
-        "day_of_week": day_of_week,
+        "day_of_week": date_val.weekday(),
         "pricing": [
             {
                 "start_time": p.start_time.isoformat(),
@@ -234,86 +348,193 @@ def get_court_pricing_for_date(db: Session, *, court_id: int, date_val: date):
         ]
     }
 
-    return make_response(True, "Pricing retrieved successfully", data=data)
-
 
-def get_available_slots(db: Session, *, court_id: int, date_val: date):
+def get_available_slots(db: Session, *, court_id: int, date_val: date, slot_minutes: int = 60):
     """Get available time slots for a court on a specific date"""
+    invalid = _validate_slot_request(slot_minutes)
+    if invalid:
+        return invalid
+
     court = court_repo.get_by_id(db, court_id)
 
     if not court or not court.is_active:
-        return make_response(False, "Court not found", status_code=404)
-
-    # Get day of week
-    day_of_week = date_val.weekday()
+        return make_result(False, "Court not found", status_code=404)
 
     # Get pricing rules for this day
-    pricing_rules = (
-        db.query(CourtPricing)
-        .filter(
-            CourtPricing.court_id == court_id,
-            CourtPricing.days.contains([day_of_week])
-        )
-        .order_by(CourtPricing.start_time)
-        .all()
-    )
+    pricing_rules = pricing_resolver.get_index(db, court_id).rules_for_day(date_val)
 
     if not pricing_rules:
-        return make_response(False, "Court not available on this date", status_code=404)
+        return make_result(False, "Court not available on this date", status_code=404)
 
-    # Get blocked slots
+    # Blocked slots and existing bookings are merged into busy intervals once
     blocked_slots = availability_repo.get_by_date(db, court_id, date_val)
+    bookings = booking_repo.get_active_by_court_range(db, court_id, date_val, date_val)
 
-    # Get existing bookings
-    bookings = (
-        db.query(Booking)
-        .filter(
-            Booking.court_id == court_id,
-            Booking.booking_date == date_val,
-            Booking.status.in_([BookingStatus.pending, BookingStatus.confirmed])
-        )
-        .all()
+    slots_by_day = availability_engine.compute_range_slots(
+        pricing_rules, blocked_slots, bookings, date_val, date_val, slot_minutes
     )
 
-    # Build available slots
-    available_slots = []
-
-    for pricing in pricing_rules:
-        # Generate hourly slots within pricing time range
-        current_time = datetime.combine(date_val, pricing.start_time)
-        end_datetime = datetime.combine(date_val, pricing.end_time)
-
-        while current_time < end_datetime:
-            slot_start = current_time.time()
-            slot_end = (current_time + timedelta(hours=1)).time()
-
-            # Check if slot is blocked
-            is_blocked = any(
-                not (slot_end <= block.start_time or slot_start >= block.end_time)
-                for block in blocked_slots
-            )
-
-            # Check if slot is booked
-            is_booked = any(
-                not (slot_end <= booking.start_time or slot_start >= booking.end_time)
-                for booking in bookings
-            )
-
-            if not is_blocked and not is_booked:
-                available_slots.append({
-                    "start_time": slot_start.isoformat(),
-                    "end_time": slot_end.isoformat(),
-                    "price_per_hour": pricing.price_per_hour,
-                    "label": pricing.label
-                })
-
-            current_time += timedelta(hours=1)
-
-    data = {
+    data = _format_day_slots(court, date_val, slot_minutes, slots_by_day)
+
+    return make_result(True, "Available slots retrieved successfully", data=data)
+
+
+MAX_RANGE_DAYS = 31
+
+
+def _validate_slot_request(slot_minutes: int, start_date: Optional[date] = None, end_date: Optional[date] = None):
+    """Error result for an invalid slot length or date range, or None"""
+    if slot_minutes not in availability_engine.SLOT_MINUTES_CHOICES:
+        return make_result(False, "Slot length must be 30, 60 or 90 minutes", status_code=400)
+
+    if start_date is not None and end_date is not None:
+        if end_date < start_date:
+            return make_result(False, "End date must not be before start date", status_code=400)
+
+        if (end_date - start_date).days + 1 > MAX_RANGE_DAYS:
+            return make_result(False, f"Date range cannot exceed {MAX_RANGE_DAYS} days", status_code=400)
+
+    return None
+
+
+def _format_day_slots(court: Court, date_val: date, slot_minutes: int, slots_by_day: dict) -> dict:
+    """Available slots of a court on one date"""
+    return {
         "date": date_val.isoformat(),
-        "court_id": court_id,
+        "court_id": court.id,
+        "court_name": court.name,
+        "slot_minutes": slot_minutes,
+        "available_slots": slots_by_day.get(date_val, [])
+    }
+
+
+def _format_range_slots(court: Court, start_date: date, end_date: date, slot_minutes: int, slots_by_day: dict) -> dict:
+    """Available slots of a court for every day in a date range"""
+    return {
+        "court_id": court.id,
         "court_name": court.name,
-        "available_slots": available_slots
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "slot_minutes": slot_minutes,
+        "days": [
+            {"date": day.isoformat(), "available_slots": slots}
+            for day, slots in slots_by_day.items()
+        ]
     }
 
-    return make_response(True, "Available slots retrieved successfully", data=data)
+
+def get_available_slots_range(
+    db: Session,
+    *,
+    court_id: int,
+    start_date: date,
+    end_date: date,
+    slot_minutes: int = 60
+):
+    """Get available time slots for a court for every day in a date range"""
+    invalid = _validate_slot_request(slot_minutes, start_date, end_date)
+    if invalid:
+        return invalid
+
+    court = court_repo.get_by_id(db, court_id)
+
+    if not court or not court.is_active:
+        return make_result(False, "Court not found", status_code=404)
+
+    # Pricing comes from the cached index; one query each for blocks and bookings
+    pricing_rules = pricing_resolver.get_index(db, court_id).rules
+    blocked_slots = availability_repo.get_by_date_range(db, court_id, start_date, end_date)
+    bookings = booking_repo.get_active_by_court_range(db, court_id, start_date, end_date)
+
+    slots_by_day = availability_engine.compute_range_slots(
+        pricing_rules, blocked_slots, bookings, start_date, end_date, slot_minutes
+    )
+
+    data = _format_range_slots(court, start_date, end_date, slot_minutes, slots_by_day)
+
+    return make_result(True, "Available slots retrieved successfully", data=data)
+
+
+def get_property_availability(
+    db: Session,
+    *,
+    property_id: int,
+    date_val: date,
+    sport_type: Optional[str] = None,
+    slot_minutes: int = 60
+):
+    """Get a free-slot summary for every active court of a property on a date"""
+    invalid = _validate_slot_request(slot_minutes)
+    if invalid:
+        return invalid
+
+    property = property_repo.get_by_id(db, property_id)
+
+    if not property or not property.is_active:
+        return make_result(False, "Property not found", status_code=404)
+
+    query = db.query(Court).filter(Court.property_id == property_id, Court.is_active == True)
+    if sport_type:
+        query = query.filter(_sport_condition(sport_type))
+    courts = query.order_by(Court.name).all()
+
+    # One query each for pricing (cache misses only), blocks and bookings of all courts
+    court_ids = [c.id for c in courts]
+    indexes, blocked_slots, bookings = {}, [], []
+    if court_ids:
+        indexes = pricing_resolver.get_indexes(db, court_ids)
+        blocked_slots = availability_repo.get_by_courts_date(db, court_ids, date_val)
+        bookings = booking_repo.get_active_by_courts_date(db, court_ids, date_val)
+
+    data = _format_property_availability(
+        property, courts, indexes, blocked_slots, bookings, date_val, sport_type, slot_minutes
+    )
+
+    return make_result(True, "Property availability retrieved successfully", data=data)
+
+
+def _format_property_availability(
+    property: Property,
+    courts,
+    indexes: Dict,
+    blocked_slots,
+    bookings,
+    date_val: date,
+    sport_type: Optional[str],
+    slot_minutes: int
+) -> dict:
+    """Per-court free windows of a property on one date"""
+    blocks_by_court, bookings_by_court = defaultdict(list), defaultdict(list)
+    for block in blocked_slots:
+        blocks_by_court[block.court_id].append(block)
+    for booking in bookings:
+        bookings_by_court[booking.court_id].append(booking)
+
+    summaries = []
+    for court in courts:
+        slots = availability_engine.compute_range_slots(
+            indexes[court.id].rules,
+            blocks_by_court[court.id],
+            bookings_by_court[court.id],
+            date_val,
+            date_val,
+            slot_minutes
+        ).get(date_val)
+        summaries.append({
+            "court_id": court.id,
+            "court_name": court.name,
+            "sport_type": court.sport_type,
+            # False when the court has no pricing (is closed) on this weekday
+            "open": slots is not None,
+            "free_slots": len(slots or []),
+            "free_windows": availability_engine.free_windows(slots or [])
+        })
+
+    return {
+        "property_id": property.id,
+        "property_name": property.name,
+        "date": date_val.isoformat(),
+        "sport_type": sport_type,
+        "slot_minutes": slot_minutes,
+        "courts": summaries
+    }
@@ -0,0 +1,107 @@
+"""
+Unit tests for the interval-based availability engine.
+
+Covers interval helpers, slot generation on a rule's grid around bookings
+and blocks, slots of rules that run to midnight, multi-day ranges and the
+collapse of slots into free windows.
+"""
+
+from datetime import date, time
+from types import SimpleNamespace
+
+from shared.services.availability_engine import (
+    compute_day_slots,
+    compute_range_slots,
+    free_windows,
+    merge_intervals,
+    subtract_intervals,
+    to_interval,
+)
+from shared.services.pricing_resolver import PricingIndex, PricingRule
+
+
+DAY = date(2026, 10, 19)
+
+
+def _rule(start, end, price=1000.0, days=None, rule_id=1, label=None):
+    return PricingRule(
+        id=rule_id,
+        days=tuple(days if days is not None else [DAY.weekday()]),
+        start_time=start,
+        end_time=end,
+        price_per_hour=price,
+        label=label,
+    )
+
+
+def _booking(start, end, day=DAY):
+    return SimpleNamespace(booking_date=day, start_time=start, end_time=end)
+
+
+def _block(start, end, day=DAY):
+    return SimpleNamespace(date=day, start_time=start, end_time=end)
+
+
+def _times(slots):
+    return [(s["start_time"][:5], s["end_time"][:5]) for s in slots]
+
+
+def test_to_interval_runs_to_midnight_when_end_not_after_start():
+    assert to_interval(time(18), time(0)) == (1080, 1440)
+    assert to_interval(time(9), time(10, 30)) == (540, 630)
+
+
+def test_merge_intervals_joins_overlapping_and_touching():
+    assert merge_intervals([(60, 120), (0, 30), (100, 150), (150, 180)]) == [(0, 30), (60, 180)]
+
+
+def test_subtract_intervals_returns_free_parts():
+    assert subtract_intervals((0, 300), [(60, 120), (200, 400)]) == [(0, 60), (120, 200)]
+
+
+def test_day_slots_skip_bookings_and_blocks():
+    rules = [_rule(time(10), time(14))]
+    result = compute_range_slots(
+        rules, [_block(time(13), time(14))], [_booking(time(11), time(12))], DAY, DAY
+    )
+    assert _times(result[DAY]) == [("10:00", "11:00"), ("12:00", "13:00")]
+
+
+def test_slots_stay_on_rule_grid_after_partial_booking():
+    rules = [_rule(time(10), time(12))]
+    result = compute_range_slots(rules, [], [_booking(time(10, 15), time(10, 45))], DAY, DAY, slot_minutes=30)
+    assert _times(result[DAY]) == [("11:00", "11:30"), ("11:30", "12:00")]
+
+
+def test_rule_running_to_midnight_has_no_slot_ending_at_midnight():
+    rules = [_rule(time(18), time(0))]
+    slots = compute_day_slots(rules, [], DAY, 60)
+    assert _times(slots)[-1] == ("22:00", "23:00")
+    assert all(s["end_time"] != "00:00:00" for s in slots)
+
+
+def test_every_midnight_rule_slot_can_be_quoted():
+    rules = [_rule(time(18), time(0))]
+    index = PricingIndex(rules)
+    for minutes in (30, 60, 90):
+        for slot in compute_day_slots(rules, [], DAY, minutes):
+            quote = index.quote(DAY, time.fromisoformat(slot["start_time"]), time.fromisoformat(slot["end_time"]))
+            assert quote is not None, slot
+
+
+def test_range_omits_unpriced_days_and_keeps_fully_booked_days():
+    next_day = date(2026, 10, 20)
+    rules = [_rule(time(10), time(11))]
+    result = compute_range_slots(rules, [], [_booking(time(10), time(11))], DAY, next_day)
+    assert result == {DAY: []}
+
+
+def test_free_windows_merge_consecutive_slots_with_price_range():
+    rules = [
+        _rule(time(16), time(18), price=1000.0, rule_id=1),
+        _rule(time(18), time(20), price=1500.0, rule_id=2),
+    ]
+    slots = compute_day_slots(rules, merge_intervals([(19 * 60, 20 * 60)]), DAY, 60)
+    assert free_windows(slots) == [
+        {"start_time": "16:00", "end_time": "19:00", "min_price_per_hour": 1000.0, "max_price_per_hour": 1500.0}
+    ]
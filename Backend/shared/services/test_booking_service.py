@@ -0,0 +1,97 @@
+"""
+Unit tests for booking status changes.
+
+The status checks and the daily stats delta must be worked out from a
+locked booking row, so concurrent cancels/confirms cannot both apply.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from shared.models import BookingStatus, PaymentStatus
+from shared.services import booking_service
+from shared.utils import OwnerContext
+
+
+OWNER = OwnerContext(user_id=7, owner_profile_id=3)
+
+
+def _booking(status, payment_status=PaymentStatus.pending):
+    return SimpleNamespace(
+        id=1,
+        customer_id=5,
+        status=status,
+        payment_status=payment_status,
+        court=SimpleNamespace(property=SimpleNamespace(owner_profile_id=OWNER.owner_profile_id)),
+    )
+
+
+@pytest.fixture
+def repo(monkeypatch):
+    """Record how bookings are loaded and which status updates are applied."""
+    calls = SimpleNamespace(loads=[], updates=[], booking=None)
+
+    def get_with_details(db, booking_id, *, for_update=False):
+        calls.loads.append(for_update)
+        return calls.booking
+
+    def update_status(db, booking, status):
+        calls.updates.append(status)
+        booking.status = status
+        return booking
+
+    def update_payment_status(db, booking, payment_status):
+        calls.updates.append(payment_status)
+        booking.payment_status = payment_status
+        return booking
+
+    monkeypatch.setattr(booking_service.booking_repo, "get_with_details", get_with_details)
+    monkeypatch.setattr(booking_service.booking_repo, "update_status", update_status)
+    monkeypatch.setattr(booking_service.booking_repo, "update_payment_status", update_payment_status)
+    return calls
+
+
+@pytest.mark.parametrize(
+    "change, status",
+    [
+        (lambda: booking_service.cancel_booking(None, booking_id=1, user_id=5), BookingStatus.cancelled),
+        (lambda: booking_service.confirm_booking(None, booking_id=1, current_owner=OWNER), BookingStatus.confirmed),
+        (lambda: booking_service.complete_booking(None, booking_id=1, current_owner=OWNER), BookingStatus.completed),
+    ],
+)
+def test_status_changes_lock_the_booking(repo, change, status):
+    repo.booking = _booking(BookingStatus.pending)
+
+    result = change()
+
+    assert result.success
+    assert repo.loads == [True]
+    assert repo.updates == [status]
+
+
+def test_cancel_refunds_paid_booking(repo):
+    repo.booking = _booking(BookingStatus.confirmed, PaymentStatus.paid)
+
+    assert booking_service.cancel_booking(None, booking_id=1, user_id=5).success
+    assert repo.updates == [BookingStatus.cancelled, PaymentStatus.refunded]
+
+
+def test_second_cancel_sees_committed_status_and_changes_nothing(repo):
+    repo.booking = _booking(BookingStatus.pending)
+    assert booking_service.cancel_booking(None, booking_id=1, user_id=5).success
+
+    result = booking_service.cancel_booking(None, booking_id=1, user_id=5)
+
+    assert not result.success
+    assert result.status_code == 400
+    assert repo.updates == [BookingStatus.cancelled]
+
+
+def test_confirm_after_cancel_is_rejected(repo):
+    repo.booking = _booking(BookingStatus.cancelled)
+
+    result = booking_service.confirm_booking(None, booking_id=1, current_owner=OWNER)
+
+    assert result.status_code == 400
+    assert repo.updates == []
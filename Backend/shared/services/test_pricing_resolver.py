@@ -0,0 +1,108 @@
+"""
+Unit tests for the per-court pricing resolver.
+
+Covers quotes inside one rule and straddling adjacent rules, unpriced
+ranges, and the per-court index cache.
+"""
+
+from datetime import date, time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from shared.services import pricing_resolver
+from shared.services.pricing_resolver import PricingIndex, PricingRule
+
+
+DAY = date(2026, 10, 19)
+
+
+def _rule(start, end, price, rule_id, days=None, label=None):
+    return PricingRule(
+        id=rule_id,
+        days=tuple(days if days is not None else [DAY.weekday()]),
+        start_time=start,
+        end_time=end,
+        price_per_hour=price,
+        label=label,
+    )
+
+
+@pytest.fixture
+def index():
+    return PricingIndex([
+        _rule(time(18), time(0), 1500.0, rule_id=2, label="Peak"),
+        _rule(time(8), time(18), 1000.0, rule_id=1, label="Day"),
+    ])
+
+
+def test_quote_within_one_rule(index):
+    quote = index.quote(DAY, time(9), time(10, 30))
+    assert quote.total_hours == 1.5
+    assert quote.total_price == 1500.0
+    assert [s["pricing_id"] for s in quote.segments] == [1]
+
+
+def test_quote_straddling_two_rules_charges_each_part(index):
+    quote = index.quote(DAY, time(17), time(19))
+    assert quote.total_hours == 2
+    assert quote.total_price == 2500.0
+    assert quote.price_per_hour == 1250.0
+    assert [(s["pricing_id"], s["hours"]) for s in quote.segments] == [(1, 1.0), (2, 1.0)]
+
+
+def test_quote_inside_rule_running_to_midnight(index):
+    quote = index.quote(DAY, time(22), time(23, 30))
+    assert quote.total_price == 2250.0
+
+
+def test_quote_rejects_unpriced_and_inverted_ranges(index):
+    assert index.quote(DAY, time(7), time(9)) is None
+    assert index.quote(DAY, time(23), time(0)) is None
+    assert index.quote(DAY, time(12), time(11)) is None
+    assert index.quote(date(2026, 10, 20), time(9), time(10)) is None
+
+
+def test_quote_rejects_gap_between_rules():
+    index = PricingIndex([
+        _rule(time(8), time(12), 1000.0, rule_id=1),
+        _rule(time(13), time(18), 1000.0, rule_id=2),
+    ])
+    assert index.quote(DAY, time(11), time(14)) is None
+
+
+def test_rules_for_day_ordered_by_start(index):
+    assert [r.id for r in index.rules_for_day(DAY)] == [1, 2]
+
+
+def test_get_index_is_cached_until_invalidated():
+    pricing_resolver.clear()
+    row = SimpleNamespace(
+        id=1, court_id=7, days=[DAY.weekday()], start_time=time(8), end_time=time(18),
+        price_per_hour=1000.0, label=None
+    )
+    with patch.object(pricing_resolver.pricing_repo, "get_by_court", return_value=[row]) as get_by_court:
+        pricing_resolver.get_index(None, 7)
+        pricing_resolver.get_index(None, 7)
+        assert get_by_court.call_count == 1
+
+        pricing_resolver.invalidate(7)
+        pricing_resolver.get_index(None, 7)
+        assert get_by_court.call_count == 2
+    pricing_resolver.clear()
+
+
+def test_get_index_fresh_reloads_rules_and_refreshes_cache():
+    pricing_resolver.clear()
+    old = SimpleNamespace(
+        id=1, court_id=7, days=[DAY.weekday()], start_time=time(8), end_time=time(18),
+        price_per_hour=1000.0, label=None
+    )
+    new = SimpleNamespace(**{**vars(old), "price_per_hour": 1200.0})
+    with patch.object(pricing_resolver.pricing_repo, "get_by_court", side_effect=[[old], [new]]):
+        pricing_resolver.get_index(None, 7)
+        fresh = pricing_resolver.get_index(None, 7, fresh=True)
+        assert fresh.quote(DAY, time(9), time(10)).total_price == 1200.0
+        assert pricing_resolver.get_index(None, 7) is fresh
+    pricing_resolver.clear()
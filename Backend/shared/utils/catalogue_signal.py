@@ -0,0 +1,35 @@
+"""
+Change signal for an owner's catalogue (profile, properties, courts, media)
+and pricing rules.
+
+Write services call notify_catalogue_changed after a successful change; it
+sends a PostgreSQL NOTIFY on CATALOGUE_CHANNEL with the owner profile id as
+payload. The chatbot listens on the channel and drops that owner's cached
+catalogue and its cached pricing indexes.
+"""
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+CATALOGUE_CHANNEL = "owner_catalogue_changed"
+
+
+def notify_catalogue_changed(db: Session, owner_profile_id: int) -> None:
+    """
+    Notify listeners that an owner's catalogue changed.
+
+    Sent in its own transaction after the write was committed. Failures are
+    logged and ignored: listeners also expire their caches by TTL.
+    """
+    try:
+        db.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": CATALOGUE_CHANNEL, "payload": str(owner_profile_id)}
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"Catalogue change signal failed for owner_profile_id={owner_profile_id}: {e}")
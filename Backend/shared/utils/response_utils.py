@@ -1,9 +1,114 @@
 """
 Shared response utility for consistent API responses across all services.
+
+Services return a ServiceResult (see make_result) so in-process callers such
+as the chatbot tools can read success/data directly. HTTP routers turn the
+result into a response at the edge with to_response().
 """
-from fastapi.responses import JSONResponse
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Optional, Union
+
+import orjson
 from fastapi.encoders import jsonable_encoder
-from typing import Any, Optional
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+@dataclass
+class ServiceResult:
+    """Structured outcome of a service call, independent of HTTP."""
+    success: bool
+    message: str
+    data: Any = None
+    next_action: Optional[str] = None
+    status_code: int = 200
+    error: Optional[str] = None
+
+    def to_payload(self) -> dict:
+        """Build the standard response envelope, omitting unset fields."""
+        payload = {"success": self.success, "message": self.message}
+        if self.data is not None:
+            payload["data"] = self.data
+        if self.next_action is not None:
+            payload["next_action"] = self.next_action
+        if self.error is not None:
+            payload["error"] = self.error
+        return payload
+
+    def to_response(self) -> "ORJSONServiceResponse":
+        """Serialize the envelope into an HTTP response."""
+        return ORJSONServiceResponse(status_code=self.status_code, content=self.to_payload())
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback encoder for types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return jsonable_encoder(obj)
+
+
+class ORJSONServiceResponse(Response):
+    """
+    JSON response rendered with orjson.
+
+    Encodes dates, datetimes, times, UUIDs, enums and dataclasses natively and
+    falls back to jsonable_encoder only for other types, skipping the full
+    jsonable_encoder tree walk that JSONResponse needed.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+
+
+def make_result(
+    success: bool,
+    message: str,
+    data: Any = None,
+    next_action: Optional[str] = None,
+    *,
+    status_code: int = 200,
+    error: Optional[str] = None,
+) -> ServiceResult:
+    """
+    Unified service result with optional next_action and optional error (for debugging).
+    Takes the same arguments as make_response but does not serialize anything.
+
+    Args:
+        success: Boolean indicating operation success
+        message: Human-readable message
+        data: Optional data payload
+        next_action: Optional next action hint for client
+        status_code: HTTP status code the router should use (keyword-only)
+        error: Optional error details for debugging (keyword-only)
+
+    Returns:
+        ServiceResult
+    """
+    return ServiceResult(
+        success=success,
+        message=message,
+        data=data,
+        next_action=next_action,
+        status_code=status_code,
+        error=error,
+    )
+
+
+def to_response(result: Union[ServiceResult, Response]) -> Response:
+    """Convert a service result to an HTTP response; responses pass through unchanged."""
+    if isinstance(result, ServiceResult):
+        return result.to_response()
+    return result
 
 
 def make_response(
@@ -18,7 +123,7 @@ def make_response(
     """
     Unified response with optional next_action and optional error (for debugging).
     Note: status_code and error are keyword-only to prevent positional mistakes.
-    
+
     Args:
         success: Boolean indicating operation success
         message: Human-readable message
@@ -26,15 +131,15 @@ def make_response(
         next_action: Optional next action hint for client
         status_code: HTTP status code (keyword-only)
         error: Optional error details for debugging (keyword-only)
-        
+
     Returns:
-        JSONResponse with standardized format
+        JSON response with standardized format
     """
-    payload = {"success": success, "message": message}
-    if data is not None:
-        payload["data"] = data
-    if next_action is not None:
-        payload["next_action"] = next_action
-    if error is not None:
-        payload["error"] = error
-    return JSONResponse(status_code=status_code, content=jsonable_encoder(payload))
+    return make_result(
+        success,
+        message,
+        data,
+        next_action,
+        status_code=status_code,
+        error=error,
+    ).to_response()
@@ -0,0 +1,99 @@
+"""
+Normalized sport taxonomy.
+
+Owners type court sport types freely ("Futsal", "5-a-side", "Table Tennis",
+"ping pong"). Courts also store a sport_key from normalize_sport, so search
+matches a sport with an indexed equality instead of a substring scan, and
+spelling variants of the same sport are found together.
+"""
+import re
+from typing import Dict, List, Optional
+
+# Canonical sport key -> spellings owners and customers use for it
+SPORTS: Dict[str, tuple] = {
+    "futsal": ("futsal", "indoor football", "indoor soccer", "5 a side", "five a side", "6 a side", "six a side"),
+    "football": ("football", "soccer"),
+    "cricket": ("cricket", "indoor cricket", "box cricket", "net cricket"),
+    "padel": ("padel", "paddle", "padel tennis"),
+    "tennis": ("tennis", "lawn tennis"),
+    "table_tennis": ("table tennis", "ping pong", "tt"),
+    "badminton": ("badminton",),
+    "squash": ("squash",),
+    "basketball": ("basketball",),
+    "volleyball": ("volleyball",),
+    "pickleball": ("pickleball",),
+}
+
+
+# Words owners add around a sport name ("Futsal Court", "Cricket Nets");
+# dropped from sport types that do not name a known sport
+FILLER_WORDS = frozenset({
+    "arena", "court", "courts", "field", "fields", "ground", "grounds", "hall",
+    "indoor", "net", "nets", "outdoor", "pitch", "pitches",
+})
+
+# Longest alias in words, so "table tennis" wins over "tennis"
+_MAX_ALIAS_WORDS = max(len(alias.split()) for aliases in SPORTS.values() for alias in aliases)
+
+
+def _compact(value: str) -> str:
+    """Lowercase letters and digits only ("5-a-side" -> "5aside")"""
+    return re.sub(r"[^a-z0-9]", "", value.lower())
+
+
+_ALIASES: Dict[str, str] = {
+    _compact(alias): key
+    for key, aliases in SPORTS.items()
+    for alias in aliases + (key,)
+}
+
+
+def _find_alias(words: List[str]) -> Optional[str]:
+    """
+    Sport key of the known alias found among the words, if any.
+
+    Runs of consecutive words are compacted and looked up, preferring the
+    run with the most words and then the most letters.
+    """
+    best = None
+    for size in range(1, _MAX_ALIAS_WORDS + 1):
+        for start in range(len(words) - size + 1):
+            compact = "".join(words[start:start + size])
+            if compact in _ALIASES and (best is None or (size, len(compact)) > best[0]):
+                best = ((size, len(compact)), _ALIASES[compact])
+    return best[1] if best else None
+
+
+def normalize_sport(value: Optional[str]) -> Optional[str]:
+    """
+    Sport key for a free-text sport type.
+
+    A known spelling anywhere in the text maps to its canonical key, so
+    "Futsal Court" and "Indoor Futsal" match "futsal". Unknown sports keep
+    their compacted spelling without filler words, so equal spellings still
+    match.
+
+    Example:
+        >>> normalize_sport("Ping-Pong")
+        'table_tennis'
+        >>> normalize_sport("Cricket Nets")
+        'cricket'
+        >>> normalize_sport("Archery Range")
+        'archeryrange'
+    """
+    if not value:
+        return None
+    compact = _compact(value)
+    if compact in _ALIASES:
+        return _ALIASES[compact]
+
+    words = re.findall(r"[a-z0-9]+", value.lower())
+    key = _find_alias(words)
+    if key:
+        return key
+    return "".join(word for word in words if word not in FILLER_WORDS) or compact or None
+
+
+def is_known_sport(value: Optional[str]) -> bool:
+    """Whether a free-text sport type maps to a sport in the taxonomy"""
+    return normalize_sport(value) in SPORTS
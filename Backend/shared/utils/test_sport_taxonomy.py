@@ -0,0 +1,57 @@
+"""
+Unit tests for sport type normalization.
+
+Court sport types are free text, often with extra words around the sport.
+Search filters known sports on sport_key only, so every spelling of a known
+sport must map to its key.
+"""
+
+import pytest
+
+from shared.utils.sport_taxonomy import is_known_sport, normalize_sport
+
+
+@pytest.mark.parametrize(
+    "sport_type, key",
+    [
+        ("Futsal", "futsal"),
+        ("Futsal Court", "futsal"),
+        ("Indoor Futsal", "futsal"),
+        ("futsal courts (indoor)", "futsal"),
+        ("5-a-side", "futsal"),
+        ("5-a-side Football", "futsal"),
+        ("Indoor Football Ground", "futsal"),
+        ("Football", "football"),
+        ("Cricket Nets", "cricket"),
+        ("Box Cricket Arena", "cricket"),
+        ("Table Tennis", "table_tennis"),
+        ("Table Tennis Hall", "table_tennis"),
+        ("PingPong table", "table_tennis"),
+        ("Lawn Tennis Court", "tennis"),
+        ("Padel Tennis", "padel"),
+        ("Squash Courts", "squash"),
+    ],
+)
+def test_known_sport_inside_multi_word_sport_type(sport_type, key):
+    assert normalize_sport(sport_type) == key
+    assert is_known_sport(sport_type)
+
+
+def test_tennis_and_table_tennis_stay_apart():
+    assert normalize_sport("Tennis Court") == "tennis"
+    assert normalize_sport("Table Tennis Court") == "table_tennis"
+
+
+def test_unknown_sport_drops_filler_words():
+    assert normalize_sport("Archery") == "archery"
+    assert normalize_sport("Archery Range") == "archeryrange"
+    assert normalize_sport("Indoor Archery Court") == "archery"
+    assert not is_known_sport("Archery Court")
+
+
+def test_empty_and_filler_only_values():
+    assert normalize_sport(None) is None
+    assert normalize_sport("") is None
+    assert normalize_sport("--") is None
+    assert normalize_sport("Court") == "court"
+
@@ -0,0 +1,105 @@
+"""
+Unit tests for the shared TTL + LRU map.
+"""
+
+import pytest
+
+from shared.utils import ttl_cache
+from shared.utils.ttl_cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for the cache module."""
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+    cache.set("a", 1)
+
+    clock[0] += 60
+    assert cache.get("a") == 1
+
+    clock[0] += 1
+    assert cache.get("a") is None
+
+
+def test_ttl_override_and_no_ttl(clock):
+    cache = TTLCache(max_entries=10, ttl_seconds=300)
+    cache.set("a", 1)
+    clock[0] += 31
+
+    assert cache.get("a", ttl_seconds=30) is None
+    assert cache.get("a") == 1
+
+    forever = TTLCache(max_entries=10)
+    forever.set("a", 1)
+    clock[0] += 10 ** 6
+    assert forever.get("a") == 1
+
+
+def test_least_recently_used_is_evicted():
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_peek_does_not_refresh_recency_or_count():
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert cache.peek("a") == 1
+    cache.set("c", 3)
+
+    assert cache.peek("a") is None
+    assert cache.stats()["hits"] == cache.stats()["misses"] == 0
+
+
+def test_zero_entries_disables_the_cache():
+    cache = TTLCache(max_entries=0, ttl_seconds=60)
+    cache.set("a", 1)
+
+    assert not cache.enabled
+    assert cache.get("a") is None
+    assert not TTLCache(max_entries=10, ttl_seconds=0).enabled
+
+
+def test_discard_where_pop_and_clear():
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+    for key in [(1, "a"), (1, "b"), (2, "a")]:
+        cache.set(key, key)
+
+    cache.discard_where(lambda key: key[0] == 1)
+    assert len(cache) == 1
+    assert cache.peek((2, "a")) == (2, "a")
+
+    cache.pop((2, "a"))
+    cache.pop("missing")
+    assert len(cache) == 0
+
+    cache.set("a", 1)
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_stats_report_hit_rate():
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+    assert cache.stats()["hit_rate"] == 0.0
+
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+
+    assert cache.stats() == {"entries": 1, "hits": 2, "misses": 1, "hit_rate": 2 / 3}
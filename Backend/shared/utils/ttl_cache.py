@@ -0,0 +1,98 @@
+"""
+TTL + LRU map shared by the in-process caches of both apps.
+
+Entries expire after ttl_seconds (None keeps them until evicted) and the
+least recently used entry is evicted beyond max_entries; max_entries 0
+disables the cache. Hit/miss counters feed the health endpoints. Access is
+locked, so the map can be used from FastAPI's threadpool as well as from
+the event loop. Callers that wrap it decide what a key is and when entries
+go stale; nothing here is shared between processes.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    Bounded map with per-entry expiry and LRU eviction.
+
+    Attributes:
+        max_entries: Entries kept; 0 disables the cache
+        ttl_seconds: Lifetime of an entry, None for no expiry
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and (self.ttl_seconds is None or self.ttl_seconds > 0)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, *, ttl_seconds: Optional[float] = None) -> Optional[V]:
+        """
+        Value of a live entry, or None.
+
+        ttl_seconds overrides the cache's TTL for this lookup, e.g. a shorter
+        one while change signals may be missed.
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (ttl is not None and time.monotonic() - entry[0] > ttl):
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def peek(self, key: Hashable) -> Optional[V]:
+        """Stored value without counting a lookup or refreshing its recency."""
+        entry = self._entries.get(key)
+        return entry[1] if entry is not None else None
+
+    def set(self, key: Hashable, value: V) -> None:
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key matches, e.g. all entries of one owner."""
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count and hit/miss counters for the health endpoints."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }